@@ -37,7 +37,9 @@
 
 from   __future__ import annotations
 import typing
-import inspect
+import os
+import sys
+import types
 
 # =------------------------------= #
 
@@ -67,6 +69,10 @@ __version__      = "0.1.1"
 NL     = '\n'
 DQUOTE = '"'
 
+# Sentinel returned by a test function instead of raising a TestPassedException, i.e. by the rewritten tests.
+# It is a unique object, so no value returned by a test body can be mistaken for it.
+TEST_PASSED = object()
+
 # =----------------------------------= #
 
 
@@ -90,22 +96,32 @@ class TestTimeoutException(Exception):
     "Raised when a test is timeout."
     pass
 
+def build_message(error_msg: typing.Union[str, typing.Callable[[], str]], *args: typing.Union[str, typing.Callable[[], str]]) -> str:
+    """Build a failure message from its parts, calling the lazily formatted ones (i.e. added by the check/ensure rewriting)."""
+    return "".join(e() if callable(e) else e for e in (error_msg,) + args)
+
+def get_caller_frame() -> types.FrameType:
+    """Get the first frame outside of this file, walking up the stack frame by frame instead of materializing it with its source lines."""
+    frame = sys._getframe(1)
+    while frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    return frame
+
 def ok() -> TestPassedException:
     """Validate a test."""
     raise TestPassedException
 
 def ko(error_msg: str = "", *args: str) -> TestFailedException:
     """Unvalidate a test."""
-    stack = inspect.stack()[1]
-    raise TestFailedException(f"""{stack.filename}:{stack.function[10:]}:{stack.lineno}: {"".join([error_msg] + list(args))}""")
+    frame = get_caller_frame()
+    raise TestFailedException(f"""{frame.f_code.co_filename}:{frame.f_code.co_name[10:]}:{frame.f_lineno}: {build_message(error_msg, *args)}""")
 
 def check(boolean: bool, error_msg: str = "", *args: str, ensure: bool = False) -> typing.Optional[TestFailedException]:
-    """Unvalidate a test if the given <boolean> value is False, but otherwise does nothing."""
+    """Unvalidate a test if the given <boolean> value is False, but otherwise does nothing.
+       The error message parts can be callables returning a string, only called if the test fails."""
     if not boolean:
-        stack = next(
-            (e for e in inspect.stack()[1:] if e.function not in ["ensure"])
-        )
-        raise TestFailedException(f"""{stack.filename}:{stack.function[10:]}:{stack.lineno}: {"".join([error_msg] + list(args))}""")
+        frame = get_caller_frame()
+        raise TestFailedException(f"""{frame.f_code.co_filename}:{frame.f_code.co_name[10:]}:{frame.f_lineno}: {build_message(error_msg, *args)}""")
     if ensure:
         ok()
 
@@ -117,10 +133,8 @@ def check_eq(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool = F
     """Unvalidate a test depending on the following boolean expression: <x> == <y>."""
     try:
         if not x == y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} == {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} == {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -136,10 +150,8 @@ def check_neq(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool =
     """Unvalidate a test depending on the following boolean expression: <x> != <y>."""
     try:
         if not x != y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} != {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} != {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -155,10 +167,8 @@ def check_lt(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool = F
     """Unvalidate a test depending on the following boolean expression: <x> < <y>."""
     try:
         if not x < y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} < {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} < {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -174,10 +184,8 @@ def check_le(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool = F
     """Unvalidate a test depending on the following boolean expression: <x> <= <y>."""
     try:
         if not x <= y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} <= {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} <= {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -193,10 +201,8 @@ def check_gt(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool = F
     """Unvalidate a test depending on the following boolean expression: <x> > <y>."""
     try:
         if not x > y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} > {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} > {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -212,10 +218,8 @@ def check_ge(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool = F
     """Unvalidate a test depending on the following boolean expression: <x> >= <y>."""
     try:
         if not x >= y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} >= {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} >= {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -231,10 +235,8 @@ def check_and(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool =
     """Unvalidate a test depending on the following boolean expression: <x> and <y>."""
     try:
         if not x and y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} and {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} and {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -250,10 +252,8 @@ def check_or(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool = F
     """Unvalidate a test depending on the following boolean expression: <x> or <y>."""
     try:
         if not x or y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} or {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} or {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -269,10 +269,8 @@ def check_band(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool =
     """Unvalidate a test depending on the following boolean expression: <x> & <y>."""
     try:
         if not x & y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} & {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} & {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -288,10 +286,8 @@ def check_bor(x: typing.Any, y: typing.Any, error_msg: str = "", ensure: bool =
     """Unvalidate a test depending on the following boolean expression: <x> | <y>."""
     try:
         if not x | y:
-            stack = next(
-                (e for e in inspect.stack() if e.filename.split('/')[-1].split('\\')[-1] != __file__.split('/')[-1].split('\\')[-1])
-            )
-            raise TestFailedException(stack.filename.split('/')[-1].split('\\')[-1] + f":{stack.lineno}: {error_msg}\n|    where {x} | {y}")
+            frame = get_caller_frame()
+            raise TestFailedException(os.path.basename(frame.f_code.co_filename) + f":{frame.f_lineno}: {error_msg}\n|    where {x} | {y}")
     except Exception as e:
         raise TestInvalidException(e)
     if ensure:
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+    asynchronous.py is the file containing the functions
+     driving the asynchronous tests on an event loop.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                          import annotations
+import typing
+import os
+import sys
+import io
+import inspect
+import asyncio
+import contextlib
+import contextvars
+import concurrent.futures
+from   pyquicktools.pyquicktest.assertions import TEST_PASSED, TestPassedException, TestFailedException, TestInvalidException, TestTimeoutException
+from   pyquicktools.pyquicktest.report     import TASK_RESULTS
+
+# =-------------------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Environment variable holding the number of asynchronous tests iterations running at once, inherited by the worker processes.
+CONCURRENCY_ENV = "PQT_CONCURRENCY"
+
+# Output of the current asyncio task, for the asynchronous tests running concurrently (see dispatch_async_tests).
+TASK_OUTPUT: contextvars.ContextVar[typing.Optional[io.StringIO]] = contextvars.ContextVar("TASK_OUTPUT", default=None)
+
+# =----------------------------------= #
+
+
+#=-------------------=#
+# Concurrency section #
+#=-------------------=#
+
+def set_concurrency(concurrency: int) -> None:
+    """Run the asynchronous tests of the following sessions concurrently on a single event loop, at most <concurrency> iterations at once,
+       1 meaning one test after the other, for the current process and its future worker processes."""
+    os.environ[CONCURRENCY_ENV] = str(concurrency)
+
+def get_concurrency() -> int:
+    """Get the number of asynchronous tests iterations running at once, 1 meaning one test after the other."""
+    try:
+        return max(int(os.environ.get(CONCURRENCY_ENV, 1)), 1)
+    except ValueError:
+        return 1
+
+def get_test_concurrency(test_func: typing.Callable[[object], object]) -> int:
+    """Get the number of iterations of a test running at once (see execnbr), only relevant for the asynchronous tests."""
+    return max(getattr(test_func, "test_concurrency", 1) or 1, 1)
+
+def is_async_test(test_func: typing.Callable[[object], object]) -> bool:
+    """Check if a test function is asynchronous, i.e. if calling it returns a coroutine to drive on an event loop."""
+    return inspect.iscoroutinefunction(test_func)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=------------------=#
+# Event loop section #
+#=------------------=#
+
+class AsyncRunner:
+    """Driver of the iterations of an asynchronous test on an event loop, used as a context manager around them.
+       Calling it runs a single iteration until its coroutine completes, the event loop being created on the first call and reused,
+       unless it is still running an abandoned iteration (see TimeoutThreadPool). The event loop is closed on exit."""
+
+    def __init__(self, func: typing.Callable[[], typing.Awaitable[typing.Any]]) -> None:
+        self.func = func
+        self.loop = None
+
+    def __call__(self) -> typing.Any:
+        if self.loop is None or self.loop.is_running():
+            self.loop = asyncio.new_event_loop()
+        return self.loop.run_until_complete(self.func())
+
+    def __enter__(self) -> AsyncRunner:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        if self.loop is not None and not self.loop.is_running():
+            self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            self.loop.close()
+
+async def run_iteration_async(
+        rewritten_func : typing.Callable[[], typing.Awaitable[typing.Any]],
+        test_func      : typing.Callable[[object], object],
+        timeout        : typing.Optional[float] = None
+    ) -> typing.Optional[Exception]:
+    """Run a single iteration of a rewritten asynchronous test function, returning the exception of the failure if any (see run_iteration).
+       If a <timeout> is given, the iteration is cancelled once it exceeds it."""
+    try:
+        if timeout is None:
+            result = await rewritten_func()
+        else:
+            try:
+                result = await asyncio.wait_for(rewritten_func(), timeout)
+            except asyncio.TimeoutError:
+                raise TestTimeoutException(f"Timeout after {timeout} seconds, the iteration has been cancelled.") from None
+        if result is TEST_PASSED:
+            return None
+        raise TestFailedException(f"Test function <{test_func.__name__}> didn't use a validator function.")
+    except TestPassedException:
+        return None
+    except (TestFailedException, TestInvalidException, TestTimeoutException) as e:
+        return e
+
+class TaskStdout(io.TextIOBase):
+    """Standard output writing to the output of the current asyncio task if it has one (see TASK_OUTPUT), or else to the real one.
+       It isn't an interactive terminal, so no progress line is drawn while the tests interleave."""
+
+    def __init__(self, stdout: typing.TextIO) -> None:
+        self.stdout = stdout
+
+    def write(self, text: str) -> int:
+        return (TASK_OUTPUT.get() or self.stdout).write(text)
+
+    def flush(self) -> None:
+        (TASK_OUTPUT.get() or self.stdout).flush()
+
+def dispatch_async_tests(
+        funcs       : typing.List[typing.Tuple[typing.Callable[[object], object], str]],
+        caller_file : str,
+        concurrency : int
+    ) -> typing.Dict[str, concurrent.futures.Future]:
+    """Run every given (asynchronous test function, indent) pairs concurrently on a single event loop, at most <concurrency> iterations at once.
+       As for the tests dispatched to worker processes, the output and the results of every test are buffered so they are printed and reported
+       in the hierarchical order, the returned futures indexed by test name being already done."""
+    from pyquicktools.pyquicktest.test import exec_test_async
+
+    # Running a test in its own task, with its own output and results.
+    async def run(func: typing.Callable[[object], object], indent: str, semaphore: asyncio.Semaphore) -> typing.Tuple[typing.List[str], str, typing.List[typing.Dict[str, typing.Any]]]:
+        (output, results) = (io.StringIO(), [])
+        TASK_OUTPUT.set(output)
+        TASK_RESULTS.set(results)
+        res = await exec_test_async(func, indent=indent, caller_file=caller_file, semaphore=semaphore)
+        return (res, output.getvalue(), results)
+
+    async def run_all() -> typing.List[typing.Any]:
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(run(func, indent, semaphore) for (func, indent) in funcs), return_exceptions=True)
+
+    with contextlib.redirect_stdout(TaskStdout(sys.stdout)):
+        outcomes = asyncio.run(run_all())
+
+    # Wrapping the outcomes into futures, the unexpected exceptions being raised when their test is printed.
+    futures = {}
+    for ((func, _), outcome) in zip(funcs, outcomes):
+        futures[func.__name__] = concurrent.futures.Future()
+        if isinstance(outcome, BaseException):
+            futures[func.__name__].set_exception(outcome)
+        else:
+            futures[func.__name__].set_result(outcome)
+    return futures
+
+# =-----------------------------------------------------------------------------------------------------------------= #
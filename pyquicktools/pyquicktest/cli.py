@@ -35,11 +35,20 @@
 # Import section #
 #=--------------=#
 
-from   __future__                    import annotations
-from   pyquicktools.utils            import add_group_subparser
-from   pyquicktools.pyquicktest.test import test_directory, test_file
+from   __future__                            import annotations
+from   pyquicktools.utils                    import add_group_subparser
+from   pyquicktools.pyquicktest.test         import test_directory, test_file, collect_only, merge_reports, set_maxfail
+from   pyquicktools.pyquicktest.report       import JSONLinesReporter, JUnitXMLReporter, DurationsReporter, add_reporter, remove_reporter
+from   pyquicktools.pyquicktest.store        import ResultStore, get_failed_ids
+from   pyquicktools.pyquicktest.selection    import TestSelection, select_expressions
+from   pyquicktools.pyquicktest.schedule     import make_shard
+from   pyquicktools.pyquicktest.impact       import enable_recording, get_changed_files, select_impacted
+from   pyquicktools.pyquicktest.watch        import watch
+from   pyquicktools.pyquicktest.server       import serve, request_server
+from   pyquicktools.pyquicktest.asynchronous import set_concurrency
 import typing
 import os
+import sys
 import argparse
 
 # =----------------------------------------------------= #
@@ -63,6 +72,16 @@ __version__      = "0.1.1"
 # =-------------------------------------------------= #
 
 
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Options rejected by the watch mode, as their selection depends on the state of the previous runs or of the repository, and their arguments names.
+WATCH_REJECTED = (("--last-failed", "last_failed"), ("--failed-first", "failed_first"), ("--changed", "changed"), ("--shard", "shard"))
+
+# =----------------------------------= #
+
+
 #=------------------------------------=#
 # CLI subparser setup function section #
 #=------------------------------------=#
@@ -79,6 +98,28 @@ def setup_parser(subparsers: argparse.Action) -> argparse.ArgumentParser:
     # Adding the new module test arguments
     test_parser.add_argument("-e", "--example", action = "store_true", default = None, help = "give examples and instructions to get started.")
     test_parser.add_argument("-p", "--path",    type = str,            default = '.' , help = "path of the file or directory to test")
+    test_parser.add_argument("-j", "--jobs",    type = int,            default = 1   , help = "number of worker processes running the tests (0 for one per CPU)")
+    test_parser.add_argument("-i", "--include", action = "append",     default = None, help = "glob pattern of the files to test in a directory (default: *.py, *.pyw)")
+    test_parser.add_argument("--exclude",       action = "append",     default = None, help = "glob pattern of the files or directories to skip in a directory")
+    test_parser.add_argument("-k", "--keyword", type = str,            default = None, help = "only run the tests whose name or groups match the given expression (e.g. \"parse and not (json or xml)\")")
+    test_parser.add_argument("-m", "--marker",  type = str,            default = None, help = "only run the tests whose markers (add_flag/add_attribute) match the given expression (e.g. \"slow and not db\")")
+    test_parser.add_argument("--collect-only",  action = "store_true", default = False, help = "only list the tests, without importing nor running them")
+    test_parser.add_argument("--jsonl",         type = str,            default = None, help = "stream the tests results as JSON Lines to a file (or a file descriptor number)")
+    test_parser.add_argument("--junit-xml",     type = str,            default = None, help = "stream the tests results as JUnit XML to a file (or a file descriptor number)")
+    test_parser.add_argument("--durations",     type = int,            default = 0   , help = "print the given number of slowest tests and slowest single iterations")
+    test_parser.add_argument("--last-failed", "--lf",  action = "store_true", default = False, help = "only run the tests that failed during their last run")
+    test_parser.add_argument("--failed-first", "--ff", action = "store_true", default = False, help = "run the tests that failed during their last run first")
+    test_parser.add_argument("--record-impact", action = "store_true", default = False, help = "record the project source files executed by every test")
+    test_parser.add_argument("--changed",       nargs = '*',           default = None, help = "only run the tests whose recorded files changed (default: git changes)")
+    test_parser.add_argument("--watch",         action = "store_true", default = False, help = "re-run the affected tests every time a python file changes")
+    test_parser.add_argument("--exitfirst", "-x",      action = "store_true", default = False, help = "stop the session on the first failed test, cancelling the running ones")
+    test_parser.add_argument("--maxfail",       type = int,            default = 0   , help = "stop the session after the given number of failed tests (default: never)")
+    test_parser.add_argument("--concurrency",   type = int,            default = 1   , help = "run up to the given number of asynchronous tests iterations at once on a single event loop")
+    test_parser.add_argument("--shard",         type = str,            default = None, help = "only run the shard INDEX/COUNT of the tests (e.g. 3/8), assigned by test id")
+    test_parser.add_argument("--shard-balance", action = "store_true", default = False, help = "assign the tests to the shards by their durations in the results store, which must be the same on every node")
+    test_parser.add_argument("--merge",         nargs = '+',           default = None, help = "merge the given JSON Lines reports (e.g. of every shard) into a single test session")
+    test_parser.add_argument("--server",        action = "store_true", default = False, help = "serve the test runs of this directory from forks of a process with preloaded dependencies")
+    test_parser.add_argument("--no-server",     action = "store_true", default = False, help = "run the tests in this process even if a test server is running")
 
     # Setting the new module test function to call
     test_parser.set_defaults(func=cli_test)
@@ -88,7 +129,29 @@ def setup_parser(subparsers: argparse.Action) -> argparse.ArgumentParser:
 
 def cli_test(**kwargs : typing.Dict[str, typing.List[str] | str | int | None]) -> None:
     """PyQuickTest CLI function.
-    : path                : The path of the test file or directory to test."""
+    : path                : The path of the test file or directory to test.
+    : jobs                : The number of worker processes running the tests.
+    : include             : The glob patterns of the files to test in a directory.
+    : exclude             : The glob patterns of the files or directories to skip in a directory.
+    : keyword             : Only run the tests whose name or groups match the given keyword expression.
+    : marker              : Only run the tests whose markers match the given marker expression.
+    : collect_only        : Only list the tests, without importing nor running them.
+    : jsonl               : The file name or file descriptor number the tests results are streamed to as JSON Lines.
+    : junit_xml           : The file name or file descriptor number the tests results are streamed to as JUnit XML.
+    : last_failed         : Only run the tests that failed during their last run.
+    : failed_first        : Run the tests that failed during their last run first.
+    : record_impact       : Record the project source files executed by every test.
+    : changed             : Only run the tests whose recorded source files are among the given changed files, or the git changes if none.
+    : watch               : Re-run the affected tests every time a python file changes, in a warm process.
+    : server              : Serve the test runs of the current directory from forks of a process with preloaded dependencies.
+    : no_server           : Run the tests in this process even if a test server is running.
+    : exitfirst           : Stop the session on the first failed test.
+    : maxfail             : Stop the session after the given number of failed tests.
+    : concurrency         : Run up to the given number of asynchronous tests iterations at once on a single event loop.
+    : durations           : Print the given number of slowest tests and slowest single iterations.
+    : shard               : Only run the given "index/count" shard of the tests.
+    : shard_balance       : Assign the tests to the shards by their stored durations instead of their ids.
+    : merge               : Merge the given JSON Lines reports into a single test session."""
 
     # If the -e or --example argument is provided, print examples and instructions to get started and exit the program.
     if kwargs["example"]:
@@ -296,7 +359,95 @@ def cli_test(**kwargs : typing.Dict[str, typing.List[str] | str | int | None]) -
 *========================================================================================*""")
         exit()
 
-    if os.path.isdir(kwargs["path"]):
-        test_directory(path=kwargs["path"])
-    else:
-        test_file(filename=kwargs["path"])
\ No newline at end of file
+    if kwargs["collect_only"]:
+        collect_only(path=kwargs["path"], include=kwargs["include"], exclude=kwargs["exclude"])
+        return
+
+    # Serving the test runs if requested.
+    if kwargs["server"]:
+        serve(path=kwargs["path"])
+        return
+
+    # Delegating the run to the test server of the current directory if one is running.
+    if not kwargs["no_server"] and not kwargs["watch"] and not kwargs["merge"] and (code := request_server(sys.argv[1:] + ["--no-server"])) is not None:
+        if code:
+            exit(code)
+        return
+
+    # Rejecting the selections the watch mode can't keep up to date from run to run.
+    if kwargs["watch"] and (rejected := [option for (option, key) in WATCH_REJECTED if kwargs[key] not in (None, False)]):
+        print(f"\033[91mThe watch mode can't be combined with {', '.join(rejected)}.\033[00m")
+        exit(2)
+
+    # Selecting the tests from the results of their last run if requested.
+    selection = None
+    if kwargs["last_failed"] or kwargs["failed_first"]:
+        failed = get_failed_ids()
+        if kwargs["last_failed"] and not failed:
+            print("\033[90mNo previously failed tests, running every tests.\033[00m")
+        selection = TestSelection(only=failed if kwargs["last_failed"] and failed else None, first=failed)
+
+    # Selecting the tests affected by the changed files if requested, among the previously selected ones.
+    if kwargs["changed"] is not None:
+        if (changed := get_changed_files(kwargs["changed"])) is None:
+            print("\033[91mUnable to retrieve the changed files from git, running every tests.\033[00m")
+        else:
+            impacted  = select_impacted(changed)
+            selection = selection.exclude(impacted.skip, impacted.skip_files) if selection else impacted
+
+    # Only running the tests matching the keyword and marker expressions if requested.
+    if kwargs["keyword"] or kwargs["marker"]:
+        try:
+            files = select_expressions(kwargs["path"], keyword=kwargs["keyword"], marker=kwargs["marker"], include=kwargs["include"], exclude=kwargs["exclude"])
+        except ValueError as e:
+            print(f"\033[91m{e}\033[00m")
+            exit(2)
+        selection = (selection if selection else TestSelection()).match(kwargs["keyword"], kwargs["marker"], files)
+
+    # Only running a shard of the tests if requested.
+    if kwargs["shard"]:
+        try:
+            shard = make_shard(kwargs["shard"], kwargs["path"], include=kwargs["include"], exclude=kwargs["exclude"], balanced=kwargs["shard_balance"])
+        except ValueError as e:
+            print(f"\033[91m{e}\033[00m")
+            exit(2)
+        selection       = selection if selection else TestSelection()
+        selection.shard = shard
+
+    # Recording the tests footprint if requested.
+    if kwargs["record_impact"]:
+        enable_recording()
+
+    # Stopping the session after some failed tests if requested.
+    if kwargs["exitfirst"] or kwargs["maxfail"]:
+        set_maxfail(1 if kwargs["exitfirst"] else kwargs["maxfail"])
+
+    # Running the asynchronous tests concurrently if requested.
+    if kwargs["concurrency"] > 1:
+        set_concurrency(kwargs["concurrency"])
+
+    # Adding the requested reporters, and the results store one.
+    reporters = [add_reporter(ResultStore())]
+    if kwargs["jsonl"]:
+        reporters.append(add_reporter(JSONLinesReporter(int(kwargs["jsonl"]) if kwargs["jsonl"].isdigit() else kwargs["jsonl"])))
+    if kwargs["junit_xml"]:
+        reporters.append(add_reporter(JUnitXMLReporter(int(kwargs["junit_xml"]) if kwargs["junit_xml"].isdigit() else kwargs["junit_xml"])))
+    if kwargs["durations"] > 0:
+        reporters.append(add_reporter(DurationsReporter(kwargs["durations"])))
+
+    try:
+        if kwargs["merge"]:
+            try:
+                merge_reports(kwargs["merge"])
+            except (OSError, ValueError) as e:
+                print(f"\033[91mUnable to merge the reports: {e}\033[00m")
+                exit(1)
+        elif kwargs["watch"]:
+            watch(path=kwargs["path"], jobs=kwargs["jobs"], include=kwargs["include"], exclude=kwargs["exclude"], keyword=kwargs["keyword"], marker=kwargs["marker"])
+        elif os.path.isdir(kwargs["path"]):
+            test_directory(path=kwargs["path"], jobs=kwargs["jobs"], include=kwargs["include"], exclude=kwargs["exclude"], selection=selection)
+        else:
+            test_file(filename=kwargs["path"], jobs=kwargs["jobs"], selection=selection)
+    finally:
+        for reporter in reporters:
+            remove_reporter(reporter)
\ No newline at end of file
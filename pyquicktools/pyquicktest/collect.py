@@ -0,0 +1,330 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+     collect.py is the file containing the functions
+     that discover test files and statically collect
+      their tests, without importing them and without
+        re-reading the unchanged files between runs.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                     import annotations
+import typing
+import os
+import re
+import ast
+import json
+import fnmatch
+from   pyquicktools.pyquicktest.utils import CACHE_DIR, get_cache_dir
+
+# =---------------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Name and format of the file indexing the statically collected tests of a tested directory.
+INDEX_FILE        = "index.json"
+INDEX_FORMAT      = 4
+
+# Default patterns of the files to discover.
+DEFAULT_INCLUDE   = ("*.py", "*.pyw")
+
+# Directories never walked through during the discovery, on top of the hidden ones.
+SKIPPED_DIRS      = ("__pycache__", "node_modules", "venv", "build", "dist")
+
+# Regex matching the decorators marking a function as a test, used for skipping the parsing of files without tests.
+TEST_DECORATOR    = re.compile(rb"^[ \t]*@(?:\w+\.)*(?:test|group|execnbr)\b", re.MULTILINE)
+
+# Names of the decorators marking a function as a test.
+TEST_DECORATORS   = ("test", "group", "execnbr")
+
+# Names of the decorators adding attributes to a function, i.e. the markers of a test.
+MARKER_DECORATORS = ("add_flag", "add_flags", "add_attribute", "add_attributes")
+
+# Type of a statically collected test.
+STATIC_TEST       = typing.Dict[str, typing.Any]
+
+# =----------------------------------= #
+
+
+#=------------------------------=#
+# Static test collection section #
+#=------------------------------=#
+
+def get_decorator_name(node: ast.expr) -> str:
+    """Get the name of a given decorator node, i.e. "group" for both <@group>, <@pqt.group> and <@group("G")>."""
+    node = node.func if isinstance(node, ast.Call) else node
+    return node.attr if isinstance(node, ast.Attribute) else node.id if isinstance(node, ast.Name) else ""
+
+def get_module_constants(tree: ast.Module) -> typing.Dict[str, typing.Any]:
+    """Get the module level constants of a parsed file, i.e. the names assigned to a literal value."""
+    constants = {}
+    for node in tree.body:
+        (targets, value) = (node.targets, node.value) if isinstance(node, ast.Assign) else ([node.target], node.value) if isinstance(node, ast.AnnAssign) else ([], None)
+        if len(targets) == 1 and isinstance(targets[0], ast.Name) and value is not None:
+            try:
+                constants[targets[0].id] = ast.literal_eval(value)
+            except (ValueError, TypeError, SyntaxError):
+                pass
+    return constants
+
+def eval_static(node: ast.expr, constants: typing.Dict[str, typing.Any]) -> typing.Any:
+    """Statically evaluate a given expression node if it is a literal or a module constant, otherwise returns its source code."""
+    if isinstance(node, ast.Name) and node.id in constants:
+        return constants[node.id]
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return ast.unparse(node)
+
+def is_static(node: ast.expr, constants: typing.Dict[str, typing.Any]) -> bool:
+    """Check if a given expression node can be statically evaluated, i.e. if it is a literal or a module constant (see eval_static)."""
+    if isinstance(node, ast.Name) and node.id in constants:
+        return True
+    try:
+        ast.literal_eval(node)
+        return True
+    except (ValueError, TypeError, SyntaxError):
+        return False
+
+def get_decorator_arg(node: typing.Optional[ast.expr], constants: typing.Dict[str, typing.Any], position: int, keyword: str, default: typing.Any = None) -> typing.Any:
+    """Statically get the argument at a given <position> or with a given <keyword> of a decorator call node."""
+    if not isinstance(node, ast.Call):
+        return default
+    if position < len(node.args):
+        return eval_static(node.args[position], constants)
+    return next((eval_static(e.value, constants) for e in node.keywords if e.arg == keyword), default)
+
+def get_markers(decorators: typing.List[ast.expr], constants: typing.Dict[str, typing.Any]) -> typing.List[str]:
+    """Statically get the names of the attributes added by the marker decorators of a function, i.e. by <@add_flag("slow")>,
+       <@add_flags("slow", "network")>, <@add_attribute("priority", 1)> or <@add_attributes(("priority", 1), ("owner", "me"))>."""
+    markers = []
+    for node in decorators:
+        if not isinstance(node, ast.Call) or (name := get_decorator_name(node)) not in MARKER_DECORATORS:
+            continue
+        args = [eval_static(e, constants) for e in node.args]
+        if name in ("add_flag", "add_attribute"):
+            markers += args[:1]
+        elif name == "add_flags":
+            markers += args
+        else:
+            markers += [e[0] for e in args if type(e) == tuple and e] if args and type(args[0]) == tuple else args[::2]
+    return [e for e in markers if type(e) == str]
+
+def has_static_selection(decorators: typing.List[ast.expr], constants: typing.Dict[str, typing.Any]) -> bool:
+    """Check if the group path and the markers of a function can be statically evaluated, i.e. if its test id and markers are the runtime ones
+       and the tests selections and shards can rely on them."""
+    return all(
+        is_static(e, constants) for node in decorators
+        if isinstance(node, ast.Call) and get_decorator_name(node) in ("group", *MARKER_DECORATORS) for e in node.args
+    )
+
+def collect_file(filename: str) -> typing.List[STATIC_TEST]:
+    """Statically collect the test functions of a given file by parsing it, without importing it.
+       Every collected test contains its name, line number, docstring, group path (None if ungrouped), execution number,
+       parallel and timeout values, whether it is parametrized or asynchronous, its markers (see get_markers) and whether its group
+       path and markers are static (see has_static_selection). Values that can't be statically evaluated are replaced by their source code."""
+
+    # Reading and parsing the file, skipping the parsing if no test decorators are found.
+    try:
+        with open(filename, 'rb') as file:
+            source = file.read()
+        if not TEST_DECORATOR.search(source):
+            return []
+        tree = ast.parse(source, filename)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    # Creating the result variable and retrieving the module constants.
+    res       = []
+    constants = get_module_constants(tree)
+
+    # For every module level function decorated as a test.
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        decorators = {get_decorator_name(e): e for e in node.decorator_list}
+        if not any(e in decorators for e in TEST_DECORATORS):
+            continue
+
+        # Collecting the test.
+        res.append({
+            "name"         : node.name,
+            "lineno"       : node.lineno,
+            "doc"          : ast.get_docstring(node),
+            "group"        : [eval_static(e, constants) for e in getattr(decorators["group"], "args", [])] if "group" in decorators else None,
+            "execnbr"      : get_decorator_arg(decorators.get("execnbr"), constants, 0, "func_or_execnbr", 1),
+            "parallel"     : get_decorator_arg(decorators.get("execnbr"), constants, 1, "parallel", False),
+            "timeout"      : get_decorator_arg(decorators.get("pqt_timeout"), constants, 0, "duration"),
+            "parametrized" : "parametrize" in decorators,
+            "async"        : isinstance(node, ast.AsyncFunctionDef),
+            "markers"      : get_markers(node.decorator_list, constants),
+            "static"       : has_static_selection(node.decorator_list, constants)
+        })
+
+    # Returning the result.
+    return res
+
+# =------------------------------------------------------------------------------------------------------------------------------------------------------------= #
+
+
+#=------------------=#
+# File index section #
+#=------------------=#
+
+def load_index(root: str) -> typing.Dict[str, typing.List[typing.Any]]:
+    """Load the file index of a given root directory, mapping every relative path to its [mtime, size, collected tests] entry.
+       An empty index is returned if none or an outdated one is found."""
+    try:
+        with open(os.path.join(root, CACHE_DIR, INDEX_FILE), 'r') as file:
+            index = json.load(file)
+        return index["files"] if index.get("version") == __version__ and index.get("format") == INDEX_FORMAT else {}
+    except (OSError, ValueError, KeyError, AttributeError):
+        return {}
+
+def save_index(root: str, files: typing.Dict[str, typing.List[typing.Any]]) -> None:
+    """Save the file index of a given root directory, atomically replacing the previous one and ignoring read-only locations."""
+    try:
+        path = os.path.join(get_cache_dir(root), INDEX_FILE)
+        with open(f"{path}.{os.getpid()}.tmp", 'w') as file:
+            json.dump({"version": __version__, "format": INDEX_FORMAT, "files": files}, file)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+    except OSError:
+        pass
+
+# =-------------------------------------------------------------------------------------------------------= #
+
+
+#=----------------------------=#
+# Test files discovery section #
+#=----------------------------=#
+
+def match_patterns(relpath: str, name: str, patterns: typing.Iterable[str]) -> bool:
+    """Check if a given relative path or its base name matches any of the given glob patterns."""
+    return any(fnmatch.fnmatch(relpath, pattern) or fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+def walk_files(path: str, root: str, include: typing.Iterable[str], exclude: typing.Iterable[str]) -> typing.Iterator[os.DirEntry]:
+    """Recursively yield, in a sorted order, every file entries under a given directory <path> of the <root> directory
+       matching any of the <include> patterns and none of the <exclude> ones. Hidden directories are never walked through."""
+    try:
+        with os.scandir(path) as iterator:
+            entries = sorted(iterator, key=lambda x: x.name)
+    except OSError:
+        return
+    for entry in entries:
+        relpath = entry.path[len(root)+1:]
+        if match_patterns(relpath, entry.name, exclude):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if not entry.name.startswith('.') and entry.name not in SKIPPED_DIRS:
+                yield from walk_files(entry.path, root, include, exclude)
+        elif entry.is_file() and match_patterns(relpath, entry.name, include):
+            yield entry
+
+def index_files(
+        path      : str,
+        include   : typing.Optional[typing.Iterable[str]] = None,
+        exclude   : typing.Optional[typing.Iterable[str]] = None,
+        use_index : bool = True
+    ) -> typing.Dict[str, typing.List[STATIC_TEST]]:
+    """Recursively collect the tests of every files under a given directory, or of a single given file.
+       Files are filtered by the <include> [default: *.py, *.pyw] and <exclude> glob patterns, matched against their relative path or their name.
+       Unless <use_index> is False, an on-disk index keyed by path, mtime and size avoids re-reading unchanged files between runs."""
+
+    # A single file is always collected.
+    root = os.path.abspath(path)
+    if os.path.isfile(root):
+        return {root: collect_file(root)}
+
+    # Normalizing the arguments.
+    include = tuple(include) if include else DEFAULT_INCLUDE
+    exclude = tuple(exclude) if exclude else ()
+
+    # Loading the previous index and creating the new one.
+    index = load_index(root) if use_index else {}
+    files = {}
+
+    # For every matching file, reusing the indexed entry if the file didn't change, otherwise collecting the file.
+    for entry in walk_files(root, root, include, exclude):
+        relpath = entry.path[len(root)+1:]
+        stat    = entry.stat()
+        if (cached := index.get(relpath)) and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            files[relpath] = cached
+        else:
+            files[relpath] = [stat.st_mtime_ns, stat.st_size, collect_file(entry.path)]
+
+    # Saving the new index if it changed.
+    if use_index and files != index:
+        save_index(root, files)
+
+    # Returning the collected tests by absolute path.
+    return {os.path.join(root, relpath): entry[2] for relpath, entry in files.items()}
+
+def discover_test_files(
+        path      : str,
+        include   : typing.Optional[typing.Iterable[str]] = None,
+        exclude   : typing.Optional[typing.Iterable[str]] = None,
+        use_index : bool = True
+    ) -> typing.List[str]:
+    """Recursively discover every files containing test functions under a given directory (see index_files)."""
+    return [filename for filename, tests in index_files(path, include, exclude, use_index).items() if tests]
+
+def collect_tests(
+        path      : str,
+        include   : typing.Optional[typing.Iterable[str]] = None,
+        exclude   : typing.Optional[typing.Iterable[str]] = None,
+        use_index : bool = True
+    ) -> typing.List[STATIC_TEST]:
+    """Statically collect every tests under a given directory or from a given file (see index_files), adding their absolute "file" path."""
+    return [dict(test, file=filename) for filename, tests in index_files(path, include, exclude, use_index).items() for test in tests]
+
+# =-------------------------------------------------------------------------------------------------------------------------------------------= #
@@ -37,12 +37,12 @@
 
 from   __future__           import annotations
 import typing
-import threading
-import queue
 import inspect
+import asyncio
 import re
 from   pyquicktools.pyquicktest.utils      import map1, get_str_tab
 from   pyquicktools.pyquicktest.assertions import TestTimeoutException
+from   pyquicktools.pyquicktest.supervise  import TIMEOUT_THREADS, TIMEOUT_MODES
 
 # =-------------------------------------------------= #
 
@@ -93,7 +93,7 @@ def copy_function_attributes(src_func: typing.Callable[[object], object], dest_f
 
 def return_or_raise(value: typing.Any) -> typing.Any:
     """Return or raise the given value <value> if it is an Exception."""
-    if type(value) == Exception:
+    if isinstance(value, Exception):
         raise value
     return value
 
@@ -158,30 +158,18 @@ def alias(*aliases: str) -> typing.Callable[[object], object]:
     return decorator
 
 def timeout(duration: float, default: typing.Any) -> typing.Callable[[object], object]:
-    """Add a timeout to the decorated object."""
+    """Add a timeout to the decorated object, after what the default value <default> is returned (or raised if it is an Exception).
+       The calls run in the pool of timeout threads shared by the process, a timed out call being abandoned to its thread (see TimeoutThreadPool)."""
 
     # Creating the decorator function.
     def decorator(func: typing.Callable[[object], object]) -> typing.Callable[[object], object]:
-        # Creating a queue object for storing the potentially returned value from the given <func> function.
-        queue_ = queue.Queue(maxsize=1)
-
-        # Creating a temporary function that simply put the result of the <func> function
-        # to the previously created queue whatever its result is (even Exceptions).
-        def target():
-            try:
-                queue_.put(func())
-            except Exception as e:
-                queue_.put(e)
-        
-        # Creating the modified function that use a Thread to run in background the <func> function.
+        # Creating the modified function that runs the <func> function in a pool thread.
         # After a given amount of time, the function result is ignored, and the default value is returned.
         def timeout_func():
-            action = threading.Thread(target=target, daemon=True)
-            action.start()
-            action.join(timeout=duration)
-            if action.is_alive():
-                return_or_raise(default)
-            return_or_raise(queue_.get())
+            try:
+                return TIMEOUT_THREADS.call(func, duration)
+            except TestTimeoutException:
+                return return_or_raise(default)
 
         # Copy the <func> function attributes to the newly created <timeout_func> function.
         return copy_function_attributes(func, timeout_func)
@@ -220,14 +208,24 @@ def group(*func_or_groups: typing.Callable[[object], object] | str | None) -> ty
         return decorated_func
     return decorator(*func_or_groups) if is_not_call else decorator
 
-def execnbr(func_or_execnbr: typing.Callable[[object], object] | int | None=None) -> typing.Callable[[object], object]:
-    """Mark a function as requiring <exec_nbr> execution during tests."""
+def execnbr(
+        func_or_execnbr       : typing.Callable[[object], object] | int | None = None,
+        parallel              : bool | int = False,
+        stop_on_first_failure : bool = False,
+        concurrency           : int = 1
+    ) -> typing.Callable[[object], object]:
+    """Mark a function as requiring <exec_nbr> execution during tests.
+       If <parallel> is True (or a number of worker processes), the executions are fanned out across worker processes.
+       If <stop_on_first_failure> is True, the remaining executions are skipped as soon as one of them fails.
+       If the function is asynchronous, up to <concurrency> of its executions run concurrently on a single event loop."""
     def decorator(func: typing.Callable[[object], object]) -> typing.Callable[[object], object]:
         decorated_func = copy_function_attributes(
             func,
-            add_attribute(
-                "test_execnbr",
-                func_or_execnbr if not callable(func_or_execnbr) else 1
+            add_attributes(
+                ("test_execnbr", func_or_execnbr if not callable(func_or_execnbr) else 1),
+                ("test_parallel", parallel),
+                ("test_stop_on_first_failure", stop_on_first_failure),
+                ("test_concurrency", concurrency)
             ) (add_flag("test")(func)))
         if not hasattr(decorated_func, "__source__"):
             setattr(decorated_func, "__source__", inspect.getsource(func))
@@ -246,7 +244,7 @@ def parametrize(*args: typing.Any) -> typing.Callable[[object], object]:
         tab = get_str_tab(source)
 
         # Creating the output function source code
-        res_source  = f"{tab}def {func.__name__}() -> typing.Union[TestPassedException, TestFailedException]:\n"
+        res_source  = f"{tab}{'async ' if inspect.iscoroutinefunction(func) else ''}def {func.__name__}() -> typing.Union[TestPassedException, TestFailedException]:\n"
         if func.__doc__:
             res_source += f"""{tab}    \"\"\"{func.__doc__}\"\"\"\n"""
             res_source += "\n".join(f"""{tab}    {arg[0]} = {arg[1]}\n""" for arg in zip(inspect.getfullargspec(func).args, args))
@@ -262,8 +260,31 @@ def parametrize(*args: typing.Any) -> typing.Callable[[object], object]:
         return func
     return decorator
 
-def pqt_timeout(duration: float) -> typing.Callable[[object], object]:
-    """Add a timeout to the decorated tests after what the test fail."""
-    return timeout(duration=duration, default=TestTimeoutException(f"Timeout after {duration} seconds."))
+def pqt_timeout(duration: float, mode: str = "process") -> typing.Callable[[object], object]:
+    """Add a timeout to the decorated tests after what the test fail, enforced on each of its iterations by the test runner.
+       In the "process" mode, the iterations run in a supervised worker process, killed and replaced as soon as one of them times out.
+       In the cheaper "thread" mode, they run in the pool of timeout threads, a timed out iteration being abandoned to its thread.
+       Called directly, outside of the test runner, the decorated function runs in the pool of timeout threads (or is cancelled if asynchronous),
+       a TestTimeoutException being raised once it times out."""
+    if mode not in TIMEOUT_MODES:
+        raise ValueError(f"Invalid timeout mode <{mode}>, expected one of: {', '.join(TIMEOUT_MODES)}.")
+    def decorator(func: typing.Callable[[object], object]) -> typing.Callable[[object], object]:
+        # Creating the modified function enforcing the timeout on the direct calls, the test runner rewriting and running the original one.
+        if inspect.iscoroutinefunction(func):
+            async def timeout_func(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+                try:
+                    return await asyncio.wait_for(func(*args, **kwargs), duration)
+                except asyncio.TimeoutError:
+                    raise TestTimeoutException(f"Timeout after {duration} seconds, the call has been cancelled.") from None
+        else:
+            def timeout_func(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+                return TIMEOUT_THREADS.call(lambda: func(*args, **kwargs), duration, func.__name__)
+
+        # Copy the <func> function attributes to the newly created <timeout_func> function, in its own attributes dictionary
+        # so the original function stays reachable from it only (see get_code).
+        timeout_func = copy_function_attributes(func, timeout_func)
+        timeout_func.__dict__ = {**func.__dict__, "__wrapped__": func}
+        return add_attributes(("test_timeout", duration), ("test_timeout_mode", mode))(timeout_func)
+    return decorator
 
 # =-------------------------------------------------------= #
\ No newline at end of file
@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+      impact.py is the file containing the test-impact
+     analysis, i.e. the recording of the tests footprint
+       and the selection of the tests affected by changes.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                          import annotations
+import typing
+import os
+import sys
+import threading
+import sysconfig
+import subprocess
+from   pyquicktools.pyquicktest.report     import get_test_path
+from   pyquicktools.pyquicktest.store      import load_footprints
+from   pyquicktools.pyquicktest.selection  import TestSelection
+
+# =-------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Environment variable enabling the footprint recording, inherited by the worker processes.
+RECORD_ENV    = "PQT_RECORD_IMPACT"
+
+# Directories of the standard library and of the installed packages, whose files are never part of a footprint.
+INSTALL_PATHS = tuple({sysconfig.get_path(name) for name in ("stdlib", "platstdlib", "purelib", "platlib")})
+
+# =----------------------------------= #
+
+
+#=---------------------------=#
+# Footprint recording section #
+#=---------------------------=#
+
+def enable_recording() -> None:
+    """Enable the recording of the tests footprint, for the current process and its future worker processes."""
+    os.environ[RECORD_ENV] = "1"
+
+def is_recording() -> bool:
+    """Check if the tests footprint is recorded."""
+    return os.environ.get(RECORD_ENV) == "1"
+
+def is_project_file(filename: str, root: str) -> bool:
+    """Check if a given executed file is a source file of the project under <root>, i.e. neither an installed nor a generated one."""
+    return (filename.startswith(root + os.sep)
+            and not any(filename.startswith(path + os.sep) for path in INSTALL_PATHS)
+            and os.path.isfile(filename))
+
+class FootprintTracer:
+    """Tracer recording the files of every Python functions called while active.
+       Only the call events are traced, the local trace function being disabled, so the traced code runs at near full speed."""
+
+    def __init__(self) -> None:
+        self.files = set()
+
+    def trace(self, frame: typing.Any, event: str, arg: typing.Any) -> None:
+        self.files.add(frame.f_code.co_filename)
+
+    def __enter__(self) -> FootprintTracer:
+        # Saving the previous trace functions (i.e. of a coverage tool or a debugger), restored on exit.
+        self.previous        = sys.gettrace()
+        self.previous_thread = threading.gettrace() if hasattr(threading, "gettrace") else threading._trace_hook
+        sys.settrace(self.trace)
+        threading.settrace(self.trace)
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        sys.settrace(self.previous)
+        threading.settrace(self.previous_thread)
+
+    def get_footprint(self, filename: str, root: typing.Optional[str] = None) -> typing.List[str]:
+        """Get the recorded project source files of a test of a given file, including it, relative to the current working directory."""
+        root = os.path.abspath(root if root else '.')
+        return sorted({get_test_path(filename)} | {get_test_path(file) for file in self.files if is_project_file(file, root)})
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=--------------------------------=#
+# Impacted tests selection section #
+#=--------------------------------=#
+
+def get_changed_files(paths: typing.Optional[typing.List[str]] = None) -> typing.Optional[typing.Set[str]]:
+    """Get the changed files, relative to the current working directory, either the given <paths> or else the ones reported by git,
+       i.e. the modified files since the last commit and the untracked ones. <None> is returned if git can't be used."""
+    if paths:
+        return {get_test_path(os.path.abspath(path)) for path in paths}
+    try:
+        top   = subprocess.run(["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True).stdout.strip()
+        names = subprocess.run(["git", "diff", "--name-only", "HEAD"], capture_output=True, text=True, check=True, cwd=top).stdout.splitlines()
+        names = names + subprocess.run(["git", "ls-files", "--others", "--exclude-standard"], capture_output=True, text=True, check=True, cwd=top).stdout.splitlines()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {get_test_path(os.path.join(top, name)) for name in names if name}
+
+def select_impacted(changed: typing.Set[str], root: typing.Optional[str] = None) -> TestSelection:
+    """Select the tests whose recorded footprint intersects the given changed files.
+       The tests without a recorded footprint are always run, as well as the whole test files that changed."""
+    footprints = load_footprints(root)
+    skip       = {id_ for (id_, files) in footprints.items() if not files & changed}
+
+    # Skipping the test files whose every recorded tests are skipped, sparing their import.
+    files = {}
+    for id_ in footprints:
+        files.setdefault(id_.split("::", 1)[0], set()).add(id_)
+    return TestSelection(skip=skip, skip_files={file for (file, ids) in files.items() if ids <= skip and file not in changed})
+
+# =-----------------------------------------------------------------------------------------------------------------= #
@@ -0,0 +1,320 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+     parallel.py is the file containing the functions
+      that dispatch tests to a pool of worker processes.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                     import annotations
+import typing
+import os
+import time
+import traceback
+import io
+import math
+import random
+import contextlib
+import threading
+import multiprocessing
+import multiprocessing.queues
+import multiprocessing.connection
+import concurrent.futures
+import concurrent.futures.process
+from   pyquicktools.pyquicktest.utils import get_all_functions, get_callable_ctx_from_file
+
+# =-------------------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Test functions registered by the parent process before the pool creation.
+# Forked workers inherit this dictionary, spawned workers import the test file instead.
+PARALLEL_FUNCS: typing.Dict[str, typing.Callable[[object], object]] = {}
+
+# Whether the current process is a worker process, in which case no nested pool is created.
+IS_WORKER = False
+
+# =----------------------------------= #
+
+
+#=------------------------=#
+# Worker processes section #
+#=------------------------=#
+
+def get_jobs_number(jobs: typing.Optional[int]) -> int:
+    """Normalize a given number of jobs. <None> means 1 job, and any number lower than 1 means one job per CPU."""
+    if jobs is None:
+        return 1
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+def get_mp_context() -> multiprocessing.context.BaseContext:
+    """Get the multiprocessing context to use, preferring the fork one for sharing the already imported test files."""
+    return multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+
+class WorkerPool(concurrent.futures.ProcessPoolExecutor):
+    """Pool of worker processes recording their pids when started, so its running tasks can be terminated."""
+
+    def __init__(self, jobs: int, mp_context: multiprocessing.context.BaseContext, **kwargs: typing.Any) -> None:
+        self.pids   = mp_context.SimpleQueue()
+        self.known  = set()
+        super().__init__(max_workers=jobs, mp_context=mp_context, initializer=record_worker, initargs=(self.pids,), **kwargs)
+
+    def terminate(self) -> None:
+        """Terminate the still alive worker processes of the pool, leaving it unusable."""
+        while not self.pids.empty():
+            self.known.add(self.pids.get())
+        for process in multiprocessing.active_children():
+            if process.pid in self.known:
+                process.terminate()
+
+def record_worker(pids: multiprocessing.queues.SimpleQueue) -> None:
+    """Record the pid of the current worker process in the given queue of its pool."""
+    pids.put(os.getpid())
+
+def new_pool(jobs: int) -> WorkerPool:
+    """Create a new pool of <jobs> worker processes."""
+    return WorkerPool(jobs, get_mp_context())
+
+def is_worker() -> bool:
+    """Check if the current process is a worker process."""
+    return IS_WORKER
+
+def init_worker() -> None:
+    """Initialize the current worker process, reseeding the random generators shared with the forked parent."""
+    global IS_WORKER
+    IS_WORKER = True
+    random.seed()
+
+def register_functions(*funcs: typing.Callable[[object], object]) -> None:
+    """Register the given test functions so forked workers can retrieve them without importing anything."""
+    PARALLEL_FUNCS.update({func.__name__: func for func in funcs})
+
+def resolve_function(caller_file: str, name: str) -> typing.Callable[[object], object]:
+    """Retrieve the test function <name> from the registered functions or else from the given caller file."""
+    if name in PARALLEL_FUNCS:
+        return PARALLEL_FUNCS[name]
+    return next(func for func in get_all_functions("test", ctx=get_callable_ctx_from_file(caller_file)) if func.__name__ == name)
+
+def exec_test_worker(caller_file: str, name: str, indent: str) -> typing.Tuple[typing.List[str], str, typing.List[typing.Dict[str, typing.Any]]]:
+    """Execute a single test function inside a worker process, returning its result, its buffered output and its reported result."""
+    from pyquicktools.pyquicktest.test   import exec_test
+    from pyquicktools.pyquicktest.report import pop_pending_results
+    init_worker()
+
+    # Buffering the test output so the parent process prints it in the hierarchical order.
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        res = exec_test(resolve_function(caller_file, name), indent=indent, caller_file=caller_file)
+    return (res, output.getvalue(), pop_pending_results())
+
+def dispatch_tests(
+        pool        : concurrent.futures.Executor,
+        funcs       : typing.List[typing.Tuple[typing.Callable[[object], object], str]],
+        caller_file : str
+    ) -> typing.Dict[str, concurrent.futures.Future]:
+    """Submit every given (test function, indent) pairs to the given pool, returning the futures indexed by test name."""
+    return {func.__name__: pool.submit(exec_test_worker, caller_file, func.__name__, indent) for (func, indent) in funcs}
+
+class IsolatedPool(concurrent.futures.ThreadPoolExecutor):
+    """Pool running each of its tasks in its own freshly spawned process, at most <jobs> at once, so the tasks (i.e. the test files)
+       never share their imported modules nor their global state, whatever the python version."""
+
+    def __init__(self, jobs: int) -> None:
+        super().__init__(max_workers=jobs)
+        self.context    = multiprocessing.get_context("spawn")
+        self.lock       = threading.Lock()
+        self.processes  = set()
+        self.terminated = False
+
+    def submit(self, fn: typing.Callable[..., typing.Any], *args: typing.Any, **kwargs: typing.Any) -> concurrent.futures.Future:
+        """Submit a given task, executed by a new process once one of the <jobs> slots is free."""
+        return super().submit(self.run_process, fn, *args, **kwargs)
+
+    def run_process(self, fn: typing.Callable[..., typing.Any], *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        """Run a given task in a new process and return its result, or raise its exception."""
+        (receiver, sender) = self.context.Pipe(duplex=False)
+        process            = self.context.Process(target=exec_process_task, args=(sender, fn, args, kwargs))
+        with self.lock:
+            if self.terminated:
+                raise concurrent.futures.CancelledError()
+            process.start()
+            self.processes.add(process)
+        sender.close()
+
+        # Receiving the task result before joining the process, which blocks on sending it.
+        try:
+            (success, value) = receiver.recv()
+        except EOFError:
+            raise concurrent.futures.process.BrokenProcessPool(f"The process running <{getattr(fn, '__name__', fn)}{args}> terminated abruptly.") from None
+        finally:
+            receiver.close()
+            process.join()
+            with self.lock:
+                self.processes.discard(process)
+        if not success:
+            raise value
+        return value
+
+    def terminate(self) -> None:
+        """Terminate the running processes of the pool, the tasks not started yet being cancelled, leaving it unusable."""
+        with self.lock:
+            self.terminated = True
+            for process in self.processes:
+                process.terminate()
+
+def exec_process_task(sender: multiprocessing.connection.Connection, fn: typing.Callable[..., typing.Any], args: tuple, kwargs: dict) -> None:
+    """Execute a given task in the current process, sending whether it succeeded and its result or exception through a given connection."""
+    try:
+        result = (True, fn(*args, **kwargs))
+    except BaseException as e:
+        result = (False, e)
+    sender.send(result)
+    sender.close()
+
+def new_file_pool(jobs: int) -> IsolatedPool:
+    """Create a new pool of <jobs> slots running each file in a freshly spawned process, keeping the files isolated."""
+    return IsolatedPool(jobs)
+
+def exec_file_worker(filename: str, selection: typing.Optional[object] = None) -> typing.Tuple[str, int, int, typing.List[str], int, typing.List[typing.Dict[str, typing.Any]]]:
+    """Run every tests of a single file, or only the ones of a given test selection, inside a worker process.
+       Returns its buffered output, its number of tests, the number of them which ran, the failed tests, the elapsed time in nanoseconds and the reported results."""
+    from pyquicktools.pyquicktest.test   import run_file, reset_failures
+    from pyquicktools.pyquicktest.report import pop_pending_results
+    init_worker()
+    reset_failures()
+
+    # Buffering the file output so the parent process prints it in the listing order.
+    output    = io.StringIO()
+    file_time = time.perf_counter_ns()
+    with contextlib.redirect_stdout(output):
+        try:
+            (length, ran, failed) = run_file(filename, selection=selection)
+        except Exception:
+            print(f"\033[91m{traceback.format_exc()}\033[00m")
+            (length, ran, failed) = (0, 0, [os.path.basename(filename)])
+    return (output.getvalue(), length, ran, failed, time.perf_counter_ns() - file_time, pop_pending_results())
+
+def dispatch_files(
+        pool      : concurrent.futures.Executor,
+        filenames : typing.List[str],
+        selection : typing.Optional[object] = None
+    ) -> typing.Dict[str, concurrent.futures.Future]:
+    """Submit every given test files to the given pool with the test selection to apply, returning the futures indexed by filename."""
+    return {filename: pool.submit(exec_file_worker, filename, selection) for filename in filenames}
+
+def exec_iterations_worker(
+        caller_file : str,
+        name        : str,
+        start       : int,
+        stop        : int,
+        stop_early  : bool = False
+    ) -> typing.Tuple[int, int, int, typing.Optional[typing.Tuple[int, str]], typing.Any]:
+    """Execute the iterations [<start>, <stop>[ of a single test function inside a worker process, until the first failure if <stop_early>.
+       Returns the executed chunk bounds, the number of passed iterations, the first failing iteration with its message and the chunk latency histogram."""
+    from pyquicktools.pyquicktest.test         import run_iteration
+    from pyquicktools.pyquicktest.rewrite      import rewrite_test
+    from pyquicktools.pyquicktest.stats        import LatencyHistogram, FLUSH_SIZE
+    from pyquicktools.pyquicktest.supervise    import TimeoutRunner
+    from pyquicktools.pyquicktest.asynchronous import AsyncRunner, is_async_test
+    init_worker()
+
+    # Rewriting the test function once for the whole chunk, driving its coroutines on an event loop if it is asynchronous,
+    # and running its iterations under its timeout if it has one.
+    test_func      = resolve_function(caller_file, name)
+    rewritten_func = rewrite_test(test_func, caller_file=caller_file)
+    driver         = AsyncRunner(rewritten_func) if is_async_test(rewritten_func) else None
+    runner         = TimeoutRunner(test_func, driver or rewritten_func) if getattr(test_func, "test_timeout", None) else None
+
+    # Executing and timing the chunk iterations, only keeping the first failure.
+    (success, failure, latency) = (0, None, LatencyHistogram(first=start))
+    (pending, mark, clock)      = (latency.pending, latency.pending.append, time.perf_counter_ns)
+    latency.start()
+    with driver if driver else contextlib.nullcontext(), runner if runner else contextlib.nullcontext():
+        for i in range(start, stop):
+            error = run_iteration(runner or driver or rewritten_func, test_func)
+            mark(clock())
+            if len(pending) > FLUSH_SIZE:
+                latency.flush()
+            if error is None:
+                success += 1
+            elif failure is None:
+                failure = (i, str(error))
+                if stop_early:
+                    return (start, i+1, success, failure, latency.flush())
+    return (start, stop, success, failure, latency.flush())
+
+def dispatch_iterations(
+        pool        : concurrent.futures.Executor,
+        test_func   : typing.Callable[[object], object],
+        jobs        : int,
+        caller_file : str,
+        stop_early  : bool = False
+    ) -> typing.Dict[int, concurrent.futures.Future]:
+    """Split the <test_execnbr> iterations of a test function into chunks submitted to the given pool, returning the futures indexed by chunk start.
+       Four chunks per job are created for balancing the workers load. If <stop_early>, each chunk stops at its first failure."""
+    chunk = math.ceil(test_func.test_execnbr/(4*jobs))
+    return {
+        start: pool.submit(exec_iterations_worker, caller_file, test_func.__name__, start, min(start+chunk, test_func.test_execnbr), stop_early)
+        for start in range(0, test_func.test_execnbr, chunk)
+    }
+
+def cancel_futures(pool: typing.Union[WorkerPool, IsolatedPool], futures: typing.Iterable[concurrent.futures.Future]) -> None:
+    """Cancel the given futures of a given pool. The not yet started ones are simply cancelled, but as running ones can't be,
+       the worker processes of the pool are terminated if any is still running, leaving the pool unusable."""
+    futures = list(futures)
+    for future in futures:
+        future.cancel()
+    if any(not future.done() for future in futures):
+        pool.terminate()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
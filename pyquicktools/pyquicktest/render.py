@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+      render.py is the file containing the renderer
+     that draws the tests progress lines on terminals.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                     import annotations
+import typing
+import os
+import sys
+import time
+import threading
+from   pyquicktools.pyquicktest.utils import format_time_unit
+
+# =-------------------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Number of progress lines drawn per second at most.
+REFRESH_RATE = 15
+
+# ANSI sequence going back to the start of the line and erasing it.
+CLEAR_LINE   = "\r\033[2K"
+
+# =----------------------------------= #
+
+
+#=----------------=#
+# Renderer section #
+#=----------------=#
+
+def is_tty() -> bool:
+    """Check if the standard output is an interactive terminal, i.e. not a pipe, a file or a buffer."""
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+class Progress:
+    """Progress of a running test, updated by the test loop and drawn by the renderer thread.
+       Updating it only costs two attribute assignments, the formatting being left to the renderer."""
+
+    def __init__(self, test_func: typing.Callable[[object], object], indent: str, func_time: int) -> None:
+        self.test_func = test_func
+        self.indent    = indent
+        self.func_time = func_time
+        self.done      = 0
+        self.success   = 0
+        self.tracked   = False
+        self.drawn     = False
+
+    def format(self) -> str:
+        """Format the progress line of the test iterations passed so far."""
+        execnbr = self.test_func.test_execnbr
+        return (f"{self.indent}\033[92m[{self.done}{(len(str(execnbr))-len(str(self.done)))*' '}/{execnbr}] "
+                f"passed! ({100*self.success/execnbr}%) "
+                f"""[{format_time_unit((time.perf_counter_ns() - self.func_time), unit="ns")}]\033[00m""")
+
+class ProgressRenderer:
+    """Renderer owning the terminal progress line, coalescing the progress updates to <rate> draws per second from a single thread.
+       Nothing is drawn when the standard output isn't a terminal, the tests summary lines being enough there."""
+
+    def __init__(self, rate: int = REFRESH_RATE) -> None:
+        self.interval = 1/rate
+        self.lock     = threading.Lock()
+        self.active   = threading.Event()
+        self.progress = None
+        self.thread   = None
+
+    def track(self, test_func: typing.Callable[[object], object], indent: str, func_time: int) -> Progress:
+        """Start drawing the progress of a given test, returning the progress object to update."""
+        progress = Progress(test_func, indent, func_time)
+        if not is_tty():
+            return progress
+
+        # Replacing the currently drawn progress, and starting the renderer thread if required.
+        with self.lock:
+            progress.tracked = True
+            self.progress    = progress
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+        self.active.set()
+        return progress
+
+    def finish(self, progress: Progress) -> None:
+        """Stop drawing the progress of a given test, erasing its progress line so the next prints start on a clean line."""
+        if not progress.tracked:
+            return
+        with self.lock:
+            progress.tracked = False
+            if self.progress is progress:
+                self.progress = None
+                self.active.clear()
+            if progress.drawn:
+                sys.stdout.write(CLEAR_LINE)
+                sys.stdout.flush()
+
+    def run(self) -> None:
+        """Draw the tracked progress at the refresh rate, sleeping while there is none."""
+        while True:
+            self.active.wait()
+            time.sleep(self.interval)
+            with self.lock:
+                if (progress := self.progress) is not None:
+                    sys.stdout.write(CLEAR_LINE + progress.format())
+                    sys.stdout.flush()
+                    progress.drawn = True
+
+    def reset(self) -> None:
+        """Reset the renderer in a forked child process, which doesn't inherit the renderer thread but might inherit its lock held."""
+        self.__init__(1/self.interval)
+
+# Renderer shared by every tests of the process.
+RENDERER = ProgressRenderer()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=RENDERER.reset)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
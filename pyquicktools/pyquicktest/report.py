@@ -0,0 +1,339 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+      report.py is the file containing the reporters
+      that stream the tests results to other tools.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                        import annotations
+import typing
+import os
+import re
+import json
+import platform
+import heapq
+import contextvars
+from   xml.sax.saxutils                  import escape, quoteattr
+from   pyquicktools.pyquicktest.parallel import is_worker
+from   pyquicktools.pyquicktest.stats    import LatencyHistogram, format_duration
+
+# =-----------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NL = '\n'
+
+# Result of a single test, as streamed to the reporters.
+RESULT = typing.Dict[str, typing.Any]
+
+# Reporters receiving the events of the current process test sessions.
+REPORTERS: typing.List[Reporter] = []
+
+# ANSI escape sequences coloring the terminal output (i.e. "\033[91m"), removed as a whole from the XML documents.
+ANSI_SEQUENCES    = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+# Characters forbidden in XML documents, i.e. most of the control characters (like the escape character of the other ANSI sequences).
+XML_INVALID_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# Results recorded by a worker process, sent back to the parent process that reports them.
+PENDING_RESULTS: typing.List[RESULT] = []
+
+# Results recorded by the current asyncio task, for the asynchronous tests running concurrently (see dispatch_async_tests).
+TASK_RESULTS: contextvars.ContextVar[typing.Optional[typing.List[RESULT]]] = contextvars.ContextVar("TASK_RESULTS", default=None)
+
+# =----------------------------------= #
+
+
+#=-----------------=#
+# Reporters section #
+#=-----------------=#
+
+class Reporter:
+    """Interface of the reporters, receiving the test sessions events. Every events are ignored by default."""
+
+    def session_start(self, info: typing.Dict[str, typing.Any]) -> None:
+        """Called when a test session starts."""
+        pass
+
+    def test_result(self, result: RESULT) -> None:
+        """Called once every iterations of a test have been executed."""
+        pass
+
+    def session_end(self, info: typing.Dict[str, typing.Any]) -> None:
+        """Called when a test session ends, even if interrupted."""
+        pass
+
+    def close(self) -> None:
+        """Called when the reporter is removed."""
+        pass
+
+class JSONLinesReporter(Reporter):
+    """Reporter streaming every events as JSON Lines to a given file name or file descriptor, one line written and flushed per event."""
+
+    def __init__(self, target: typing.Union[str, int]) -> None:
+        self.file = os.fdopen(target, 'w', encoding="utf-8", closefd=False) if type(target) == int else open(target, 'w', encoding="utf-8")
+
+    def write(self, event: str, data: typing.Dict[str, typing.Any]) -> None:
+        """Write a single event line."""
+        self.file.write(json.dumps({"event": event, **data}, default=str) + '\n')
+        self.file.flush()
+
+    def session_start(self, info: typing.Dict[str, typing.Any]) -> None:
+        self.write("session_start", info)
+
+    def test_result(self, result: RESULT) -> None:
+        self.write("test", result)
+
+    def session_end(self, info: typing.Dict[str, typing.Any]) -> None:
+        self.write("session_end", info)
+
+    def close(self) -> None:
+        self.file.close()
+
+class JUnitXMLReporter(Reporter):
+    """Reporter streaming the tests results as a JUnit XML document to a given file name or file descriptor.
+       Every file and group of the tests ids is mapped to a nested <testsuite>, opened and closed as the results come in order,
+       so only the currently opened suites are kept in memory. As a consequence, the suites have no counters attributes."""
+
+    def __init__(self, target: typing.Union[str, int]) -> None:
+        self.file   = os.fdopen(target, 'w', encoding="utf-8", closefd=False) if type(target) == int else open(target, 'w', encoding="utf-8")
+        self.suites = []
+        self.file.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites name="pyquicktest">\n')
+
+    def write(self, text: str) -> None:
+        """Write a part of the document, indented by the number of opened suites."""
+        self.file.write((len(self.suites)+1)*"  " + text + '\n')
+
+    def close_suites(self, depth: int = 0) -> None:
+        """Close the opened suites deeper than <depth>."""
+        while len(self.suites) > depth:
+            self.suites.pop()
+            self.write("</testsuite>")
+
+    def test_result(self, result: RESULT) -> None:
+        # Closing the suites the test doesn't belong to, and opening its missing ones.
+        path  = [result["file"]] + result["group"]
+        depth = 0
+        while depth < min(len(path), len(self.suites)) and path[depth] == self.suites[depth]:
+            depth += 1
+        self.close_suites(depth)
+        for suite in path[depth:]:
+            self.write(f"<testsuite name={quoteattr(suite)}>")
+            self.suites.append(suite)
+
+        # Writing the test case, its configured and executed iterations counters as properties and its first failure if any.
+        self.write(
+            f"""<testcase name={quoteattr(result["name"])} classname={quoteattr(".".join(path))} file={quoteattr(result["file"])} """
+            f"""time="{result["duration_ns"]/1e9:.9f}">"""
+        )
+        self.write(
+            f"""  <properties><property name="execnbr" value="{result.get("execnbr", result["iterations"])}"/>"""
+            f"""<property name="iterations" value="{result["iterations"]}"/><property name="passed" value="{result["passed"]}"/>"""
+            f"""<property name="failed" value="{result["failed"]}"/>"""
+            + "".join(f"""<property name="latency_{key}" value="{value}"/>""" for (key, value) in (result.get("latency") or {}).items() if value is not None)
+            + "</properties>"
+        )
+        if result["status"] != "passed":
+            message = XML_INVALID_CHARS.sub('', ANSI_SEQUENCES.sub('', result["message"] or ""))
+            self.write(f"""  <failure message={quoteattr(message.split(NL)[0])}>{escape(message)}</failure>""")
+        self.write("</testcase>")
+        self.file.flush()
+
+    def session_end(self, info: typing.Dict[str, typing.Any]) -> None:
+        self.close_suites()
+        self.file.flush()
+
+    def close(self) -> None:
+        self.close_suites()
+        self.file.write("</testsuites>\n")
+        self.file.close()
+
+class DurationsReporter(Reporter):
+    """Reporter printing the <number> slowest tests and the <number> slowest single iterations at the end of every test sessions.
+       Only the slowest results seen so far are kept in bounded heaps."""
+
+    def __init__(self, number: int) -> None:
+        self.number     = number
+        self.tests      = []
+        self.iterations = []
+
+    def push(self, heap: typing.List[typing.Tuple[int, str]], item: typing.Tuple[int, str]) -> None:
+        """Push an item to a bounded heap, dropping its smallest item once full."""
+        if len(heap) < self.number:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+    def test_result(self, result: RESULT) -> None:
+        self.push(self.tests, (result["duration_ns"], result["id"]))
+        if (latency := result.get("latency")) and result["iterations"] > 1:
+            self.push(self.iterations, (latency["max_ns"], f"""{result["id"]} [#{latency["slowest_iteration"]+1}/{result["iterations"]}]"""))
+
+    def session_end(self, info: typing.Dict[str, typing.Any]) -> None:
+        for (title, heap) in [("tests", self.tests), ("single iterations", self.iterations)]:
+            if heap:
+                print(f"\033[01mSlowest {len(heap)} {title}:\033[00m")
+                for (duration, name) in sorted(heap, reverse=True):
+                    print(f"{format_duration(duration):>12}  {name}")
+                print()
+        (self.tests, self.iterations) = ([], [])
+
+def add_reporter(reporter: Reporter) -> Reporter:
+    """Add a reporter receiving the events of the following test sessions."""
+    REPORTERS.append(reporter)
+    return reporter
+
+def remove_reporter(reporter: Reporter) -> None:
+    """Remove and close a reporter."""
+    REPORTERS.remove(reporter)
+    reporter.close()
+
+def report(event: str, data: typing.Dict[str, typing.Any]) -> None:
+    """Send an event to every reporters."""
+    for reporter in REPORTERS:
+        getattr(reporter, event)(data)
+
+def report_session_start(working: str, length: int) -> None:
+    """Report the start of a test session over <length> tests or test files."""
+    if REPORTERS:
+        report("session_start", {"working": working, "length": length, "platform": platform.platform(), "python": platform.python_version(), "version": __version__})
+
+def report_session_end(duration: int, length: int, failed: typing.List[str], interrupted: bool = False) -> None:
+    """Report the end of a test session over <length> tests, <failed> being the failed ones."""
+    if REPORTERS:
+        report("session_end", {"duration_ns": duration, "length": length, "failed": failed, "interrupted": interrupted})
+
+def get_test_path(filename: str) -> str:
+    """Get the path of a test file as reported, i.e. relative to the current working directory and with forward slashes."""
+    try:
+        filename = os.path.relpath(filename)
+    except ValueError:
+        pass
+    return filename.replace(os.sep, '/')
+
+def get_test_id(filename: str, group: typing.Optional[typing.List[str]], name: str) -> str:
+    """Get the identifier of a test, i.e. "file::group::subgroup::name", the file being relative to the current working directory."""
+    return "::".join([get_test_path(filename), *(group or []), name])
+
+def make_result(
+        test_func   : typing.Callable[[object], object],
+        filename    : str,
+        passed      : int,
+        duration    : int,
+        message     : typing.Optional[str] = None,
+        footprint   : typing.Optional[typing.List[str]] = None,
+        executed    : typing.Optional[int] = None,
+        latency     : typing.Optional[LatencyHistogram] = None
+    ) -> RESULT:
+    """Make the result of a test whose <passed> iterations out of <test_execnbr> passed in <duration> nanoseconds.
+       The number of <executed> iterations is lower than <test_execnbr> if the remaining ones were skipped after a failure.
+       The summary of the iterations <latency> histogram is added if provided, and <None> otherwise.
+       The source files executed by the test are added to the result if its <footprint> was recorded."""
+    executed = test_func.test_execnbr if executed is None else executed
+    group  = list(getattr(test_func, "test_group", None) or [])
+    result = {
+        "id"          : get_test_id(filename, group, test_func.__name__),
+        "file"        : get_test_path(filename),
+        "group"       : group,
+        "name"        : test_func.__name__,
+        "status"      : "passed" if passed == test_func.test_execnbr else "failed",
+        "duration_ns" : duration,
+        "execnbr"     : test_func.test_execnbr,
+        "iterations"  : executed,
+        "passed"      : passed,
+        "failed"      : executed - passed,
+        "message"     : message,
+        "latency"     : latency.summary() if latency else None
+    }
+    if footprint is not None:
+        result["footprint"] = footprint
+    return result
+
+def record_result(result: RESULT) -> None:
+    """Report the result of a test, or keep it for the parent process if recorded inside a worker process,
+       or for its caller if recorded by an asynchronous test running concurrently with others."""
+    if (pending := TASK_RESULTS.get()) is not None:
+        pending.append(result)
+    elif is_worker():
+        PENDING_RESULTS.append(result)
+    else:
+        report("test_result", result)
+
+def pop_pending_results() -> typing.List[RESULT]:
+    """Retrieve and forget the results recorded so far by the current worker process."""
+    results = PENDING_RESULTS[:]
+    PENDING_RESULTS.clear()
+    return results
+
+def replay_results(results: typing.List[RESULT]) -> None:
+    """Report the results sent back by a worker process."""
+    for result in results:
+        report("test_result", result)
+
+def load_report(path: str) -> typing.Tuple[int, bool, typing.List[RESULT]]:
+    """Load a JSON Lines report written by a JSONLinesReporter, returning the total duration in nanoseconds of its sessions,
+       whether any of them has been interrupted and its tests results. Raises an OSError or a ValueError if unreadable."""
+    (duration, interrupted, results) = (0, False, [])
+    with open(path, 'r', encoding="utf-8") as file:
+        for line in filter(str.strip, file):
+            data  = json.loads(line)
+            event = data.pop("event", None)
+            if event == "test":
+                results.append(data)
+            elif event == "session_end":
+                duration    += data.get("duration_ns", 0)
+                interrupted |= bool(data.get("interrupted"))
+    return (duration, interrupted, results)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
@@ -39,8 +39,16 @@
 from   __future__      import annotations
 import typing
 import io
-import re
-from   pyquicktools.pyquicktest.utils import *
+import ast
+import textwrap
+import os
+import sys
+import types
+import marshal
+import contextlib
+import hashlib
+from   pyquicktools.pyquicktest.utils      import *
+from   pyquicktools.pyquicktest.assertions import TEST_PASSED
 
 # =-----------------------------------= #
 
@@ -67,10 +75,30 @@ __version__      = "0.1.1"
 # Constants & Global variables section #
 #=------------------------------------=#
 
-BS     = '\\'
-DQUOTE = '"'
-LBRCKT = '{'
-RBRCKT = '}'
+# Names of the validator functions whose calls are rewritten.
+CHECK_FUNCS     = ("check", "ensure")
+
+# Validator functions returning from the test body when rewritten, and the check function they are rewritten into.
+ENSURE_FUNCS    = {
+    "ensure"      : "check",      "ensure_eq"   : "check_eq",   "ensure_neq"  : "check_neq",  "ensure_lt"   : "check_lt",
+    "ensure_le"   : "check_le",   "ensure_gt"   : "check_gt",   "ensure_ge"   : "check_ge",   "ensure_and"  : "check_and",
+    "ensure_or"   : "check_or",   "ensure_band" : "check_band", "ensure_bor"  : "check_bor"
+}
+
+# Value displayed for the sub-expressions that weren't evaluated because of a short-circuit.
+NOT_EVALUATED   = "<not evaluated>"
+
+# Exception classes whose handlers catch the TestPassedException, preventing the ok/ensure calls of their try body from being rewritten into returns.
+PASSED_CATCHERS = ("TestPassedException", "Exception", "BaseException")
+
+# Format of the rewritten code objects, part of their cache key.
+REWRITE_FORMAT  = "ast-5"
+
+# Name of the cache subdirectory storing the marshal-serialized rewritten code objects.
+REWRITE_DIR   = "rewrite"
+
+# Memory cache of the rewritten code objects, indexed by their cache key.
+REWRITE_CACHE: typing.Dict[str, types.CodeType] = {}
 
 # =----------------------------------= #
 
@@ -97,74 +125,218 @@ def smart_assertion_print(
     for line in content.split('\n'):
         # removing A = A in the where statement.
         if '=' in line:
-            (A, B) = map1(lambda x: x.replace(' ', "").strip(), line.split('='))
+            (A, B) = map1(lambda x: x.replace(' ', "").strip(), line.split('=', 1))
             if A == B:
                 content = content.replace('\n' + line, "")
 
     print(content, file=file)
 
-def parse_function_call(string: str) -> typing.Optional[str]:
-    """Parse a single lowest function call from a given string expression."""
+def format_where(tab: str, *sources_and_values: typing.Tuple[str, typing.Any]) -> str:
+    """Format the "where" explanation of a failed check, aligning every sub-expression source code with its value."""
+    sources_and_values = tuple(dict(sources_and_values).items())
+    width = max(len(source) for (source, _) in sources_and_values)
+    return "\nwhere\n" + "\n".join(f"{tab}{source}{(width-len(source))*' '} = {value}" for (source, value) in sources_and_values)
+
+class CallHoister(ast.NodeTransformer):
+    "Hoist every function calls of an expression into temporaries using assignment expressions, keeping their evaluation order."
+
+    def __init__(self, counter: int) -> None:
+        self.counter = counter
+        self.hoisted: typing.List[typing.Tuple[str, str]] = []
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        source = ast.unparse(node)
+        self.generic_visit(node)
+        self.counter += 1
+        name = f"__pqt_arg_{self.counter}__"
+        self.hoisted.append((source, name))
+        return ast.NamedExpr(target=ast.Name(id=name, ctx=ast.Store()), value=node)
+
+    def visit_Lambda(self, node: ast.AST) -> ast.AST:
+        # Names bound inside lambdas and comprehensions can't be hoisted out of their scope.
+        return node
+    visit_ListComp = visit_SetComp = visit_DictComp = visit_GeneratorExp = visit_Lambda
+
+def make_thunk(node: ast.expr) -> ast.Lambda:
+    """Wrap a given expression node into a lambda without arguments, so it is only evaluated when called."""
+    return ast.Lambda(args=ast.arguments(posonlyargs=[], args=[], vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]), body=node)
+
+def catches_passed(node: ast.Try) -> bool:
+    """Check if a given try statement catches the TestPassedException, i.e. one of its handlers catches it or one of its base classes."""
+    for handler in node.handlers:
+        types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+        for e in types:
+            if e is None or (e.id if isinstance(e, ast.Name) else e.attr if isinstance(e, ast.Attribute) else None) in PASSED_CATCHERS:
+                return True
+    return False
+
+class CheckRewriter(ast.NodeTransformer):
+    """Rewrite every check/ensure calls statements, lazily appending a \"where\" explanation of their condition sub-calls to their failure message.
+       The ok/ensure calls statements of the test body are also rewritten into returning the TEST_PASSED sentinel, sparing the raising of an exception,
+       unless they are inside a try statement catching the TestPassedException or a with statement, whose handlers or context managers must still see it raised."""
+
+    def __init__(self) -> None:
+        self.counter  = 0
+        self.depth    = 0
+        self.catching = 0
+
+    def visit_FunctionDef(self, node: ast.AST) -> ast.AST:
+        # Keeping track of the nested definitions, whose returns wouldn't leave the test body.
+        self.depth += 1
+        self.generic_visit(node)
+        self.depth -= 1
+        return node
+    visit_AsyncFunctionDef = visit_ClassDef = visit_FunctionDef
+
+    def visit_Try(self, node: ast.Try) -> ast.AST:
+        # Keeping track of the try bodies catching the TestPassedException, whose validations must keep raising it.
+        catching = catches_passed(node)
+        self.catching += catching
+        node.body = [e for statement in node.body for e in self.as_list(self.visit(statement))]
+        self.catching -= catching
+        for field in ("handlers", "orelse", "finalbody"):
+            setattr(node, field, [e for statement in getattr(node, field) for e in self.as_list(self.visit(statement))])
+        return node
+    visit_TryStar = visit_Try
+
+    def visit_With(self, node: ast.AST) -> ast.AST:
+        # The context managers of the with bodies might catch the TestPassedException (i.e. contextlib.suppress), so their validations must keep raising it.
+        node.items     = [self.visit(e) for e in node.items]
+        self.catching += 1
+        node.body      = [e for statement in node.body for e in self.as_list(self.visit(statement))]
+        self.catching -= 1
+        return node
+    visit_AsyncWith = visit_With
+
+    @staticmethod
+    def as_list(node: typing.Union[ast.AST, typing.List[ast.AST]]) -> typing.List[ast.AST]:
+        """Get a visited statement as a list of statements, as the calls statements might be rewritten into several ones."""
+        return node if isinstance(node, list) else [node]
+
+    def visit_Expr(self, node: ast.Expr) -> typing.Union[ast.AST, typing.List[ast.AST]]:
+        # Only calls statements are rewritten.
+        call = node.value
+        if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name)):
+            return self.generic_visit(node)
+
+        # Rewriting the validations of the test body into returns.
+        returns = []
+        if self.depth == 1 and not self.catching and call.func.id == "ok" and not call.args and not call.keywords:
+            return ast.copy_location(ast.Return(value=ast.Name(id="TEST_PASSED", ctx=ast.Load())), node)
+        if self.depth == 1 and not self.catching and call.func.id in ENSURE_FUNCS:
+            call.func.id = ENSURE_FUNCS[call.func.id]
+            returns      = [ast.copy_location(ast.Return(value=ast.Name(id="TEST_PASSED", ctx=ast.Load())), node)]
+
+        # Only check/ensure calls with a condition get an explanation.
+        if not (call.func.id in CHECK_FUNCS and call.args):
+            return [node] + returns
+
+        # Hoisting the condition sub-calls.
+        hoister       = CallHoister(self.counter)
+        call.args[0]  = hoister.visit(call.args[0])
+        self.counter  = hoister.counter
+
+        # Making the error message positional, so the explanation can be appended to it as an extra argument.
+        if len(call.args) == 1:
+            call.args.append(next((e.value for e in call.keywords if e.arg == "error_msg"), ast.Constant(value="")))
+            call.keywords = [e for e in call.keywords if e.arg != "error_msg"]
+
+        # Deferring the formatting of the error message parts until the check actually fails.
+        call.args[1:] = [make_thunk(e) if isinstance(e, ast.JoinedStr) else e for e in call.args[1:]]
+        if not hoister.hoisted:
+            return [node] + returns
+        call.args.append(make_thunk(ast.Call(
+            func=ast.Name(id="format_where", ctx=ast.Load()),
+            args=[ast.Constant(value=node.col_offset*' ')] + [
+                ast.Tuple(elts=[ast.Constant(value=source), ast.Name(id=name, ctx=ast.Load())], ctx=ast.Load()) for (source, name) in hoister.hoisted
+            ],
+            keywords=[]
+        )))
+
+        # Initializing the temporaries beforehand, as short-circuits might skip some of them.
+        init = ast.Assign(targets=[ast.Name(id=name, ctx=ast.Store()) for (_, name) in hoister.hoisted], value=ast.Name(id="NOT_EVALUATED", ctx=ast.Load()))
+        return [ast.copy_location(init, node), node] + returns
+
+def compile_test(test: typing.Callable[[object], object]) -> types.CodeType:
+    """Rewrite the source code of a test function in a single pass over its syntax tree and compile it,
+       returning the code object defining the rewritten function."""
+
+    # Parsing the test source code and retrieving its function definition.
+    tree = ast.parse(textwrap.dedent(test.__rewritten_source__))
+    func = next(e for e in tree.body if isinstance(e, (ast.FunctionDef, ast.AsyncFunctionDef)))
+
+    # Renaming the function and removing its decorators.
+    (func.name, func.decorator_list, tree.body) = (f"rewritten_{test.__name__}", [], [func])
+
+    # Rewriting the check/ensure calls.
+    tree = ast.fix_missing_locations(CheckRewriter().visit(tree))
+
+    # Matching the original file line numbers when the source code wasn't modified (i.e. by parametrize).
+    if test.__rewritten_source__ == test.__source__ and get_code(test).co_name == test.__name__:
+        ast.increment_lineno(tree, get_code(test).co_firstlineno - 1)
+
+    # Compiling the rewritten syntax tree.
+    return compile(tree, get_code(test).co_filename, "exec")
+
+def get_rewrite_key(test: typing.Callable[[object], object]) -> str:
+    """Get the cache key of a test function rewritten code, depending on its source code, its file and its first line number
+       (baked into the code object, see compile_test), the interpreter and the PyQuickTest versions."""
+    return hashlib.sha1("\0".join(
+        (__version__, REWRITE_FORMAT, sys.implementation.cache_tag or "", get_code(test).co_filename, str(get_code(test).co_firstlineno), test.__name__, test.__rewritten_source__)
+    ).encode()).hexdigest()
+
+def get_rewrite_path(test: typing.Callable[[object], object], key: str) -> str:
+    """Get the path of the on-disk cache of a test function rewritten code, stored next to its file.
+       Its name starts with a hash of the test file and name, shared by the previous rewritten codes of the test (see save_rewritten_code)."""
+    filename = os.path.abspath(get_code(test).co_filename)
+    prefix   = hashlib.sha1(f"{filename}\0{test.__name__}".encode()).hexdigest()[:16]
+    return os.path.join(os.path.dirname(filename), CACHE_DIR, REWRITE_DIR, f"{prefix}-{key}.bin")
+
+def load_rewritten_code(path: str) -> typing.Optional[types.CodeType]:
+    """Load a marshal-serialized rewritten code object, returning None if it can't be loaded."""
     try:
-        res = re.findall(r"([\w.]+\(.*?\))", string)[0]
-        while True:
-            temp = re.findall(r"([\w.]+\(.*?\))", '('.join(e for e in res.split('(')[1:]))
-            if temp:
-                res = temp[0]
-            else:
-                break
-        return res
-    except IndexError:
+        with open(path, 'rb') as file:
+            return marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
         return None
 
-def parse_function_calls(string: str) -> typing.Tuple[typing.Dict[str, str], str]:
-    """Parse every function call from a given string expression and returns them, their variable name and the resulting string."""
-    counter = 1
-    out = {}
-    res = parse_function_call(string)
-    while res:
-        arg = f"__GENERATED_ARG_{counter}__"
-        out[arg] = res
-        counter +=1
-        string = string.replace(res, arg)
-        res = parse_function_call(string)
-    return (out, string)
-
-def rewrite_check(check: str) -> typing.Tuple[typing.Dict[str, str], str]:
-    """rewrite a single check instruction, returning it as well as the core rewritten variables."""
-    check = check.replace('\n', "")
-    tab = get_str_tab(check)
-    func = check.split('(')[0].strip()
-    (core, res) = parse_function_calls(check.split(func)[-1])
-    out = ""
-    for key in core:
-        out += f"{tab}{key} = {core[key]}\n"
-    return (core, out + f"{tab}{func}{res}")
-
-def rewrite_test(test: typing.Callable[[object], object], caller_file : typing.Optional[str] = None) -> typing.Callable[[object], object]:
-    """Rewrite a test function."""
-    caller_lib = __import__(caller_file.split('/')[-1].split('\\')[-1].split('.')[0])
-    for name in dir(caller_lib):
-        globals()[name] = getattr(caller_lib, name)
-    new_func_name = f"rewritten_{test.__name__}"
-    src = test.__rewritten_source__
-    src:list[str] = src.replace(test.__name__, new_func_name).split('\n')
-    while not src[0].lstrip().startswith("def"):
-        src.pop(0)
-    src: str = "\n".join(src)
-    res: list[str] = re.findall(r"(\s*(ensure|check)\s?\(.*\))", src)
-    for check in res:
-        temp = check[0].replace('\n', "")
-        tab = get_str_tab(temp)
-        (core, rewritten) = rewrite_check(temp)
-        multi_replaced_values = [multiple_replace(core[key], *[(k, v) for k, v in core.items()], (DQUOTE, BS + DQUOTE)) for key in core]
-        maxlength = max([len(e) for e in multi_replaced_values]) if multi_replaced_values else 0
-        rewritten = rewritten[:-1].rstrip() + f""", "\\nwhere\\n{(BS + 'n').join(
-            f"{tab}{replaced_values_and_key[0]}{(maxlength-len(replaced_values_and_key[0]))*' '} = " 
-          + f"{LBRCKT}{replaced_values_and_key[1]}{RBRCKT}" for replaced_values_and_key in zip(multi_replaced_values, core)
-        )}")"""
-        src = src.replace(temp, rewritten)
-    exec(compile(src, test.__code__.co_filename, "exec"))
-    return locals()[new_func_name]
+def save_rewritten_code(path: str, code: types.CodeType) -> None:
+    """Save a rewritten code object using marshal, atomically and ignoring read-only locations.
+       The stale entries of the same test (i.e. of its previous source codes, see get_rewrite_path) are removed."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.{os.getpid()}.tmp", 'wb') as file:
+            marshal.dump(code, file)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+    except OSError:
+        return
+
+    # Pruning the stale entries of the test.
+    (name, prefix, stale) = (os.path.basename(path), os.path.basename(path).split('-')[0] + '-', [])
+    with contextlib.suppress(OSError), os.scandir(os.path.dirname(path)) as iterator:
+        stale = [entry.path for entry in iterator if entry.name.startswith(prefix) and entry.name != name]
+    for entry in stale:
+        with contextlib.suppress(OSError):
+            os.remove(entry)
+
+def rewrite_test(test: typing.Callable[[object], object], caller_file : typing.Optional[str] = None, use_cache: bool = True) -> typing.Callable[[object], object]:
+    """Rewrite a test function.
+       Unless <use_cache> is False, the rewritten code objects are cached in memory and on disk so unchanged tests skip the rewriting."""
+    caller_lib = import_file(caller_file)
+
+    # Retrieving the rewritten code object from the memory cache, the on-disk cache or by rewriting the test.
+    if use_cache:
+        key  = get_rewrite_key(test)
+        code = REWRITE_CACHE.get(key)
+        if code is None and (code := load_rewritten_code(path := get_rewrite_path(test, key))) is None:
+            save_rewritten_code(path, code := compile_test(test))
+        REWRITE_CACHE[key] = code
+    else:
+        code = compile_test(test)
+
+    # Defining the rewritten function, its global names being the ones of its file.
+    (namespace, ctx) = ({}, {**globals(), **vars(caller_lib)})
+    exec(code, ctx, namespace)
+    return namespace[f"rewritten_{test.__name__}"]
 
 # =----------------------------------------------------------------------------------------------------------------------------------------------= #
\ No newline at end of file
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+     schedule.py is the file containing the duration
+     estimates used to order the work of the workers.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                        import annotations
+import typing
+import statistics
+import zlib
+import heapq
+from   pyquicktools.pyquicktest.report    import get_test_id, get_test_path
+from   pyquicktools.pyquicktest.store     import load_results
+from   pyquicktools.pyquicktest.selection import get_func_id
+from   pyquicktools.pyquicktest.collect   import STATIC_TEST, collect_file, collect_tests
+
+# =------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Duration of a single iteration assumed for the tests never run before, when no other test has been run either.
+DEFAULT_ITERATION_NS = 1_000_000
+
+# =----------------------------------= #
+
+
+#=--------------------------=#
+# Duration estimates section #
+#=--------------------------=#
+
+class DurationEstimator:
+    """Estimator of the duration of the tests and test files, from the durations of their last run in the results store.
+       The tests never run before are estimated from their number of iterations, times the median duration of an iteration
+       of the stored tests [default: DEFAULT_ITERATION_NS]. Used to submit the longest work first to the worker processes,
+       which minimizes the total duration of the session by not leaving a single worker running a long test at its end."""
+
+    def __init__(self, history: typing.Optional[typing.Dict[str, typing.Tuple[str, int, int]]] = None) -> None:
+        history        = load_results() if history is None else history
+        self.durations = {id_: duration for (id_, (_, duration, _)) in history.items()}
+        self.iteration = int(statistics.median(duration/iterations for (_, duration, iterations) in history.values() if iterations > 0)) \
+                         if any(iterations > 0 for (_, _, iterations) in history.values()) else DEFAULT_ITERATION_NS
+
+        # Summing the known durations of the tests of every file.
+        self.files: typing.Dict[str, int] = {}
+        for (id_, duration) in self.durations.items():
+            file = id_.split("::", 1)[0]
+            self.files[file] = self.files.get(file, 0) + duration
+
+    def estimate_iterations(self, execnbr: typing.Any) -> int:
+        """Estimate the duration of a test never run before from its number of iterations, 1 if unknown."""
+        return (execnbr if type(execnbr) == int and execnbr > 0 else 1)*self.iteration
+
+    def estimate_test(self, func: typing.Callable[[object], object], filename: str) -> int:
+        """Estimate the duration in nanoseconds of a given test function of a given file."""
+        return self.durations.get(get_func_id(func, filename)) or self.estimate_iterations(getattr(func, "test_execnbr", 1))
+
+    def estimate_file(self, filename: str) -> int:
+        """Estimate the duration in nanoseconds of a given test file. The files never run before are statically collected."""
+        if (duration := self.files.get(get_test_path(filename))) is not None:
+            return duration
+        return sum(
+            self.durations.get(get_test_id(filename, test["group"], test["name"])) or self.estimate_iterations(test["execnbr"])
+            for test in collect_file(filename)
+        )
+
+    def sort_tests(
+            self,
+            funcs    : typing.List[typing.Tuple[typing.Callable[[object], object], str]],
+            filename : str
+        ) -> typing.List[typing.Tuple[typing.Callable[[object], object], str]]:
+        """Sort the given (test function, indent) pairs of a given file, longest first."""
+        return sorted(funcs, key=lambda x: self.estimate_test(x[0], filename), reverse=True)
+
+    def sort_files(self, filenames: typing.List[str]) -> typing.List[str]:
+        """Sort the given test files, longest first."""
+        return sorted(filenames, key=self.estimate_file, reverse=True)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=----------------=#
+# Sharding section #
+#=----------------=#
+
+class Shard:
+    """Shard <index> (starting from 1) out of <count> of a test suite, sent as is to the worker processes within a test selection.
+       Every test belongs to a single shard: its <assigned> one if any, otherwise the one given by the CRC32 of its id, which is the
+       same on every machine. Running every shard therefore runs every test exactly once, without any coordination between them."""
+
+    def __init__(self, index: int, count: int, assigned: typing.Optional[typing.Dict[str, int]] = None) -> None:
+        self.index    = index
+        self.count    = count
+        self.assigned = assigned or {}
+
+    def get_shard(self, id_: str) -> int:
+        """Get the shard index (starting from 1) of a given test id."""
+        return self.assigned[id_] if id_ in self.assigned else zlib.crc32(id_.encode("utf-8")) % self.count + 1
+
+    def __contains__(self, id_: str) -> bool:
+        return self.get_shard(id_) == self.index
+
+    def has_file(self, filename: str) -> bool:
+        """Check if a given test file may contain tests of this shard, i.e. if any of its statically collected tests belongs to it.
+           Files without statically collected tests, or with tests whose group path can't be statically evaluated, are kept: their
+           tests are then assigned by their runtime id."""
+        tests = collect_file(filename)
+        return not tests or any(not test["static"] or get_test_id(filename, test["group"], test["name"]) in self for test in tests)
+
+def parse_shard(spec: str) -> typing.Tuple[int, int]:
+    """Parse a "index/count" shard specification, raising a ValueError if invalid."""
+    try:
+        (index, count) = (int(e) for e in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard <{spec}>, expected \"index/count\" (e.g. 3/8).") from None
+    if not 1 <= index <= count:
+        raise ValueError(f"Invalid shard <{spec}>, the index must be between 1 and the number of shards.")
+    return (index, count)
+
+def balance_shards(tests: typing.List[STATIC_TEST], count: int, estimator: DurationEstimator) -> typing.Dict[str, int]:
+    """Assign the given statically collected tests to <count> shards of balanced estimated durations.
+       The tests are assigned longest first to the least loaded shard, ties being broken by test id and shard index so that
+       every machine computes the same assignment from the same tests and results store. The tests whose group path can't be
+       statically evaluated aren't assigned, their static id not being their runtime one: they belong to the shard of their id."""
+    tests     = [test for test in tests if test["static"]]
+    ids       = [get_test_id(test["file"], test["group"], test["name"]) for test in tests]
+    estimates = sorted(
+        ((estimator.durations.get(id_) or estimator.estimate_iterations(test["execnbr"]), id_) for (test, id_) in zip(tests, ids)),
+        key=lambda x: (-x[0], x[1])
+    )
+    (shards, assigned) = ([(0, index) for index in range(1, count+1)], {})
+    for (estimate, id_) in estimates:
+        (load, index) = heapq.heappop(shards)
+        assigned[id_] = index
+        heapq.heappush(shards, (load + estimate, index))
+    return assigned
+
+def make_shard(
+        spec     : str,
+        path     : str,
+        include  : typing.Optional[typing.Iterable[str]] = None,
+        exclude  : typing.Optional[typing.Iterable[str]] = None,
+        balanced : bool = False
+    ) -> Shard:
+    """Make the shard of a given "index/count" specification. If <balanced>, the statically collected tests of the given path
+       are assigned to the shards by their durations in the results store, which must then be the same on every machine."""
+    (index, count) = parse_shard(spec)
+    return Shard(index, count, balance_shards(collect_tests(path, include=include, exclude=exclude), count, DurationEstimator()) if balanced else None)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+     selection.py is the file containing the selection
+        and the ordering of the test files and tests.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                        import annotations
+import typing
+import re
+from   pyquicktools.pyquicktest.report   import get_test_id, get_test_path
+from   pyquicktools.pyquicktest.collect  import STATIC_TEST, collect_tests
+
+# =-----------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Regex splitting a selection expression into parentheses and words, i.e. operators and identifiers.
+EXPRESSION_TOKEN = re.compile(r"\s*([()]|[^\s()]+)")
+
+# Operators of the selection expressions, the other words being identifiers.
+EXPRESSION_OPERATORS = ("and", "or", "not")
+
+# =----------------------------------= #
+
+
+#=----------------------=#
+# Test selection section #
+#=----------------------=#
+
+def get_func_id(func: typing.Callable[[object], object], filename: str) -> str:
+    """Get the id of a given test function of a given file."""
+    return get_test_id(filename, getattr(func, "test_group", None), func.__name__)
+
+class TestSelection:
+    """Selection and ordering of the test files and tests to run, sent as is to the worker processes.
+       <only> restricts the tests to the given tests ids, while the tests of <skip> and the test files of <skip_files> aren't run.
+       If a <shard> is given (see schedule.Shard), only its tests are run. The tests of <first> are run before the others of their group.
+       If a <keyword> or <marker> expression is given (see select_expressions), only the matching tests of the test files of <files> are run."""
+
+    def __init__(
+            self,
+            only       : typing.Optional[typing.Iterable[str]] = None,
+            first      : typing.Optional[typing.Iterable[str]] = None,
+            skip       : typing.Optional[typing.Iterable[str]] = None,
+            skip_files : typing.Optional[typing.Iterable[str]] = None,
+            shard      : typing.Optional[typing.Any] = None,
+            keyword    : typing.Optional[str] = None,
+            marker     : typing.Optional[str] = None,
+            files      : typing.Optional[typing.Iterable[str]] = None
+        ) -> None:
+        self.only       = frozenset(only) if only is not None else None
+        self.first      = frozenset(first or ())
+        self.skip       = frozenset(skip or ())
+        self.skip_files = frozenset(skip_files or ())
+        self.shard      = shard
+        self.keyword    = keyword
+        self.marker     = marker
+        self.files      = frozenset(files) if files is not None else None
+
+    def restrict(self, ids: typing.Iterable[str]) -> TestSelection:
+        """Restrict the tests to the given tests ids, on top of the current restriction, and return the selection."""
+        self.only = frozenset(ids) if self.only is None else self.only & frozenset(ids)
+        return self
+
+    def match(self, keyword: typing.Optional[str], marker: typing.Optional[str], files: typing.Iterable[str]) -> TestSelection:
+        """Only run the tests matching a <keyword> and a <marker> expression among the given test files, and return the selection.
+           The expressions are evaluated on the test functions themselves, i.e. on their runtime names, group paths and markers."""
+        (self.keyword, self.marker) = (keyword, marker)
+        self.files = frozenset(files) if self.files is None else self.files & frozenset(files)
+        return self
+
+    def exclude(self, skip: typing.Iterable[str] = (), skip_files: typing.Iterable[str] = ()) -> TestSelection:
+        """Skip the given tests ids and test files, on top of the current skipped ones, and return the selection."""
+        (self.skip, self.skip_files) = (self.skip | frozenset(skip), self.skip_files | frozenset(skip_files))
+        return self
+
+    def select_files(self, filenames: typing.List[str]) -> typing.List[str]:
+        """Select and order the test files to run, the ones containing the <first> tests being run first."""
+        if self.only is not None:
+            files     = {id_.split("::", 1)[0] for id_ in self.only}
+            filenames = [filename for filename in filenames if get_test_path(filename) in files]
+        if self.files is not None:
+            filenames = [filename for filename in filenames if get_test_path(filename) in self.files]
+        if self.skip_files:
+            filenames = [filename for filename in filenames if get_test_path(filename) not in self.skip_files]
+        if self.shard:
+            filenames = [filename for filename in filenames if self.shard.has_file(filename)]
+        files = {id_.split("::", 1)[0] for id_ in self.first}
+        return sorted(filenames, key=lambda filename: get_test_path(filename) not in files)
+
+    def select_tests(self, funcs: typing.List[typing.Callable[[object], object]], filename: str) -> typing.List[typing.Callable[[object], object]]:
+        """Select and order the test functions of a given file, the <first> tests being run first."""
+        if self.only is not None:
+            funcs = [func for func in funcs if get_func_id(func, filename) in self.only]
+        if self.skip:
+            funcs = [func for func in funcs if get_func_id(func, filename) not in self.skip]
+        if self.shard:
+            funcs = [func for func in funcs if get_func_id(func, filename) in self.shard]
+        if self.keyword or self.marker:
+            predicates = [compile_expression(expression, match) for (expression, match) in ((self.keyword, match_keyword), (self.marker, match_marker)) if expression]
+            funcs      = [func for func in funcs if all(predicate(get_func_test(func)) for predicate in predicates)]
+        return sorted(funcs, key=lambda func: get_func_id(func, filename) not in self.first)
+
+    def group_key(self, filename: str) -> typing.Callable[[typing.Callable[[object], object]], typing.List[typing.Tuple[bool, str]]]:
+        """Get the sorting key of the grouped test functions of a given file, which sorts the groups by name
+           but puts the groups and subgroups containing a <first> test ahead, and then the <first> tests themselves."""
+        paths = {tuple(id_.split("::")[1:-1][:k]) for id_ in self.first if get_test_path(filename) == id_.split("::", 1)[0] for k in range(1, id_.count("::"))}
+        def key(func: typing.Callable[[object], object]) -> typing.List[typing.Tuple[bool, str]]:
+            group = list(func.test_group)
+            return [(tuple(group[:k+1]) not in paths, group[k]) for k in range(len(group))] + [(get_func_id(func, filename) not in self.first, "")]
+        return key
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------------=#
+# Selection expressions section #
+#=-----------------------------=#
+
+def compile_expression(expression: str, match: typing.Callable[[str, typing.Any], bool]) -> typing.Callable[[typing.Any], bool]:
+    """Compile a boolean selection expression made of identifiers, "and", "or", "not" and parentheses, e.g. "slow and not (db or network)",
+       into a predicate. Each identifier of the compiled predicate is evaluated by calling <match> with the identifier and the predicate argument.
+       Raises a ValueError if the expression is invalid."""
+
+    # Splitting the expression into tokens.
+    tokens   = EXPRESSION_TOKEN.findall(expression)
+    position = 0
+
+    def error(message: str) -> ValueError:
+        return ValueError(f"Invalid selection expression <{expression}>: {message}.")
+
+    def peek() -> typing.Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        position += 1
+        return tokens[position-1]
+
+    # Parsing the expression by recursive descent, each rule returning the predicate of its part.
+    def parse_or() -> typing.Callable[[typing.Any], bool]:
+        operands = [parse_and()]
+        while peek() == "or":
+            take()
+            operands.append(parse_and())
+        return operands[0] if len(operands) == 1 else lambda x: any(e(x) for e in operands)
+
+    def parse_and() -> typing.Callable[[typing.Any], bool]:
+        operands = [parse_not()]
+        while peek() == "and":
+            take()
+            operands.append(parse_not())
+        return operands[0] if len(operands) == 1 else lambda x: all(e(x) for e in operands)
+
+    def parse_not() -> typing.Callable[[typing.Any], bool]:
+        if peek() == "not":
+            take()
+            operand = parse_not()
+            return lambda x: not operand(x)
+        return parse_atom()
+
+    def parse_atom() -> typing.Callable[[typing.Any], bool]:
+        token = peek()
+        if token is None:
+            raise error("unexpected end")
+        if token == '(':
+            take()
+            operand = parse_or()
+            if peek() != ')':
+                raise error("missing closing parenthesis")
+            take()
+            return operand
+        if token == ')' or token in EXPRESSION_OPERATORS:
+            raise error(f"unexpected <{token}>")
+        identifier = take()
+        return lambda x: match(identifier, x)
+
+    # Parsing the whole expression.
+    predicate = parse_or()
+    if position < len(tokens):
+        raise error(f"unexpected <{tokens[position]}>")
+    return predicate
+
+def get_func_test(func: typing.Callable[[object], object]) -> STATIC_TEST:
+    """Get the name, group path and markers of a given test function, as the ones of a statically collected test."""
+    return {"name": func.__name__, "group": getattr(func, "test_group", None), "markers": vars(func)}
+
+def match_keyword(keyword: str, test: STATIC_TEST) -> bool:
+    """Check if a keyword is a case insensitive substring of the name or of a group of a statically collected test."""
+    keyword = keyword.lower()
+    return keyword in test["name"].lower() or any(keyword in str(e).lower() for e in test["group"] or [])
+
+def match_marker(marker: str, test: STATIC_TEST) -> bool:
+    """Check if a statically collected test has a given marker, i.e. an attribute added by add_flag(s) or add_attribute(s)."""
+    return marker in (test.get("markers") or [])
+
+def select_expressions(
+        path    : str,
+        keyword : typing.Optional[str] = None,
+        marker  : typing.Optional[str] = None,
+        include : typing.Optional[typing.Iterable[str]] = None,
+        exclude : typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Set[str]:
+    """Get the test files of a given file or directory which may contain tests matching both a <keyword> expression over their names
+       and groups, and a <marker> expression over their markers (see TestSelection.match). Both expressions are evaluated over the static
+       tests index, so no test files are imported, the files of the tests whose group path or markers can't be statically evaluated being
+       kept. Raises a ValueError if an expression is invalid."""
+    predicates = [compile_expression(expression, match) for (expression, match) in ((keyword, match_keyword), (marker, match_marker)) if expression]
+    return {
+        get_test_path(test["file"]) for test in collect_tests(path, include=include, exclude=exclude)
+        if not test["static"] or all(predicate(test) for predicate in predicates)
+    }
+
+# =-----------------------------------------------------------------------------------------------------------------= #
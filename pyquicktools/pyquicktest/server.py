@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+     server.py is the file containing the pre-forked
+       test server and its client, sparing the import
+       of the shared dependencies to every test runs.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                       import annotations
+import typing
+import os
+import sys
+import ast
+import json
+import socket
+import struct
+import hashlib
+import tempfile
+import threading
+import traceback
+import importlib
+import importlib.util
+from   pyquicktools.pyquicktest.utils   import CACHE_DIR, get_cache_dir
+from   pyquicktools.pyquicktest.collect import discover_test_files
+
+# =----------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Name of the Unix socket the test server listens to, in the cache directory of the current working directory.
+SERVER_SOCKET = "server.sock"
+
+# Header of the frames of the server responses, i.e. their type and the length of their payload.
+FRAME_HEADER  = struct.Struct(">cI")
+
+# Types of the frames carrying a part of the output of a test run and its exit code, the last frame of a response.
+OUTPUT_FRAME  = b'o'
+EXIT_FRAME    = b'x'
+
+# =----------------------------------= #
+
+
+#=-------------------=#
+# Test server section #
+#=-------------------=#
+
+def get_socket_path(root: typing.Optional[str] = None) -> str:
+    """Get the path of the test server socket of a given root directory [default: the current working directory].
+       A temporary path is used instead if the cache one is too long for a Unix socket."""
+    root = os.path.abspath(root if root else '.')
+    path = os.path.join(root, CACHE_DIR, SERVER_SOCKET)
+    if len(path.encode()) < 100:
+        return path
+    return os.path.join(tempfile.gettempdir(), f"pqt-{hashlib.sha1(root.encode()).hexdigest()[:16]}.sock")
+
+def get_shared_dependencies(path: str, root: str) -> typing.List[str]:
+    """Statically get the modules, by their full dotted names, imported by the test files of a given path that aren't part of the project under <root>,
+       i.e. the installed and standard modules, which are not expected to change between runs."""
+    names = set()
+    for filename in discover_test_files(path) if os.path.isdir(path) else [path]:
+        try:
+            with open(filename, 'rb') as file:
+                tree = ast.parse(file.read())
+        except (OSError, SyntaxError, ValueError):
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names.add(node.module)
+
+    # Locating the top-level packages only, as locating a submodule imports its parent packages.
+    shared = {}
+    for name in sorted(names):
+        top = name.split('.')[0]
+        if top not in shared:
+            try:
+                spec = importlib.util.find_spec(top)
+            except (ImportError, ValueError):
+                spec = None
+            shared[top] = bool(spec) and not (spec.has_location and os.path.abspath(spec.origin).startswith(os.path.join(root, '')))
+    return [name for name in sorted(names) if shared[name.split('.')[0]]]
+
+def preload_module(name: str) -> typing.Optional[str]:
+    """Import a module by its full dotted name, falling back on its parent packages if it can't be imported,
+       and return the name of the imported one, or <None> if even its top-level package can't be imported."""
+    while name:
+        try:
+            importlib.import_module(name)
+            return name
+        except Exception:
+            name = name.rpartition('.')[0]
+    return None
+
+def run_request(output: int, request: typing.Dict[str, typing.Any]) -> None:
+    """Run a test request inside a freshly forked child process, its output being written to a given file descriptor. Never returns."""
+    from pyquicktools.cli import main
+    code = 1
+    try:
+        # Running the request from the client directory and environment.
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = ["pqt"] + request["argv"]
+
+        # Writing the standard outputs to the given file descriptor, relayed to the client by the server.
+        os.dup2(output, 1)
+        os.dup2(output, 2)
+        os.close(output)
+        try:
+            main()
+            code = 0
+        except SystemExit as e:
+            code = e.code if type(e.code) == int else (0 if e.code is None else 1)
+        except BaseException:
+            traceback.print_exc()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(code)
+
+def send_frame(connection: socket.socket, type_: bytes, payload: bytes) -> bool:
+    """Send a frame of a given type and payload to a client, returning if it has been sent (i.e. the client is still connected)."""
+    try:
+        connection.sendall(FRAME_HEADER.pack(type_, len(payload)) + payload)
+        return True
+    except OSError:
+        return False
+
+def relay_request(pid: int, output: int, connection: socket.socket) -> None:
+    """Relay the output of the child process running a test request to the client as output frames until the child and its own children
+       close it, then wait for the child and send its exit code as the exit frame before closing the connection.
+       The output is still read if the client disconnects, so the child never blocks on writing it."""
+    connected = True
+    with open(output, 'rb', buffering=0) as file:
+        while data := file.read(65536):
+            connected = connected and send_frame(connection, OUTPUT_FRAME, data)
+    (_, status) = os.waitpid(pid, 0)
+    if connected:
+        send_frame(connection, EXIT_FRAME, str(os.waitstatus_to_exitcode(status)).encode())
+    connection.close()
+
+def serve(path: typing.Optional[str] = None) -> None:
+    """Serve the test runs of the current working directory until interrupted.
+       The shared dependencies of the test files of <path> are imported once, then every run is executed in a fork of this process,
+       inheriting them copy-on-write. The project modules are left to the forked processes, so they always see the last changes."""
+
+    # Preloading the shared dependencies.
+    root    = os.getcwd()
+    modules = set()
+    for name in get_shared_dependencies(os.path.abspath(path if path else '.'), root):
+        if (module := preload_module(name)) is not None:
+            modules.add(module)
+
+    # Listening to the server socket, removing a previous one left behind.
+    get_cache_dir(root)
+    socket_path = get_socket_path(root)
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    server.listen()
+    print(f"\033[90mServing the test runs of {root} on {socket_path}, with {len(modules)} preloaded module{'s' if len(modules) > 1 else ''}.\033[00m", flush=True)
+
+    try:
+        while True:
+            # Reading the request of a client, i.e. its command line arguments, directory and environment as a JSON line.
+            (connection, _) = server.accept()
+            with connection.makefile('rb') as file:
+                try:
+                    request = json.loads(file.readline())
+                except ValueError:
+                    connection.close()
+                    continue
+
+            # Running the request in a forked child process, whose output is relayed to the client.
+            sys.stdout.flush()
+            sys.stderr.flush()
+            (reader, writer) = os.pipe()
+            if (pid := os.fork()) == 0:
+                server.close()
+                connection.close()
+                os.close(reader)
+                run_request(writer, request)
+            os.close(writer)
+            threading.Thread(target=relay_request, args=(pid, reader, connection), daemon=True).start()
+
+    except KeyboardInterrupt:
+        print("\n\033[01mTest server stopped.\033[00m")
+
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-------------------=#
+# Test client section #
+#=-------------------=#
+
+def request_server(argv: typing.List[str], root: typing.Optional[str] = None) -> typing.Optional[int]:
+    """Run the given command line arguments on the test server of a given root directory [default: the current working directory],
+       printing its output as it comes. Returns the exit code of the run, or <None> if there is no running server."""
+
+    # Connecting to the server, if any.
+    socket_path = get_socket_path(root)
+    if not os.path.exists(socket_path):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None
+
+    with client:
+        # Sending the request.
+        client.sendall(json.dumps({"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}).encode() + b'\n')
+
+        # Printing the output frames until the exit frame, the run failing if the server closes the connection before.
+        with client.makefile('rb') as file:
+            while len(header := file.read(FRAME_HEADER.size)) == FRAME_HEADER.size:
+                (type_, length) = FRAME_HEADER.unpack(header)
+                if len(payload := file.read(length)) < length:
+                    break
+                if type_ == EXIT_FRAME:
+                    return int(payload)
+                sys.stdout.buffer.write(payload)
+                sys.stdout.buffer.flush()
+    return 1
+
+# =-----------------------------------------------------------------------------------------------------------------= #
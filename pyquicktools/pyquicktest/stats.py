@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+      stats.py is the file containing the latency
+      histogram of the iterations of a single test.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                     import annotations
+import typing
+import math
+import time
+import operator
+import itertools
+import collections
+from   pyquicktools.pyquicktest.utils import format_time_unit
+
+# =-------------------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Number of bits of the durations kept exact by the histogram buckets, i.e. 16 linear buckets per power of two,
+# bounding the relative error of the computed percentiles to 1/16th whatever the durations scale.
+SUB_BITS    = 4
+SUB_BUCKETS = 1 << SUB_BITS
+
+# Number of pending durations of a histogram triggering their bucketing.
+FLUSH_SIZE  = 4096
+
+# Percentiles reported by the latency summaries.
+PERCENTILES = {"median_ns": 0.5, "p95_ns": 0.95, "p99_ns": 0.99}
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Latency histogram section #
+#=-------------------------=#
+
+def get_bucket(duration: int) -> int:
+    """Get the log-linear bucket of a duration in nanoseconds. The durations lower than 2*SUB_BUCKETS have their own bucket, the greater ones
+       share a bucket with the durations having the same SUB_BITS+1 most significant bits."""
+    if duration < 2*SUB_BUCKETS:
+        return max(duration, 0)
+    shift = duration.bit_length() - SUB_BITS - 1
+    return (shift << SUB_BITS) + (duration >> shift)
+
+def get_bucket_value(bucket: int) -> int:
+    """Get the duration in nanoseconds representing a given bucket, i.e. the middle of its durations range."""
+    if bucket < 2*SUB_BUCKETS:
+        return bucket
+    shift = (bucket >> SUB_BITS) - 1
+    return ((bucket - (shift << SUB_BITS)) << shift) + (1 << shift)//2
+
+def format_duration(duration: int) -> str:
+    """Format a duration in nanoseconds, including the null one."""
+    return format_time_unit(duration, unit="ns") if duration > 0 else "0ns"
+
+class LatencyHistogram:
+    """Compact histogram of the durations of the iterations of a test, counting them by log-linear buckets so its size doesn't depend
+       on the number of iterations. The extrema, the mean and the standard deviation are exact, only the percentiles are approximated.
+       To keep the per-iteration overhead to a single clock read, the iterations loops only append the timestamp of the end of every
+       iteration to the <pending> list (see start), the durations being computed and bucketed by bulk every FLUSH_SIZE iterations.
+       Histograms of different iterations chunks of the same test can be merged."""
+
+    __slots__ = ("pending", "first", "buckets", "count", "total", "squares", "min", "max", "slowest")
+
+    def __init__(self, first: int = 0) -> None:
+        self.pending : typing.List[int] = []
+        self.first   = first
+        self.buckets : typing.Dict[int, int] = {}
+        self.count   = 0
+        self.total   = 0
+        self.squares = 0
+        self.min     = 0
+        self.max     = -1
+        self.slowest = None
+
+    def start(self) -> None:
+        """Start timing the next iteration now, excluding the time elapsed since the previous iteration. The pending iterations are bucketed first,
+           so the end timestamp of the previous iteration is only (re)set once its duration has been computed."""
+        if self.flush().pending:
+            self.pending[-1] = time.perf_counter_ns()
+        else:
+            self.pending.append(time.perf_counter_ns())
+
+    def flush(self) -> LatencyHistogram:
+        """Bucket the pending iterations, the first one being the iteration <first> + <count>, and return the histogram."""
+        if len(pending := self.pending) < 2:
+            return self
+
+        # Working on the distinct durations only, as the durations of quick iterations are mostly the same.
+        durations = list(map(operator.sub, itertools.islice(pending, 1, None), pending))
+        distinct  = collections.Counter(durations)
+        for (duration, number) in distinct.items():
+            bucket = get_bucket(duration)
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + number
+            self.total   += number*duration
+            self.squares += number*duration*duration
+
+        # Updating the extrema, only searching the slowest iteration index if required.
+        if (longest := max(distinct)) > self.max:
+            (self.max, self.slowest) = (longest, self.first + self.count + durations.index(longest))
+        if (shortest := min(distinct)) < self.min or not self.count:
+            self.min = shortest
+        self.count += len(durations)
+
+        # Keeping the last timestamp as the start of the next iteration.
+        del pending[:-1]
+        return self
+
+    def add(self, duration: int, iteration: int) -> None:
+        """Add the duration in nanoseconds of a given iteration, i.e. of the concurrent iterations which don't end one after the other."""
+        bucket = get_bucket(duration)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.total   += duration
+        self.squares += duration*duration
+        if duration > self.max:
+            (self.max, self.slowest) = (duration, iteration)
+        if duration < self.min or not self.count:
+            self.min = duration
+        self.count += 1
+
+    def merge(self, other: LatencyHistogram) -> LatencyHistogram:
+        """Merge another histogram into this one, and return it."""
+        self.flush()
+        other.flush()
+        for (bucket, number) in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + number
+        if other.count and (not self.count or other.min < self.min):
+            self.min = other.min
+        if other.max > self.max:
+            (self.max, self.slowest) = (other.max, other.slowest)
+        self.count   += other.count
+        self.total   += other.total
+        self.squares += other.squares
+        return self
+
+    def percentile(self, q: float) -> int:
+        """Get the approximated <q> percentile, in [0, 1], of the durations in nanoseconds."""
+        self.flush()
+        (rank, seen) = (max(1, math.ceil(q*self.count)), 0)
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(max(get_bucket_value(bucket), self.min), self.max)
+        return self.max
+
+    def stddev(self) -> float:
+        """Get the standard deviation of the durations in nanoseconds."""
+        self.flush()
+        return math.sqrt(max(self.count*self.squares - self.total*self.total, 0))/self.count if self.count else 0.0
+
+    def summary(self) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """Summarize the durations, as reported with the tests results. Returns <None> if no iterations have been added."""
+        if not self.flush().count:
+            return None
+        return {
+            "min_ns"            : self.min,
+            **{key: self.percentile(q) for (key, q) in PERCENTILES.items()},
+            "max_ns"            : self.max,
+            "mean_ns"           : self.total//self.count,
+            "stddev_ns"         : round(self.stddev()),
+            "slowest_iteration" : self.slowest
+        }
+
+    def format(self) -> str:
+        """Format the summary of the durations in a single line."""
+        summary = self.summary() or {}
+        return " | ".join([
+            f"min {format_duration(summary.get('min_ns', 0))}",
+            f"median {format_duration(summary.get('median_ns', 0))}",
+            f"p95 {format_duration(summary.get('p95_ns', 0))}",
+            f"p99 {format_duration(summary.get('p99_ns', 0))}",
+            f"max {format_duration(summary.get('max_ns', 0))} (#{(summary.get('slowest_iteration') or 0)+1})",
+            f"stddev {format_duration(summary.get('stddev_ns', 0))}"
+        ])
+
+# =-----------------------------------------------------------------------------------------------------------------= #
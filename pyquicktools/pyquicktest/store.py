@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+      store.py is the file containing the persistent
+        store of the tests results of previous runs.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                        import annotations
+import typing
+import os
+import time
+import sqlite3
+import contextlib
+from   pyquicktools.pyquicktest.utils    import CACHE_DIR, get_cache_dir
+from   pyquicktools.pyquicktest.report   import Reporter, RESULT
+
+# =-----------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Name of the SQLite database storing the tests results, in the cache directory of the current working directory.
+STORE_FILE   = "results.sqlite3"
+
+# Schema of the tests results table, keyed by the tests ids (i.e. "file::group::name").
+STORE_SCHEMA = """CREATE TABLE IF NOT EXISTS results (
+    id          TEXT PRIMARY KEY,
+    file        TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    duration_ns INTEGER NOT NULL,
+    iterations  INTEGER NOT NULL,
+    passed      INTEGER NOT NULL,
+    last_run    REAL NOT NULL
+)"""
+
+# Schema of the tests footprints table, i.e. the project source files executed by each test during a recording run.
+IMPACT_SCHEMA = """CREATE TABLE IF NOT EXISTS impact (
+    id   TEXT NOT NULL,
+    file TEXT NOT NULL,
+    PRIMARY KEY (id, file)
+)"""
+
+# Number of tests results written to the results store per transaction, keeping the write lock short for the concurrent runs.
+STORE_BATCH  = 64
+
+# =----------------------------------= #
+
+
+#=--------------------=#
+# Result store section #
+#=--------------------=#
+
+def open_store(root: typing.Optional[str] = None) -> sqlite3.Connection:
+    """Open the results store of a given root directory [default: the current working directory], creating it if required."""
+    connection = sqlite3.connect(os.path.join(get_cache_dir(root), STORE_FILE), timeout=30)
+    connection.execute(STORE_SCHEMA)
+    connection.execute(IMPACT_SCHEMA)
+    return connection
+
+def has_store(root: typing.Optional[str] = None) -> bool:
+    """Check if a given root directory [default: the current working directory] has a results store."""
+    return os.path.isfile(os.path.join(os.path.abspath(root if root else '.'), CACHE_DIR, STORE_FILE))
+
+def load_results(root: typing.Optional[str] = None) -> typing.Dict[str, typing.Tuple[str, int, int]]:
+    """Load the last (status, duration in nanoseconds, number of iterations) result of every stored tests, indexed by test id.
+       An empty dictionary is returned if there is no readable store."""
+    if not has_store(root):
+        return {}
+    try:
+        with contextlib.closing(open_store(root)) as connection:
+            return {id_: (status, duration, iterations) for (id_, status, duration, iterations) in connection.execute("SELECT id, status, duration_ns, iterations FROM results")}
+    except sqlite3.Error:
+        return {}
+
+def load_footprints(root: typing.Optional[str] = None) -> typing.Dict[str, typing.Set[str]]:
+    """Load the recorded footprint of every stored tests, i.e. the source files they executed, indexed by test id.
+       An empty dictionary is returned if there is no readable store."""
+    footprints = {}
+    if not has_store(root):
+        return footprints
+    try:
+        with contextlib.closing(open_store(root)) as connection:
+            for (id_, file) in connection.execute("SELECT id, file FROM impact"):
+                footprints.setdefault(id_, set()).add(file)
+    except sqlite3.Error:
+        return {}
+    return footprints
+
+def get_failed_ids(root: typing.Optional[str] = None) -> typing.Set[str]:
+    """Get the ids of the tests that failed during their last run."""
+    return {id_ for (id_, (status, _, _)) in load_results(root).items() if status != "passed"}
+
+class ResultStore(Reporter):
+    """Reporter persisting every tests results into the results store, written by batches of STORE_BATCH results in short transactions
+       so concurrent runs in the same directory (i.e. other shards or a watch mode) only wait for each other briefly.
+       The footprint of the tests, if recorded, replaces their previous one. As the store is only a cache,
+       an unusable one (e.g. locked for too long or read-only) is reported once and ignored instead of stopping the test session."""
+
+    def __init__(self, root: typing.Optional[str] = None) -> None:
+        (self.pending, self.connection) = ([], None)
+        try:
+            self.connection = open_store(root)
+        except (sqlite3.Error, OSError) as e:
+            self.disable(e)
+
+    def disable(self, error: Exception) -> None:
+        """Stop using the results store after a given error, printing it."""
+        print(f"\033[93mThe results store is unusable and won't be updated: {error}\033[00m")
+        self.pending.clear()
+        if self.connection is not None:
+            self.connection.close()
+        self.connection = None
+
+    def test_result(self, result: RESULT) -> None:
+        if self.connection is None:
+            return
+        self.pending.append(result)
+        if len(self.pending) >= STORE_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending results into the results store, in a single transaction."""
+        if self.connection is None or not self.pending:
+            return
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((result["id"], result["file"], result["status"], result["duration_ns"], result["iterations"], result["passed"], time.time()) for result in self.pending)
+                )
+                for result in self.pending:
+                    if "footprint" in result:
+                        self.connection.execute("DELETE FROM impact WHERE id = ?", (result["id"],))
+                        self.connection.executemany("INSERT INTO impact VALUES (?, ?)", ((result["id"], file) for file in result["footprint"]))
+            self.pending.clear()
+        except sqlite3.Error as e:
+            self.disable(e)
+
+    def session_end(self, info: typing.Dict[str, typing.Any]) -> None:
+        self.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+# =-----------------------------------------------------------------------------------------------------------------= #
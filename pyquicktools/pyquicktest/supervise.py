@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+      supervise.py is the file containing the pool
+       of reused threads and the supervised worker
+    processes enforcing the timeouts of the functions.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                          import annotations
+import typing
+import os
+import sys
+import threading
+import collections
+import multiprocessing
+from   pyquicktools.pyquicktest.assertions import TEST_PASSED, TestFailedException, TestInvalidException, TestTimeoutException
+from   pyquicktools.pyquicktest.parallel   import get_mp_context, init_worker
+
+# =-------------------------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Number of idle threads kept for reuse by the pool running the calls having a timeout.
+THREAD_POOL_SIZE = 4
+
+# Timeout modes of the tests, the process one being the default (see pqt_timeout).
+TIMEOUT_MODES    = ("process", "thread")
+
+# =----------------------------------= #
+
+
+#=-----------------------=#
+# Timeout threads section #
+#=-----------------------=#
+
+class TimeoutCall:
+    """Call submitted to the timeout threads, running with the trace function of its caller (i.e. the footprint tracer)."""
+    __slots__ = ("func", "name", "trace", "done", "started", "abandoned", "result", "error")
+
+    def __init__(self, func: typing.Callable[[], typing.Any], name: str) -> None:
+        self.func      = func
+        self.name      = name
+        self.trace     = sys.gettrace()
+        self.done      = threading.Event()
+        self.started   = False
+        self.abandoned = False
+        self.result    = None
+        self.error     = None
+
+class TimeoutThreadPool:
+    """Pool of daemon threads running calls with a timeout, the threads being created on demand and at most <size> idle ones being kept for reuse.
+       A thread can't be killed, so a call exceeding its timeout is abandoned: its thread leaves the pool, which starts a new one if required,
+       and keeps running it, only rejoining the pool once it returns if the pool isn't full. Thus the stuck threads never starve the new calls,
+       the abandoned calls still running being reported as they keep burning CPU."""
+
+    def __init__(self, size: int = THREAD_POOL_SIZE) -> None:
+        self.size      = size
+        self.condition = threading.Condition()
+        self.calls     = collections.deque()
+        self.threads   = 0
+        self.busy      = 0
+        self.abandoned = []
+
+    def call(self, func: typing.Callable[[], typing.Any], duration: float, name: typing.Optional[str] = None) -> typing.Any:
+        """Call a given function in a pool thread, returning its result or raising its exception.
+           A TestTimeoutException is raised if it doesn't return within <duration> seconds, the call being abandoned."""
+        call = TimeoutCall(func, name or getattr(func, "__name__", repr(func)))
+
+        # Queuing the call, and starting a new thread if every thread of the pool is busy.
+        with self.condition:
+            self.calls.append(call)
+            if self.threads - self.busy < len(self.calls):
+                self.threads += 1
+                threading.Thread(target=self.run, daemon=True, name=f"pqt-timeout-{self.threads}").start()
+            self.condition.notify()
+
+        # Abandoning the call if it timed out, its thread leaving the pool, or just removing it if it didn't even start.
+        if not call.done.wait(duration):
+            with self.condition:
+                if not call.done.is_set():
+                    if call.started:
+                        call.abandoned = True
+                        self.abandoned.append(call)
+                        self.threads  -= 1
+                        self.busy     -= 1
+                    else:
+                        self.calls.remove(call)
+                    raise TestTimeoutException(f"Timeout after {duration} seconds. {self.describe()}")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def run(self) -> None:
+        """Run the queued calls in one of the pool threads, until it has been abandoned or is idle while the pool is full."""
+        while True:
+            with self.condition:
+                while not self.calls:
+                    self.condition.wait()
+                call         = self.calls.popleft()
+                call.started = True
+                self.busy   += 1
+
+            # Running the call, with the trace function of its caller.
+            sys.settrace(call.trace)
+            try:
+                call.result = call.func()
+            except BaseException as e:
+                call.error  = e
+            finally:
+                sys.settrace(None)
+
+            # Rejoining the pool once an abandoned call returns, or leaving it if it would keep too many idle threads.
+            with self.condition:
+                call.done.set()
+                if call.abandoned:
+                    self.abandoned.remove(call)
+                    if self.threads - self.busy >= self.size:
+                        return
+                    self.threads += 1
+                else:
+                    self.busy -= 1
+                    if self.threads - self.busy > self.size and not self.calls:
+                        self.threads -= 1
+                        return
+
+    def get_abandoned(self) -> typing.List[str]:
+        """Get the names of the abandoned calls still running."""
+        with self.condition:
+            return [call.name for call in self.abandoned]
+
+    def describe(self) -> str:
+        """Describe the abandoned calls still running, which keep burning CPU and skew the timings of the next ones."""
+        abandoned = self.get_abandoned()
+        if not abandoned:
+            return "No abandoned call is still running."
+        return (f"{len(abandoned)} timeout thread{'s are' if len(abandoned) > 1 else ' is'} stuck running abandoned calls "
+                f"({', '.join(sorted(set(abandoned)))}), the following timings might be skewed.")
+
+    def reset(self) -> None:
+        """Reset the pool in a forked child process, which doesn't inherit its threads but might inherit its lock held."""
+        self.__init__(self.size)
+
+# Timeout threads shared by every functions of the process.
+TIMEOUT_THREADS = TimeoutThreadPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=TIMEOUT_THREADS.reset)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------------------=#
+# Supervised worker processes section #
+#=-----------------------------------=#
+
+def supervised_worker(
+        connection : multiprocessing.connection.Connection,
+        parent     : multiprocessing.connection.Connection,
+        func       : typing.Callable[[], typing.Any]
+    ) -> None:
+    """Call a given function each time the parent process asks for it, sending back how it ended, until the connection is closed.
+       The inherited <parent> end of the connection is closed first, so the parent closing its own end is seen."""
+    parent.close()
+    init_worker()
+    while True:
+        try:
+            connection.recv()
+        except EOFError:
+            return
+
+        # Sending back the TEST_PASSED sentinel as a flag, as its identity doesn't survive the pickling.
+        try:
+            message = ("passed", None) if func() is TEST_PASSED else ("returned", None)
+        except BaseException as e:
+            message = ("raised", e)
+        try:
+            connection.send(message)
+        except Exception:
+            connection.send(("raised", TestInvalidException(repr(message[1]))))
+
+class SupervisedWorker:
+    """Worker process calling a single function for its parent, killed and replaced by a new one as soon as a call exceeds its timeout.
+       The worker is forked, so it inherits the function without pickling it, only the way each call ended being sent back.
+       Used as a context manager, the worker is stopped on exit."""
+
+    def __init__(self, func: typing.Callable[[], typing.Any]) -> None:
+        self.func       = func
+        self.process    = None
+        self.connection = None
+        self.exitcode   = None
+
+    def start(self) -> None:
+        """Start a new worker process."""
+        (self.connection, child) = multiprocessing.Pipe()
+        self.process = get_mp_context().Process(target=supervised_worker, args=(child, self.connection, self.func), name="pqt-supervised")
+        self.process.start()
+        child.close()
+
+    def call(self, duration: float) -> typing.Any:
+        """Call the function in the worker process, returning the TEST_PASSED sentinel if it returned it or else <None>, or raising its exception.
+           A TestTimeoutException is raised if it doesn't return within <duration> seconds, the worker being killed."""
+        if self.process is None:
+            self.start()
+        self.connection.send(None)
+
+        # Killing the worker if the call timed out or if it died during it.
+        if not self.connection.poll(duration):
+            self.stop(kill=True)
+            raise TestTimeoutException(f"Timeout after {duration} seconds, the worker process running it has been killed.")
+        try:
+            (status, value) = self.connection.recv()
+        except EOFError:
+            self.stop(kill=True)
+            raise TestFailedException(f"The worker process running it died with the exit code {self.exitcode}.") from None
+        if status == "raised":
+            raise value
+        return TEST_PASSED if status == "passed" else None
+
+    def stop(self, kill: bool = False) -> None:
+        """Stop the worker process, letting it exit by closing its connection unless <kill> is True."""
+        if self.process is None:
+            return
+        if kill:
+            self.process.kill()
+        self.connection.close()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        (self.exitcode, self.process, self.connection) = (self.process.exitcode, None, None)
+
+    def __enter__(self) -> SupervisedWorker:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.stop()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Timeout runners section #
+#=-----------------------=#
+
+def get_timeout_mode(test_func: typing.Callable[[object], object], tracing: bool = False) -> str:
+    """Get the timeout mode of a test function. The process mode falls back on the thread one when the processes can't be forked
+       (i.e. from a daemonic process), or when the test is traced (i.e. its footprint is recorded) as the tracer can't follow it into another process."""
+    mode = getattr(test_func, "test_timeout_mode", "process")
+    if mode == "process" and (tracing or "fork" not in multiprocessing.get_all_start_methods() or multiprocessing.current_process().daemon):
+        return "thread"
+    return mode
+
+class TimeoutRunner:
+    """Runner of the iterations of a test function having a timeout (see pqt_timeout), used as a context manager around them.
+       Calling it runs a single iteration of the rewritten test, raising a TestTimeoutException if it exceeds the test timeout."""
+
+    def __init__(self, test_func: typing.Callable[[object], object], rewritten_func: typing.Callable[[object], object], tracing: bool = False) -> None:
+        self.func     = rewritten_func
+        self.name     = test_func.__name__
+        self.duration = test_func.test_timeout
+        self.mode     = get_timeout_mode(test_func, tracing=tracing)
+        self.worker   = SupervisedWorker(rewritten_func) if self.mode == "process" else None
+
+    def __call__(self) -> typing.Any:
+        if self.worker is not None:
+            return self.worker.call(self.duration)
+        return TIMEOUT_THREADS.call(self.func, self.duration, self.name)
+
+    def __enter__(self) -> TimeoutRunner:
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        if self.worker is not None:
+            self.worker.stop()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
@@ -40,11 +40,26 @@ import typing
 import platform
 import os
 import time
-from pyquicktools.pyquicktest.utils      import *
-from pyquicktools.pyquicktest.decorators import *
-from pyquicktools.pyquicktest.gen        import *
-from pyquicktools.pyquicktest.assertions import *
-from pyquicktools.pyquicktest.rewrite    import *
+import traceback
+import asyncio
+import contextlib
+import concurrent.futures
+from pyquicktools.pyquicktest.utils        import *
+from pyquicktools.pyquicktest.decorators   import *
+from pyquicktools.pyquicktest.gen          import *
+from pyquicktools.pyquicktest.assertions   import *
+from pyquicktools.pyquicktest.rewrite      import *
+from pyquicktools.pyquicktest.parallel     import *
+from pyquicktools.pyquicktest.supervise    import *
+from pyquicktools.pyquicktest.asynchronous import *
+from pyquicktools.pyquicktest.collect      import *
+from pyquicktools.pyquicktest.render       import *
+from pyquicktools.pyquicktest.stats        import *
+from pyquicktools.pyquicktest.report       import *
+from pyquicktools.pyquicktest.selection    import *
+from pyquicktools.pyquicktest.impact       import *
+from pyquicktools.pyquicktest.schedule     import *
+from pyquicktools.pyquicktest.tree         import *
 
 # =----------------------------------------= #
 
@@ -78,9 +93,62 @@ DQUOTE = '"'
 LBRCKT = '{'
 RBRCKT = '}'
 
+# Environment variable holding the maximum number of failed tests of a session, inherited by the worker processes.
+MAXFAIL_ENV = "PQT_MAXFAIL"
+
+# Numbers of run and failed tests of the current session.
+RUN_COUNTER    = 0
+FAILED_COUNTER = 0
+
 # =----------------------------------= #
 
 
+#=-----------------------=#
+# Session control section #
+#=-----------------------=#
+
+def set_maxfail(maxfail: int) -> None:
+    """Stop the following test sessions once <maxfail> tests failed, 0 meaning never, for the current process and its future worker processes."""
+    os.environ[MAXFAIL_ENV] = str(maxfail)
+
+def get_maxfail() -> int:
+    """Get the maximum number of failed tests of a session, 0 meaning no limit."""
+    try:
+        return int(os.environ.get(MAXFAIL_ENV, 0))
+    except ValueError:
+        return 0
+
+def reset_failures() -> None:
+    """Reset the numbers of run and failed tests at the start of a session."""
+    global RUN_COUNTER, FAILED_COUNTER
+    (RUN_COUNTER, FAILED_COUNTER) = (0, 0)
+
+def count_run() -> None:
+    """Add a test to the number of run tests of the session, i.e. of the tests not skipped by a stopped session."""
+    global RUN_COUNTER
+    RUN_COUNTER += 1
+
+def count_failures(failed: typing.List[str]) -> None:
+    """Add the given failed tests to the number of failed tests of the session."""
+    global FAILED_COUNTER
+    FAILED_COUNTER += len(failed)
+
+def should_stop() -> bool:
+    """Check if the session must stop, i.e. if the maximum number of failed tests is reached."""
+    return 0 < get_maxfail() <= FAILED_COUNTER
+
+def should_stop_iterations(test_func: typing.Callable[[object], object]) -> bool:
+    """Check if the remaining iterations of a failing test must be skipped, i.e. if the test stops on its first failure
+       or if it is the failure reaching the maximum number of failed tests."""
+    return getattr(test_func, "test_stop_on_first_failure", False) or 0 < get_maxfail() <= FAILED_COUNTER + 1
+
+def print_stopped() -> None:
+    """Print that the session stopped early."""
+    print(f"\033[91mStopping the session after {FAILED_COUNTER} failed test{'s' if FAILED_COUNTER > 1 else ''} (maxfail: {get_maxfail()}).\033[00m\n")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
 #=----------------------------=#
 # Main testing routine section #
 #=----------------------------=#
@@ -91,91 +159,420 @@ def test_one(
         indent      : typing.Union[str, int] = 0,
         caller_file : typing.Optional[str] = None,
         from_all    : bool = False,
-        from_group  : bool = False
+        from_group  : bool = False,
+        futures     : typing.Optional[typing.Dict[str, concurrent.futures.Future]] = None
     ) -> typing.List[str]:
     """Run a single test."""
 
-    # Declaring and updating required variables.
-    res = []
+    # Normalizing the indent.
     indent = indent*' ' if type(indent) == int else indent
 
     # Retrieving the caller file if required
     caller_file = caller_file if caller_file else get_caller_file(5 if from_all else 4 if from_group else 2)
 
+    # Pretty printing.
+    count_run()
+    print(prefix, end="")
+    print(f"Running the test \"{test_func.__name__}\"...")
+    print(f"""{indent}\033[90m{((len(prefix)-len(indent)-11)*'>' + ' ') if len(prefix)-len(indent)-11 > 0 else ""}{test_func.__doc__}\033[00m""")
+
+    # If the test has been dispatched to a worker process, printing its buffered output once done.
+    if futures and test_func.__name__ in futures:
+        (res, output, results) = futures[test_func.__name__].result()
+        print(output, end="")
+        replay_results(results)
+        count_failures(res)
+        return res
+
+    # Otherwise executing the test right now.
+    res = exec_test(test_func, indent=indent, caller_file=caller_file)
+    count_failures(res)
+    return res
+
+def run_iteration(rewritten_func: typing.Callable[[object], object], test_func: typing.Callable[[object], object]) -> typing.Optional[Exception]:
+    """Run a single iteration of a rewritten test function, returning the exception of the failure if any."""
+
+    # Trying to execute the function.
+    try:
+        # Executing the functions. The rewritten validator functions of the test body return the TEST_PASSED sentinel,
+        # otherwise an exception should be raised through the different validator functions.
+        if rewritten_func() is TEST_PASSED:
+            return None
+
+        # If the code continue, then no exception has been raised. This isn't normal, it means that any validator functions has been used.
+        raise TestFailedException(f"Test function <{test_func.__name__}> didn't use a validator function.")
+
+    # If the test passed.
+    except TestPassedException:
+        return None
+
+    # If the test failed.
+    except (TestFailedException, TestInvalidException, TestTimeoutException) as e:
+        return e
+
+def print_failure(test_func: typing.Callable[[object], object], indent: str, i: int, error: typing.Union[Exception, str]) -> None:
+    """Print the failure block of the <i>th iteration of a test."""
+    print(f"{indent}\033[91m[{i+1}{(len(str(test_func.test_execnbr))-len(str(i+1)))*' '}/{test_func.test_execnbr}] failed!\033[00m")
+    print(f"""\033[93m{NL.join(e for e in test_func.__source__.split(NL) if not e.lstrip().startswith('@'))}\033[00m""")
+    smart_assertion_print(f"\033[91m{error}\033[00m")
+    print(get_terminal_width()*"~")
+
+def print_summary(
+        test_func       : typing.Callable[[object], object],
+        indent          : str,
+        res             : typing.List[str],
+        success_counter : int,
+        func_time       : int,
+        latency         : typing.Optional[LatencyHistogram] = None
+    ) -> None:
+    """Print the summary line of a test once every iterations have been executed, followed by its iterations latency if several were executed."""
+
+    # If all tests passed.
+    if not res:
+        # Printing the function time without flushing to save the last line printed.
+        print(f"{indent}\033[92m[{test_func.test_execnbr}/{test_func.test_execnbr}]",
+              f"passed!    (100%)",
+              f"""[{format_time_unit((time.perf_counter_ns() - func_time), unit="ns")}]\033[00m""")
+
+    # If some tests failed.
+    else:
+        # Printing the function time in a new line.
+        print(f"{indent}\033[91m({100*success_counter/test_func.test_execnbr}%)",
+              f"""[{format_time_unit((time.perf_counter_ns() - func_time), unit="ns")}]\033[00m""")
+
+    # Printing the iterations latency.
+    if latency and latency.flush().count > 1:
+        print(f"{indent}\033[90m{latency.format()}\033[00m")
+
+def exec_test(
+        test_func   : typing.Callable[[object], object],
+        indent      : str = "",
+        caller_file : typing.Optional[str] = None
+    ) -> typing.List[str]:
+    """Execute the <test_execnbr> iterations of a single test and print their results."""
+
+    # Declaring the result variable.
+    res = []
+
     # Forcing the execution number property.
     if not hasattr(test_func, "test_execnbr"):
         test_func.test_execnbr = 1
+
+    # Fanning out the iterations across worker processes if the test asks for it, unless its footprint is recorded.
+    if getattr(test_func, "test_parallel", False) and test_func.test_execnbr > 1 and not is_worker() and not is_recording():
+        return exec_test_parallel(test_func, indent=indent, caller_file=caller_file)
+
+    # Running the iterations of an asynchronous test concurrently on an event loop if the test asks for it, unless its footprint is recorded.
+    if get_test_concurrency(test_func) > 1 and test_func.test_execnbr > 1 and is_async_test(test_func) and not is_recording():
+        return asyncio.run(exec_test_async(test_func, indent=indent, caller_file=caller_file))
     
     # Rewriting the function for pertinent check testing messages
     rewritten_func = rewrite_test(test_func, caller_file=caller_file)
 
+    # Creating a function timer variable
+    func_time = time.perf_counter_ns()
+
+    # Creating a success counter variable and the first failure message one.
+    success_counter = 0
+    message         = None
+
+    # Tracking the test progress, drawn by the renderer thread at a fixed rate.
+    progress = RENDERER.track(test_func, indent, func_time)
+
+    # Tracing the executed source files if the test footprint is recorded.
+    tracer = FootprintTracer() if is_recording() else None
+
+    # Driving the coroutine of every iteration on an event loop if the test is asynchronous, and running them under the test timeout if it has one.
+    driver = AsyncRunner(rewritten_func) if is_async_test(rewritten_func) else None
+    runner = TimeoutRunner(test_func, driver or rewritten_func, tracing=tracer is not None) if getattr(test_func, "test_timeout", None) else None
+
+    # Creating the executed iterations variable, lowered if the remaining iterations are skipped.
+    executed = test_func.test_execnbr
+
+    # Creating the iterations latency histogram, the end of every iteration being marked with a single clock read.
+    latency = LatencyHistogram()
+    (pending, mark, clock) = (latency.pending, latency.pending.append, time.perf_counter_ns)
+    latency.start()
+
+    # Executing the test functions <test_execnbr> times.
+    try:
+        with contextlib.ExitStack() as contexts:
+            for context in filter(None, (tracer, driver, runner)):
+                contexts.enter_context(context)
+            for i in range(test_func.test_execnbr):
+                # Executing and timing the iteration.
+                error = run_iteration(runner or driver or rewritten_func, test_func)
+                mark(clock())
+                if len(pending) > FLUSH_SIZE:
+                    latency.flush()
+
+                # If the test passed.
+                if error is None:
+                    # Incrmementing the success counter and updating the progress.
+                    success_counter += 1
+                    progress.done    = i+1
+                    progress.success = success_counter
+
+                # If the test failed.
+                else:
+                    # Pretty printing, the progress not being drawn anymore once a test failed.
+                    RENDERER.finish(progress)
+                    print_failure(test_func, indent, i, error)
+
+                    # Updating the result.
+                    res     = [test_func.__name__]
+                    message = message if message is not None else str(error)
+
+                    # Skipping the remaining iterations if required.
+                    if should_stop_iterations(test_func):
+                        executed = i+1
+                        print(f"{indent}\033[91mStopped after the iteration {executed}/{test_func.test_execnbr}.\033[00m")
+                        break
+
+                    # Not timing the failure printing.
+                    latency.start()
+    finally:
+        RENDERER.finish(progress)
+
+    # Reporting the result.
+    filename = caller_file or get_code(test_func).co_filename
+    record_result(make_result(
+        test_func, filename, success_counter, time.perf_counter_ns() - func_time, message, tracer.get_footprint(filename) if tracer else None, executed, latency
+    ))
+
     # Pretty printing.
-    print(prefix, end="")
-    print(f"Running the test \"{test_func.__name__}\"...")
-    print(f"""{indent}\033[90m{((len(prefix)-len(indent)-11)*'>' + ' ') if len(prefix)-len(indent)-11 > 0 else ""}{test_func.__doc__}\033[00m""")
+    print_summary(test_func, indent, res, success_counter, func_time, latency)
+    
+    # Returning the result.
+    return res
+
+def exec_test_parallel(
+        test_func   : typing.Callable[[object], object],
+        indent      : str = "",
+        caller_file : typing.Optional[str] = None
+    ) -> typing.List[str]:
+    """Execute the <test_execnbr> iterations of a single test by chunks in worker processes and print their results."""
+
+    # Declaring the result variables.
+    res = []
+    first_failure = None
+
+    # Computing the number of worker processes to use.
+    jobs = get_jobs_number(test_func.test_parallel if type(test_func.test_parallel) == int else 0)
 
     # Creating a function timer variable
     func_time = time.perf_counter_ns()
 
-    # Creating a success counter variable.
+    # Creating the done and success counter variables, and the iterations latency histogram merging the chunks ones.
+    done_counter    = 0
     success_counter = 0
+    latency         = LatencyHistogram()
 
-    # Compute the clear str
-    clear_str = 100*' '
+    # Tracking the test progress, drawn by the renderer thread at a fixed rate.
+    progress = RENDERER.track(test_func, indent, func_time)
 
-    # Executing the test functions <test_execnbr> times.
-    for i in range(test_func.test_execnbr):
-        # Trying to execute the function.
+    # Whether the remaining chunks are cancelled on the first failure.
+    stop_early = should_stop_iterations(test_func)
+
+    # Executing the iterations chunks in worker processes, gathering them as soon as they are done.
+    chunks = {}
+    with new_pool(jobs) as pool:
+        register_functions(test_func)
+        futures = dispatch_iterations(pool, test_func, jobs, caller_file, stop_early)
         try:
-            # Executing the functions. An exception should be raised through the different validator functions.
-            rewritten_func()
+            for future in concurrent.futures.as_completed(futures.values()):
+                if future.cancelled():
+                    continue
+                chunks[future] = future.result()
+                (start, stop, success, failure, _) = chunks[future]
+
+                # Keeping the first failing iteration.
+                if failure and (first_failure is None or failure[0] < first_failure[0]):
+                    first_failure = failure
+                    res = [test_func.__name__]
+
+                # Cancelling the chunks following the first failing iteration if required, and once the preceding ones are done
+                # (i.e. the first failing iteration is the same from run to run), the running ones too.
+                if res and stop_early:
+                    following = [e for (index, e) in futures.items() if index > first_failure[0]]
+                    for e in following:
+                        e.cancel()
+                    if all(e.done() for (index, e) in futures.items() if index <= first_failure[0]):
+                        cancel_futures(pool, following)
+                        break
+
+                # Updating the progress if no tests failed so far.
+                if not res:
+                    progress.done    += stop - start
+                    progress.success += success
+        finally:
+            RENDERER.finish(progress)
+
+    # Merging the chunks results, the ones following the first failing iteration being left out if the remaining chunks are cancelled.
+    for (start, stop, success, failure, chunk_latency) in chunks.values():
+        if not (stop_early and first_failure and start > first_failure[0]):
+            done_counter    += stop - start
+            success_counter += success
+            latency.merge(chunk_latency)
+
+    # Reporting and printing the result.
+    return end_unordered_test(test_func, indent, caller_file, res, done_counter, success_counter, first_failure, stop_early, func_time, latency)
+
+async def exec_test_async(
+        test_func   : typing.Callable[[object], object],
+        indent      : str = "",
+        caller_file : typing.Optional[str] = None,
+        semaphore   : typing.Optional[asyncio.Semaphore] = None
+    ) -> typing.List[str]:
+    """Execute the <test_execnbr> iterations of a single asynchronous test concurrently on the running event loop and print their results.
+       At most <test_concurrency> of its iterations run at once, and if a <semaphore> is given (i.e. shared by concurrent tests), as many as it allows."""
 
-            # If the code continue, then no exception has been raised. This isn't normal, it means that any validator functions has been used.
-            raise TestFailedException(f"Test function <{test_func.__name__}> didn't use a validator function.")
-        
-        # If the test passed.
-        except TestPassedException:
-            # Incrmementing the success counter and pretty printing if no tests failed so far.
-            success_counter += 1
+    # Declaring the result variables.
+    res = []
+    first_failure = None
+
+    # Forcing the execution number property.
+    if not hasattr(test_func, "test_execnbr"):
+        test_func.test_execnbr = 1
+
+    # Rewriting the function for pertinent check testing messages
+    rewritten_func = rewrite_test(test_func, caller_file=caller_file)
+
+    # Creating a function timer variable
+    func_time = time.perf_counter_ns()
+
+    # Creating the done and success counter variables, and the iterations latency histogram, the concurrent iterations being timed one by one.
+    done_counter    = 0
+    success_counter = 0
+    latency         = LatencyHistogram()
+
+    # Tracking the test progress, drawn by the renderer thread at a fixed rate.
+    progress = RENDERER.track(test_func, indent, func_time)
+
+    # Whether the remaining iterations are skipped on the first failure.
+    stop_early = should_stop_iterations(test_func)
+
+    # Sharing the iterations between <test_concurrency> tasks, each of them running a single iteration at once.
+    iterations = iter(range(test_func.test_execnbr))
+    tasks      = min(get_test_concurrency(test_func), test_func.test_execnbr)
+    semaphore  = semaphore if semaphore else asyncio.Semaphore(tasks)
+    timeout    = getattr(test_func, "test_timeout", None)
+
+    async def run_iterations() -> None:
+        nonlocal res, first_failure, done_counter, success_counter
+        for i in iterations:
+            if res and stop_early:
+                break
+
+            # Executing and timing the iteration, once allowed by the semaphore.
+            async with semaphore:
+                iteration_time = time.perf_counter_ns()
+                error = await run_iteration_async(rewritten_func, test_func, timeout)
+                latency.add(time.perf_counter_ns() - iteration_time, i)
+            done_counter += 1
+
+            # Keeping the first failing iteration.
+            if error is None:
+                success_counter += 1
+            elif first_failure is None or i < first_failure[0]:
+                (first_failure, res) = ((i, str(error)), [test_func.__name__])
+
+            # Updating the progress if no iterations failed so far.
             if not res:
-                print(clear_str, end="\r", flush=True)
-                print(f"{indent}\033[92m[{i+1}{(len(str(test_func.test_execnbr))-len(str(i+1)))*' '}/{test_func.test_execnbr}]",
-                      f"passed! ({100*success_counter/test_func.test_execnbr}%)", 
-                      f"""[{format_time_unit((time.perf_counter_ns() - func_time), unit="ns")}]\033[00m""", end="\r", flush=True)
-        
-        # If the test failed.
-        except (TestFailedException, TestInvalidException, TestTimeoutException) as e:
-            # Pretty printing.
-            print(f"{indent}\033[91m[{i+1}{(len(str(test_func.test_execnbr))-len(str(i+1)))*' '}/{test_func.test_execnbr}] failed!\033[00m")
-            print(f"""\033[93m{NL.join(e for e in test_func.__source__.split(NL) if not e.lstrip().startswith('@'))}\033[00m""")
-            smart_assertion_print(f"\033[91m{e}\033[00m")
-            print(os.get_terminal_size()[0]*"~")
-            
-            # Updating the result.
-            res = [test_func.__name__]
+                progress.done    = done_counter
+                progress.success = success_counter
+
+    # Executing the iterations concurrently.
+    try:
+        await asyncio.gather(*(run_iterations() for _ in range(tasks)))
+    finally:
+        RENDERER.finish(progress)
+
+    # Reporting and printing the result.
+    return end_unordered_test(test_func, indent, caller_file, res, done_counter, success_counter, first_failure, stop_early, func_time, latency)
+
+def end_unordered_test(
+        test_func       : typing.Callable[[object], object],
+        indent          : str,
+        caller_file     : typing.Optional[str],
+        res             : typing.List[str],
+        done_counter    : int,
+        success_counter : int,
+        first_failure   : typing.Optional[typing.Tuple[int, str]],
+        stop_early      : bool,
+        func_time       : int,
+        latency         : LatencyHistogram
+    ) -> typing.List[str]:
+    """Report and print the result of a test whose iterations didn't run in order (i.e. in worker processes or concurrently),
+       only its first failing iteration being printed, and return it."""
+
+    # Reporting the result.
+    record_result(make_result(
+        test_func, caller_file or get_code(test_func).co_filename, success_counter, time.perf_counter_ns() - func_time, first_failure[1] if first_failure else None,
+        executed=done_counter, latency=latency
+    ))
+
+    # Pretty printing the first failing iteration, if any.
+    if first_failure:
+        print_failure(test_func, indent, *first_failure)
+        if stop_early:
+            print(f"{indent}\033[91mStopped after {done_counter}/{test_func.test_execnbr} iterations.\033[00m")
+        else:
+            print(f"{indent}\033[91m{test_func.test_execnbr - success_counter} iterations failed.\033[00m")
+
+    # Pretty printing.
+    print_summary(test_func, indent, res, success_counter, func_time, latency)
+
+    # Returning the result.
+    return res
+
+def print_session_start(working: str, length: int, unit: str = "test") -> None:
+    """Print the test session start banner."""
+    stdout_width = (get_terminal_width() -22)/2
+    print(f"\033[01m\033[47m\033[90m{int(stdout_width+0.5)*'='} test sessions starts {int(stdout_width)*'='}\033[00m")
+    print(f"platform {platform.platform()}, Python v{platform.python_version()}, PyQuickTest v{__version__} [{__status__}]")
+    print(working)
+    print(f"""Collected {length} {unit}{'s' if length > 1 else ""} to run\n""")
+
+def print_session_end(total_time: str, interrupted: bool = False) -> None:
+    """Print the test session end banner."""
+    stdout_width = (get_terminal_width() -26 -len(str(total_time)))/2
+    if interrupted:
+        print("\n\n\033[01mTests interrupted!\033[00m")
+    print(f"\033[01m\033[47m\033[90m{int(stdout_width+0.5)*'='} test sessions ended in {total_time}s {int(stdout_width)*'='}\033[00m")
+
+def print_total(length: int, res: typing.List[str], total_time: str, ran: typing.Optional[int] = None) -> None:
+    """Print the result box of a whole set of <length> tests, <res> being the failed ones.
+       If the session stopped early, only <ran> tests ran, the success rate being computed over them."""
+    ran = length if ran is None else ran
 
     # If all tests passed.
-    if not res:
-        # Printing the function time without flushing to save the last line printed.
-        print(f"{indent}\033[92m[{test_func.test_execnbr}{(len(str(test_func.test_execnbr))-len(str(i+1)))*' '}/{test_func.test_execnbr}]",
-              f"passed!    (100%)",
-              f"""[{format_time_unit((time.perf_counter_ns() - func_time), unit="ns")}]\033[00m""")
+    if not res and ran == length:
+        # Pretty printing.
+        if border_length := 32 + len(str(length)) + len(total_time):
+            print(f"\n\033[96m{border_length*'*'}\n* All {length} tests",
+                f"passed! (100%)",
+                f"[{total_time}] *\n{border_length*'*'}\033[00m\n")
     
     # If some tests failed.
     else:
-        # Printing the function time in a new line.
-        print(f"{indent}\033[91m({100*success_counter/test_func.test_execnbr}%)",
-              f"""[{format_time_unit((time.perf_counter_ns() - func_time), unit="ns")}]\033[00m""")
-    
-    # Returning the result.
-    return res
+        # Pretty printing.
+        group_success_rate = round(100*(ran-len(res))/ran, 3) if ran else 0.0
+        if border_length := 29 + len(str(group_success_rate)) + len(total_time):
+            print(f"\n\033[91m{border_length*'*'}\n* Some tests",
+                f"failed! ({group_success_rate}%)",
+                f"[{total_time}] *\n{border_length*'*'}\033[00m\n")
+            print(f"""\033[91m{", ".join(res)}\033[00m\n""")
+            if ran < length:
+                print(f"\033[90m{length-ran} test{'s' if length-ran > 1 else ''} not run.\033[00m\n")
 
 def test_groups_core(
-        core        : CORE,
+        core        : GroupTree,
         last_group  : str = "",
         indent      : typing.Union[str, int] = 0,
         caller_file : typing.Optional[str] = None,
-        from_all    : bool = False
+        from_all    : bool = False,
+        futures     : typing.Optional[typing.Dict[str, concurrent.futures.Future]] = None
     ) -> typing.List[str]:
     """Run grouped tests."""
 
@@ -191,41 +588,40 @@ def test_groups_core(
     # Creating a group timer variable
     group_time = time.perf_counter_ns()
 
-    # For every group.
-    for group in core:
-        # Functions aren't groups.
-        if group == "***funcs***":
-            continue
-
-        # Computing the group length.
-        length = compute_group_length(core[group])
+    # For every subgroup, until the session is stopped.
+    for node in core.children.values():
+        if should_stop():
+            break
 
         # Pretty printing.
-        if border_length := 21 + len(group) + len(str(length)):
-            print(f"\033[95m{indent}·{border_length*'_'}·\n{indent}| Running all {length} {group} tests |\n{indent}·{border_length*'‾'}·\033[00m")
+        if border_length := 21 + len(node.name) + len(str(node.length)):
+            print(f"\033[95m{indent}·{border_length*'_'}·\n{indent}| Running all {node.length} {node.name} tests |\n{indent}·{border_length*'‾'}·\033[00m")
 
         # Incrementing the res by calling recursively the test_groups_core function.
-        res += test_groups_core(core[group], group, indent=indent+4*' ', caller_file=caller_file)
+        res += test_groups_core(node, node.name, indent=indent+4*' ', caller_file=caller_file, futures=futures)
 
     # If this group contains functions.
-    if "***funcs***" in core:
+    if core.funcs:
         # Retrieving the number of functions in the current group.
-        group_length = len(core["***funcs***"])
+        group_length = len(core.funcs)
 
-        # Calling the ungrouped testing function.
-        temp = merge2(
-            map2(
-                lambda x, y: test_one(x, prefix=f"""{indent}[{y}/{group_length}] """, indent=indent, caller_file=caller_file, from_all=from_all, from_group=True),
-                core["***funcs***"],
-                list(range(1, group_length+1))
-            )
-        )
+        # Calling the ungrouped testing function, until the session is stopped.
+        (temp, ran) = ([], 0)
+        for (i, func) in enumerate(core.funcs, 1):
+            if should_stop():
+                break
+            ran  += 1
+            temp += test_one(func, prefix=f"""{indent}[{i}/{group_length}] """, indent=indent, caller_file=caller_file, from_all=from_all, from_group=True, futures=futures)
 
         # Updating the group timer value.
         group_time_str = format_time_unit((time.perf_counter_ns() - group_time), unit="ns")
 
+        # If the session stopped before any of the grouped tests.
+        if not ran:
+            pass
+
         # If all grouped tests passed.
-        if not temp:
+        elif not temp and ran == group_length:
             # Pretty printing.
             if border_length := 31 + len(str(group_length)) + len(last_group) + len(group_time_str):
                 print(f"\033[95m{indent[:-4]}·{border_length*'_'}·\n{indent[:-4]}| All {group_length} {last_group} tests",
@@ -235,12 +631,15 @@ def test_groups_core(
         # If some tests failed.
         else:
             # Pretty printing.
-            group_success_rate = round(100*(group_length-len(temp))/group_length, 3)
+            group_success_rate = round(100*(ran-len(temp))/ran, 3)
             if border_length := 29 + len(group_time_str) + len(str(group_success_rate)):
                 print(f"\033[91m{indent[:-4]}·{border_length*'='}·\n{indent[:-4]}|| Some tests",
                       f"failed! ({group_success_rate}%)",
                       f"[{group_time_str}] ||\n{indent[:-4]}·{border_length*'='}·\033[00m")
-                print(f"""\033[91m{indent[:-4]}{", ".join(temp)}\033[00m\n""")
+                print(f"""\033[91m{indent[:-4]}{", ".join(temp)}\033[00m""")
+                if ran < group_length:
+                    print(f"\033[90m{indent[:-4]}{group_length-ran} test{'s' if group_length-ran > 1 else ''} not run.\033[00m")
+                print()
 
         # Incrementing the res by the just called ungrouped testing function.
         res += [temp]
@@ -254,110 +653,307 @@ def test_group(
         filename : typing.Optional[str] = None,
         from_all : bool = False,
         run_dir  : typing.Optional[str] = None,
+        jobs      : typing.Optional[int] = None,
+        session   : bool = True,
+        selection : typing.Optional[TestSelection] = None
     ) -> typing.List[str]:
-    """Run a group of tests."""
+    """Run a group of tests.
+       If a number of jobs <jobs> greater than 1 is provided, the tests are executed by a pool of worker processes.
+       If <session> is False, the test session banners are left to the caller, i.e. when merging several files.
+       If a test selection <selection> is provided, only its tests are run, in its order.
+       Raises a KeyError if the requested <group> doesn't exist."""
 
     # Retrieve the ctx value if required.
     caller_file = filename if filename else get_caller_file(3 if from_all else 2)
     ctx = ctx if ctx != None else get_callable_ctx_from_file(caller_file) if caller_file != None else globals()
-    # If the global context contains some test functions to execute.
-    if test_funcs := get_all_functions("test", ctx=ctx if ctx != None else globals()):
-        # Retrieving the grouped test functions.
-        group_test_funcs = sorted(get_all_functions("test", "test_group", ctx=ctx if ctx != None else globals()), key=lambda x: x.__getattribute__("test_group"))
+    # Retrieving the test functions to execute.
+    all_funcs  = get_all_functions("test", ctx=ctx if ctx != None else globals())
+    test_funcs = selection.select_tests(all_funcs, caller_file) if selection else all_funcs
 
-        # Retrieving the different grouped test values.
-        groups = map1(lambda x: x.__getattribute__("test_group"), filter1(lambda x: hasattr(x, "test_group"), group_test_funcs))
-    
-        # Constructing the core dictionary for grouped test functions hierarchy.
-        core   = {}
-        for i, e in enumerate(groups):
-            if e[0] not in core:
-                core[e[0]] = {}
-            temp = core[e[0]]
-            for f in e[1:]:
-                if f not in temp:
-                    temp[f] = {}
-                temp = temp[f]
-            ref = eval(f"""core{"".join(f"[e[{k}]]" for k in range(len(e)-1))}""")
-            if "***funcs***" not in ref[e[-1]]:
-                ref[e[-1]]["***funcs***"]  = [group_test_funcs[i]]
-            else:
-                ref[e[-1]]["***funcs***"] += [group_test_funcs[i]]
+    # Checking that the requested group exists, its tests being possibly all left out by the selection.
+    if group and not any(list(getattr(func, "test_group", None) or [])[:len(group)] == list(group) for func in all_funcs):
+        raise KeyError(f"Unknown test group <{'::'.join(group)}> in the file <{caller_file}>.")
+
+    # If the global context contains some test functions to execute.
+    if test_funcs:
+        # Building the grouped test functions hierarchy in a single pass, the groups being sorted by name (or by the selection).
+        core = GroupTree.build(sorted(
+            filter1(lambda x: getattr(x, "test_group", None), test_funcs),
+            key=selection.group_key(caller_file) if selection else lambda x: x.__getattribute__("test_group")
+        ))
 
-        # Diving into the core dictionary
-        core = eval("core" + "".join(f"[\"{e}\"]" for e in group))
+        # Diving into the requested group, which is empty if the selection left out all its tests.
+        core = core.find(*group) or GroupTree()
 
         # Get the group length.
         length = len(test_funcs)
 
         # Retrieving the ungrouped test functions list.
-        no_groups = filter1(lambda x: not hasattr(x, "test_group"), test_funcs)
+        no_groups = filter1(lambda x: not getattr(x, "test_group", None), test_funcs)
 
         # Pretty printing.
-        stdout_width = (os.get_terminal_size()[0] -22)/2
         if border_length := 22 + len(str(length)):
-            print(f"\033[01m\033[47m\033[90m{int(stdout_width+0.5)*'='} test sessions starts {int(stdout_width)*'='}\033[00m")
-            print(f"platform {platform.platform()}, Python v{platform.python_version()}, PyQuickTest v{__version__} [{__status__}]")
-            print(f"Working file: {caller_file}" if not run_dir else f"Working dir: {run_dir}")
-            print(f"""Collected {length} test{'s' if length > 1 else ""} to run\n""")
+            if session:
+                reset_failures()
+                print_session_start(f"Working file: {caller_file}" if not run_dir else f"Working dir: {run_dir}", length)
+                report_session_start(caller_file if not run_dir else run_dir, length)
+            else:
+                print(f"""\033[01mWorking file: {caller_file}\033[00m\nCollected {length} test{'s' if length > 1 else ""} to run\n""")
             print(f"\033[96m{border_length*'*'}\n* Running all {length} tests *\n{border_length*'*'}\033[00m\n")
 
-        # Creating a global timer variable
+        # Creating a global timer variable, and keeping the number of tests run before this group.
         total_time = time.perf_counter_ns()
+        run_before = RUN_COUNTER
 
     # If the global context contains no  test functions to execute.
     else:
         print("\033[91mNo tests functions to execute.\033[00m")
-        return
-
-    try:            
-        # Calling the grouped and ungrouped testing functions.
-        res = merge2(test_groups_core(core, indent=4, caller_file=caller_file)
-                     + map1(lambda x: test_one(x, prefix=4*" ", indent=4, caller_file=caller_file, from_all=from_all, from_group=True), no_groups))
+        return []
+
+    # Creating the worker processes pool if required.
+    jobs  = get_jobs_number(jobs)
+    pool  = new_pool(jobs) if jobs > 1 else None
+
+    try:
+        # Dispatching every test functions to the worker processes, longest first, their results being printed in the hierarchical order.
+        futures = None
+        if pool:
+            funcs   = core.functions(4*' ') + [(func, 4*' ') for func in no_groups]
+            register_functions(*(func for (func, _) in funcs))
+            futures = dispatch_tests(pool, DurationEstimator().sort_tests(funcs, caller_file), caller_file)
+
+        # Otherwise running the asynchronous tests concurrently on a single event loop if requested, their results being printed in the hierarchical order.
+        elif get_concurrency() > 1 and not is_recording():
+            funcs   = [(func, indent) for (func, indent) in core.functions(4*' ') + [(func, 4*' ') for func in no_groups] if is_async_test(func)]
+            futures = dispatch_async_tests(funcs, caller_file, get_concurrency()) if funcs else None
+
+        # Calling the grouped and ungrouped testing functions, until the session is stopped.
+        res = merge2(test_groups_core(core, indent=4, caller_file=caller_file, futures=futures))
+        for func in no_groups:
+            if should_stop():
+                break
+            res += test_one(func, prefix=4*" ", indent=4, caller_file=caller_file, from_all=from_all, from_group=True, futures=futures)
+
+        # Terminating the tests still running in the worker processes if the session is stopped.
+        if should_stop():
+            if pool:
+                cancel_futures(pool, futures.values())
+            if session:
+                print_stopped()
+
+        # Updating the global timer value.
+        total_ns   = time.perf_counter_ns() - total_time
+        total_time = format_time_unit(total_ns, unit="ns")
+
+        # Pretty printing, the skipped tests of a stopped session being left out of the success rate.
+        ran = RUN_COUNTER - run_before
+        print_total(length, res, total_time, ran)
+        if session:
+            print_session_end(total_time)
+            report_session_end(total_ns, ran, res)
+
+        # Returning the failed tests.
+        return res
+    
+    except KeyboardInterrupt:
+        # Updating the global timer value.
+        total_ns   = time.perf_counter_ns() - total_time
+        total_time = format_time_unit(total_ns, unit="ns")
+
+        # Pretty printing, or letting the caller session handle the interruption.
+        if not session:
+            raise
+        print_session_end(total_time, interrupted=True)
+        report_session_end(total_ns, RUN_COUNTER - run_before, [], interrupted=True)
+
+    finally:
+        # Shutting down the worker processes pool, cancelling the not yet started tests.
+        if pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+def test_file(
+        ctx       : typing.Optional[typing.Dict[str, typing.Any]] = None,
+        filename  : typing.Optional[str] = None,
+        jobs      : typing.Optional[int] = None,
+        selection : typing.Optional[TestSelection] = None
+    ) -> None:
+    """Run all tests from a given file."""
+    test_group(ctx=ctx, filename=filename, from_all=True, jobs=jobs, selection=selection)
+
+def run_file(
+        filename  : str,
+        ctx       : typing.Optional[typing.Dict[str, typing.Any]] = None,
+        selection : typing.Optional[TestSelection] = None
+    ) -> typing.Tuple[int, int, typing.List[str]]:
+    """Run all tests from a given file inside a merged test session, returning the number of tests, the number of them which ran
+       (i.e. all of them unless the session stopped early) and the failed ones."""
+    ctx        = ctx if ctx != None else get_callable_ctx_from_file(filename)
+    funcs      = get_all_functions("test", ctx=ctx)
+    run_before = RUN_COUNTER
+    failed     = test_group(ctx=ctx, filename=filename, from_all=True, session=False, selection=selection)
+    return (len(selection.select_tests(funcs, filename) if selection else funcs), RUN_COUNTER - run_before, failed)
+
+def test_directory(
+        ctx     : typing.Optional[typing.Dict[str, typing.Any]] = None,
+        path    : typing.Optional[str] = None,
+        jobs    : typing.Optional[int] = None,
+        include   : typing.Optional[typing.List[str]] = None,
+        exclude   : typing.Optional[typing.List[str]] = None,
+        selection : typing.Optional[TestSelection] = None
+    ) -> typing.List[str]:
+    """Run all tests from a given directory and its subdirectories in a single merged test session.
+       Test files are filtered by the <include> and <exclude> glob patterns (see discover_test_files).
+       If a number of jobs <jobs> greater than 1 is provided, the files are executed concurrently by isolated worker processes.
+       If a test selection <selection> is provided, only its test files and tests are run, in its order."""
 
-        # Updating the global timer value and the terminal width to use.
-        total_time = format_time_unit((time.perf_counter_ns() - total_time), unit="ns")
-        stdout_width = (os.get_terminal_size()[0] -26 -len(str(total_time)))/2
+    # Retrieving the test files to run.
+    path      = os.path.abspath(path if path else '.')
+    filenames = discover_test_files(path, include=include, exclude=exclude)
+    filenames = selection.select_files(filenames) if selection else filenames
 
-        # If all tests passed.
-        if not res:
-            # Pretty printing.
-            if border_length := 32 + len(str(length)) + len(total_time):
-                print(f"\n\033[96m{border_length*'*'}\n* All {length} tests",
-                    f"passed! (100%)",
-                    f"[{total_time}] *\n{border_length*'*'}\033[00m\n")
-        
-        # If some tests failed.
-        else:
-            # Pretty printing.
-            group_success_rate = round(100*(length-len(res))/length, 3)
-            if border_length := 29 + len(str(group_success_rate)) + len(total_time):
-                print(f"\n\033[91m{border_length*'*'}\n* Some tests",
-                    f"failed! ({group_success_rate}%)",
-                    f"[{total_time}] *\n{border_length*'*'}\033[00m\n")
-                print(f"""\033[91m{", ".join(res)}\033[00m\n""")
+    # Pretty printing.
+    reset_failures()
+    print_session_start(f"Working dir: {path}", len(filenames), unit="test file")
+    report_session_start(path, len(filenames))
+
+    # Creating the result variables and a global timer variable.
+    results    = {}
+    total_time = time.perf_counter_ns()
+
+    # Creating the worker processes pool if required.
+    jobs = get_jobs_number(jobs)
+    pool = new_file_pool(jobs) if jobs > 1 else None
+
+    try:
+        # Dispatching every test files to the worker processes, longest first, their results being printed in the listing order.
+        futures = dispatch_files(pool, DurationEstimator().sort_files(filenames), selection) if pool else {}
+
+        # For every test file, in the listing order, until the session is stopped.
+        for filename in filenames:
+            if should_stop():
+                break
+
+            # If the file has been dispatched, printing its buffered output once done.
+            if pool:
+                (output, length, ran, failed, file_time, file_results) = futures[filename].result()
+                print(output, end="")
+                replay_results(file_results)
+                count_failures(failed)
+
+            # Otherwise running the file right now.
+            else:
+                file_time = time.perf_counter_ns()
+                try:
+                    (length, ran, failed) = run_file(filename, ctx=ctx, selection=selection)
+                except Exception:
+                    print(f"\033[91m{traceback.format_exc()}\033[00m")
+                    (length, ran, failed) = (0, 0, [os.path.basename(filename)])
+                    count_failures(failed)
+                file_time = time.perf_counter_ns() - file_time
+
+            # Storing the file results.
+            results[filename] = (length, ran, failed, file_time)
+
+        # Terminating the files still running in the worker processes if the session is stopped.
+        if should_stop():
+            if pool:
+                cancel_futures(pool, futures.values())
+            print_stopped()
+
+        # Updating the global timer value.
+        total_ns   = time.perf_counter_ns() - total_time
+        total_time = format_time_unit(total_ns, unit="ns")
+
+        # Pretty printing the per-file summary, the success rates being computed over the tests which ran.
+        width = max([4] + [len(os.path.relpath(filename, path)) for filename in filenames])
+        print(f"\n\033[01m{'file':<{width}}  tests   passed  time\033[00m")
+        for filename in filenames:
+            if filename not in results:
+                print(f"\033[90m{os.path.relpath(filename, path):<{width}}  not run\033[00m")
+                continue
+            (length, ran, failed, file_time) = results[filename]
+            print(f"""\033[{"92" if not failed else "91"}m{os.path.relpath(filename, path):<{width}}""",
+                  f"{length:>6}  {round(100*(ran-len(failed))/ran, 3) if ran else 0.0:>6}%",
+                  f"[{format_time_unit(file_time, unit='ns')}]{f' ({length-ran} not run)' if ran < length else ''}\033[00m")
+
+        # Pretty printing the merged totals.
+        res = merge1(*(failed for (_, _, failed, _) in results.values())) if results else []
+        ran = sum(ran for (_, ran, _, _) in results.values())
+        print_total(sum(length for (length, _, _, _) in results.values()), res, total_time, ran)
+        print_session_end(total_time)
+        report_session_end(total_ns, ran, res)
+
+        # Returning the failed tests.
+        return res
 
-        # Pretty printing.
-        print(f"\033[01m\033[47m\033[90m{int(stdout_width+0.5)*'='} test sessions ended in {total_time}s {int(stdout_width)*'='}\033[00m")
-    
     except KeyboardInterrupt:
-        # Updating the global timer value and the terminal width to use.
-        total_time = format_time_unit((time.perf_counter_ns() - total_time), unit="ns")
-        stdout_width = (os.get_terminal_size()[0] -26 -len(str(total_time)))/2
-
         # Pretty printing.
-        print("\n\n\033[01mTests interrupted!\033[00m")
-        print(f"\033[01m\033[47m\033[90m{int(stdout_width+0.5)*'='} test sessions ended in {total_time}s {int(stdout_width)*'='}\033[00m")
+        print_session_end(format_time_unit((time.perf_counter_ns() - total_time), unit="ns"), interrupted=True)
+        report_session_end(time.perf_counter_ns() - total_time, sum(ran for (_, ran, _, _) in results.values()), [], interrupted=True)
+
+    finally:
+        # Shutting down the worker processes pool, cancelling the not yet started files.
+        if pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+def merge_reports(paths: typing.List[str]) -> typing.List[str]:
+    """Merge the JSON Lines reports of several test sessions, e.g. one per shard of a test suite, into a single test session
+       reported to the current reporters. A test appearing in several reports keeps its last result. The merged session lasts
+       as long as the longest report, the shards being run concurrently. Returns the failed tests ids."""
+
+    # Loading the reports and merging their results by test id.
+    reports = [(path, *load_report(path)) for path in paths]
+    results = {result["id"]: result for (_, _, _, report_results) in reports for result in report_results}
+
+    # Pretty printing, and reporting the merged results.
+    print_session_start(f"Merged reports: {', '.join(paths)}", len(results))
+    report_session_start(os.getcwd(), len(results))
+    replay_results(list(results.values()))
+
+    # Pretty printing the per-report summary.
+    width = max([6] + [len(path) for path in paths])
+    print(f"\033[01m{'report':<{width}}  tests   passed  time\033[00m")
+    for (path, duration, _, report_results) in reports:
+        failed = sum(result["status"] != "passed" for result in report_results)
+        print(f"""\033[{"92" if not failed else "91"}m{path:<{width}}""",
+              f"{len(report_results):>6}  {round(100*(len(report_results)-failed)/len(report_results), 3) if report_results else 0.0:>6}%",
+              f"[{format_duration(duration)}]\033[00m")
+
+    # Pretty printing and reporting the merged totals.
+    res        = [id_ for (id_, result) in results.items() if result["status"] != "passed"]
+    total_ns   = max((duration for (_, duration, _, _) in reports), default=0)
+    total_time = format_duration(total_ns)
+    print_total(len(results), res, total_time)
+    print_session_end(total_time, interrupted=any(interrupted for (_, _, interrupted, _) in reports))
+    report_session_end(total_ns, len(results), res, interrupted=any(interrupted for (_, _, interrupted, _) in reports))
+
+    # Returning the failed tests.
+    return res
 
-def test_file(ctx: typing.Optional[typing.Dict[str, typing.Any]] = None, filename: typing.Optional[str] = None) -> None:
-    """Run all tests from a given file."""
-    test_group(ctx=ctx, filename=filename, from_all=True)
+def collect_only(
+        path    : typing.Optional[str] = None,
+        include : typing.Optional[typing.List[str]] = None,
+        exclude : typing.Optional[typing.List[str]] = None
+    ) -> typing.List[STATIC_TEST]:
+    """Print every tests from a given file or directory without importing nor running them, and return them."""
 
-def test_directory(ctx: typing.Optional[typing.Dict[str, typing.Any]] = None, path: typing.Optional[str] = None) -> None:
-    """Run all tests from a given directory."""
-    for filename in os.listdir(path):
-        if filename.endswith(".py") or filename.endswith(".pyw"):
-            test_file(ctx=ctx, filename=f"{os.path.abspath(path)}/{filename}")
+    # Statically collecting the tests.
+    path  = os.path.abspath(path if path else '.')
+    tests = collect_tests(path, include=include, exclude=exclude)
+    root  = path if os.path.isdir(path) else os.path.dirname(path)
+
+    # Pretty printing.
+    last_file = None
+    for test in tests:
+        if test["file"] != last_file:
+            last_file = test["file"]
+            print(f"\033[01m{os.path.relpath(last_file, root)}\033[00m")
+        print(f"""    {"".join(f"{e} > " for e in test["group"] or [])}{test["name"]}""",
+              f"""\033[90m[x{test["execnbr"]}{", parallel" if test["parallel"] else ""}]\033[00m""")
+    print(f"""\nCollected {len(tests)} test{'s' if len(tests) > 1 else ""} in {len(set(e["file"] for e in tests))} file{'s' if len(set(e["file"] for e in tests)) > 1 else ""}.""")
+
+    # Returning the collected tests.
+    return tests
 
 # =---------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------------= #
 
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+      tree.py is the file containing the hierarchy
+        of the groups and subgroups of the tests.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+import typing
+
+# =--------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------=#
+# Group tree section #
+#=------------------=#
+
+class GroupTree:
+    """Node of the hierarchy of the grouped test functions, i.e. a group named <name> with its subgroups <children> indexed by name
+       in insertion order, its own test functions <funcs>, and the cached number of test functions of its whole subtree <length>.
+       Adding a test function only walks its group path, so the whole tree is built in a time linear in the number of tests."""
+
+    __slots__ = ("name", "parent", "children", "funcs", "length")
+
+    def __init__(self, name: str = "", parent: typing.Optional[GroupTree] = None) -> None:
+        self.name     = name
+        self.parent   = parent
+        self.children : typing.Dict[str, GroupTree] = {}
+        self.funcs    : typing.List[typing.Callable[[object], object]] = []
+        self.length   = 0
+
+    @classmethod
+    def build(cls, funcs: typing.Iterable[typing.Callable[[object], object]]) -> GroupTree:
+        """Build the tree of the given test functions from their <test_group> path, the groups being ordered by their first test function."""
+        tree = cls()
+        for func in funcs:
+            tree.add(func)
+        return tree
+
+    def find(self, *path: str) -> typing.Optional[GroupTree]:
+        """Find the node of a given group path relative to this node, <None> if it doesn't exist."""
+        node = self
+        for name in path:
+            if (node := node.children.get(name)) is None:
+                return None
+        return node
+
+    def update_length(self, delta: int) -> None:
+        """Update the cached length of this node and of its ancestors."""
+        node = self
+        while node is not None:
+            node.length += delta
+            node = node.parent
+
+    def add(self, func: typing.Callable[[object], object], path: typing.Optional[typing.Iterable[str]] = None) -> GroupTree:
+        """Add a test function to the node of a given group path relative to this node [default: its <test_group> path],
+           creating the missing nodes, and return the node."""
+        node = self
+        for name in (path if path is not None else getattr(func, "test_group", None) or []):
+            if (child := node.children.get(name)) is None:
+                child = node.children[name] = GroupTree(name, node)
+            node = child
+        node.funcs.append(func)
+        node.update_length(1)
+        return node
+
+    def functions(self, indent: str = "") -> typing.List[typing.Tuple[typing.Callable[[object], object], str]]:
+        """Get every (test function, indent) pairs of this subtree in the order they are run, i.e. the subgroups ones first,
+           the indent growing by 4 spaces per level."""
+        res = []
+        for child in self.children.values():
+            res += child.functions(indent + 4*' ')
+        res += [(func, indent) for func in self.funcs]
+        return res
+
+# =-----------------------------------------------------------------------------------------------------------------= #
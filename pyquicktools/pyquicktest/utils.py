@@ -38,7 +38,11 @@ from   __future__ import annotations
 import typing
 import os
 import sys
+import re
+import shutil
 import inspect
+import types
+import importlib.util
 
 # =------------------------------= #
 
@@ -47,7 +51,11 @@ import inspect
 # Constants & Global variables section #
 #=------------------------------------=#
 
-CORE = typing.Dict[str, typing.Union[str, typing.Callable[[object], object], typing.Dict[str, 'CORE']]]
+# Name of the directory storing every PyQuickTest caches of a tested directory.
+CACHE_DIR          = ".pqtcache"
+
+# Prefix of the names of the test files modules, imported under a name unique to their path (see import_file).
+FILE_MODULE_PREFIX = "pqt_file__"
 
 # =----------------------------------= #
 
@@ -134,17 +142,53 @@ def get_all_functions(*attributes: str, ctx: typing.Optional[typing.Dict[str, ty
         return filter1(lambda x: callable(x) and hasattributes(x, *attributes), list(ctx.values()) if type(ctx) == dict else ctx)
     return []
 
+def get_file_module_name(file: str) -> str:
+    """Get the module name of a given test file, unique to its absolute path so files sharing their name in different directories don't collide."""
+    return FILE_MODULE_PREFIX + re.sub(r"\W", "_", os.path.splitext(os.path.abspath(file))[0])
+
+def is_file_module(module: types.ModuleType) -> bool:
+    """Check if a given module is a test file module imported by import_file."""
+    return module.__name__.startswith(FILE_MODULE_PREFIX)
+
+def import_file(file: str) -> types.ModuleType:
+    """Import a given test file under a module name unique to its path (see get_file_module_name), only once.
+       Its directory is added to the modules search path, so it can import its neighbouring modules."""
+    name = get_file_module_name(file)
+    if name not in sys.modules:
+        sys.path.append(os.path.dirname(os.path.abspath(file)))
+        spec   = importlib.util.spec_from_file_location(name, os.path.abspath(file))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return sys.modules[name]
+
 def get_callable_ctx_from_file(file: str) -> typing.Dict[str, typing.Callable[[object], object]]:
     """Get the global context of a given file name."""
-    sys.path.append(os.path.dirname(file))
-    filename   = file.split('/')[-1].split('\\')[-1].split('.')[0]
-    src_module = __import__(filename)
+    src_module = import_file(file)
     ctx_raw    = dir(src_module)
     return  {e: getattr(src_module, e) for e in ctx_raw if callable(getattr(src_module, e))}
 
+def get_cache_dir(root: typing.Optional[str] = None) -> str:
+    """Get the PyQuickTest cache directory of a given root directory [default: the current working directory], creating it if required."""
+    path = os.path.join(os.path.abspath(root if root else '.'), CACHE_DIR)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def get_terminal_width() -> int:
+    """Get the width of the terminal, falling back to 80 columns when there is no terminal (i.e. pipes and CI logs)."""
+    return shutil.get_terminal_size(fallback=(80, 24)).columns
+
 def get_caller_file(stack_nbr: int) -> str:
     """get the last caller file different from the one calling this function."""
-    return inspect.stack()[stack_nbr].filename
+    return sys._getframe(stack_nbr).f_code.co_filename
+
+def get_code(func: typing.Callable[[object], object]) -> typing.Any:
+    """Get the code object of a function, the one of the original function if it has been wrapped (i.e. by pqt_timeout)."""
+    return inspect.unwrap(func).__code__
 
 def merge1(*iterable: typing.List[typing.Any]) -> typing.List[typing.Any]:
     """Merge a lists of element into one list."""
@@ -201,24 +245,4 @@ def multiple_replace(string: str, *pattern_and_replace: typing.Tuple[str, str])
         string = string.replace(pattern, replace)
     return string
 
-def compute_group_length(core: CORE) -> int:
-    """Compute the length of a given grouped test core hierarchy."""
-    
-    # Create the length variable.
-    length = 0
-
-    # If the core contains functions.
-    if "***funcs***" in core:
-        # Increment the length variable.
-        length += len(core["***funcs***"])
-
-    # For every other groups in the core.
-    for group in core:
-        if group != "***funcs***":
-            # Increment the length variable recursively.
-            length += compute_group_length(core[group])
-    
-    # Return the length.
-    return length
-
 # =---------------------------------------------------------------------------------------------------------------------------------------------------= #
\ No newline at end of file
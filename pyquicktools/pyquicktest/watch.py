@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+      PyQuickTest is an experimental python testing
+             framework designed to deliver an
+    easy-and-quick-to-start python testing mechanism.
+       watch.py is the file containing the watch mode,
+     re-running the tests affected by every file change.
+                                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |         |            | Initial release, including the following features:          |
+    |         |            |     -Decorators for test functions.                         |
+    |         |            |     -Assertions functions for test functions.               |
+    |         |            |     -Testing routine functions for:                         |
+    |  0.0.1  | 2023/08/06 |         *A single function.                                 |
+    |         |            |         *A given group/subgroup of functions.               |
+    |         |            |         *All functions from a given file.                   |
+    |         |            |     -Generators functions for random inputs.                |
+    |         |            |     -a CLI tool for running tests.                          |
+    |------------------------------------------------------------------------------------|
+    |         |            | Adding a smart assertion error printing to avoid useless    |
+    |  0.1.0  | 2023/08/06 | lines, and a more detailed test session start message that  |
+    |         |            | includes informations about the OS & the software versions. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__                         import annotations
+import typing
+import os
+import sys
+import ast
+import time
+import types
+import importlib
+import linecache
+import traceback
+from   pyquicktools.pyquicktest.collect   import DEFAULT_INCLUDE, walk_files, discover_test_files
+from   pyquicktools.pyquicktest.test      import test_directory, test_file
+from   pyquicktools.pyquicktest.utils     import is_file_module
+from   pyquicktools.pyquicktest.report    import get_test_path
+from   pyquicktools.pyquicktest.selection import TestSelection, select_expressions
+
+# =----------------------------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__author__       = "Quentin Raimbaud"
+__contact__      = "quentin.raimbaud.contact@gmail.com"
+__copyright__    = None
+__credits__      = []
+__date__         = "2023/08/14"
+__license__      = "MIT"
+__maintainer__   = "Quentin Raimbaud"
+__organization__ = None
+__status__       = "Development"
+__version__      = "0.1.1"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+# Number of seconds between two polls of the watched files.
+POLL_INTERVAL = 0.2
+
+# =----------------------------------= #
+
+
+#=---------------------------=#
+# Module dependencies section #
+#=---------------------------=#
+
+def get_project_modules(roots: typing.Iterable[str]) -> typing.Dict[str, types.ModuleType]:
+    """Get every imported modules whose file is under one of the given root directories, indexed by absolute file name.
+       The main module and the PyQuickTest ones are left out, as they can't be safely reloaded while running."""
+    roots = tuple(os.path.join(root, '') for root in roots)
+    return {
+        os.path.abspath(module.__file__): module
+        for (name, module) in list(sys.modules.items())
+        if isinstance(getattr(module, "__file__", None), str) and os.path.abspath(module.__file__).startswith(roots)
+        and name != "__main__" and name.split('.')[0] != "pyquicktools"
+    }
+
+def get_imported_names(module: types.ModuleType) -> typing.Set[str]:
+    """Statically get the names of the modules imported by a given module, resolving its relative imports."""
+    try:
+        with open(module.__file__, 'rb') as file:
+            tree = ast.parse(file.read())
+    except (OSError, SyntaxError, ValueError):
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                package = (module.__package__ or "").split('.')
+                base    = ".".join(package[:len(package)-node.level+1] + ([base] if base else []))
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    return names
+
+def get_dependents(modules: typing.Dict[str, types.ModuleType], changed: typing.Set[str]) -> typing.List[str]:
+    """Get the files of the given project modules depending, directly or not, on the <changed> files, including them.
+       They are ordered so that every module comes after the modules it depends on, i.e. in a valid reloading order."""
+
+    # Building the reversed dependency graph of the project modules.
+    names      = {module.__name__: filename for (filename, module) in modules.items()}
+    imports    = {filename: {names[name] for name in get_imported_names(module) if name in names} - {filename} for (filename, module) in modules.items()}
+    dependents = {filename: set() for filename in modules}
+    for (filename, dependencies) in imports.items():
+        for dependency in dependencies:
+            dependents[dependency].add(filename)
+
+    # Walking through the dependents of the changed modules.
+    affected = set()
+    stack    = [filename for filename in changed if filename in modules]
+    while stack:
+        if (filename := stack.pop()) not in affected:
+            affected.add(filename)
+            stack += dependents[filename]
+
+    # Ordering the affected modules, dependencies first.
+    ordered = []
+    def visit(filename: str, visiting: typing.Set[str]) -> None:
+        if filename in ordered or filename in visiting:
+            return
+        visiting.add(filename)
+        for dependency in sorted(imports[filename] & affected):
+            visit(dependency, visiting)
+        ordered.append(filename)
+    for filename in sorted(affected):
+        visit(filename, set())
+    return ordered
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=------------------=#
+# Watch mode section #
+#=------------------=#
+
+def snapshot_files(roots: typing.Iterable[str]) -> typing.Dict[str, int]:
+    """Get the modification time of every python files under the given root directories, indexed by absolute file name."""
+    return {entry.path: entry.stat().st_mtime_ns for root in roots for entry in walk_files(root, root, DEFAULT_INCLUDE, ())}
+
+def reload_modules(modules: typing.Dict[str, types.ModuleType], filenames: typing.List[str]) -> bool:
+    """Reload the modules of the given files in the given order, stopping at the first one failing to reload. Returns if every module were reloaded."""
+    linecache.checkcache()
+    for filename in filenames:
+        try:
+            # The test files modules, imported under their own names, can't be found again by name and are executed again in place.
+            if is_file_module(modules[filename]):
+                modules[filename].__spec__.loader.exec_module(modules[filename])
+            else:
+                importlib.reload(modules[filename])
+        except Exception:
+            print(f"\033[91m{traceback.format_exc()}\033[00m")
+            return False
+    return True
+
+def run_tests(
+        path      : str,
+        filenames : typing.Optional[typing.List[str]],
+        jobs      : typing.Optional[int],
+        include   : typing.Optional[typing.List[str]],
+        exclude   : typing.Optional[typing.List[str]],
+        keyword   : typing.Optional[str] = None,
+        marker    : typing.Optional[str] = None
+    ) -> None:
+    """Run the tests of the given test files, or of the whole given path if <filenames> is None, in a single test session.
+       Only the tests matching the <keyword> and <marker> expressions are run if given, their selection being updated at every run."""
+    selection = TestSelection()
+    if filenames is not None and os.path.isdir(path):
+        selection.exclude(skip_files=[get_test_path(e) for e in discover_test_files(path, include=include, exclude=exclude) if e not in filenames])
+    if keyword or marker:
+        selection.match(keyword, marker, select_expressions(path, keyword=keyword, marker=marker, include=include, exclude=exclude))
+    try:
+        if os.path.isdir(path):
+            test_directory(path=path, include=include, exclude=exclude, selection=selection)
+        else:
+            test_file(filename=path, jobs=jobs, selection=selection)
+    except Exception:
+        print(f"\033[91m{traceback.format_exc()}\033[00m")
+
+def watch(
+        path    : typing.Optional[str] = None,
+        jobs    : typing.Optional[int] = None,
+        include : typing.Optional[typing.List[str]] = None,
+        exclude : typing.Optional[typing.List[str]] = None,
+        keyword : typing.Optional[str] = None,
+        marker  : typing.Optional[str] = None
+    ) -> None:
+    """Run the tests of a given file or directory, and then re-run the affected ones every time a python file changes, until interrupted.
+       The files of the given path and of the current working directory are watched. Only the changed modules and the ones importing them,
+       directly or not, are reloaded in the same warm process, before re-running the tests of the reloaded or new test files in a single session.
+       Only the tests matching the <keyword> and <marker> expressions (see select_expressions) are run if given."""
+
+    # Retrieving the watched directories.
+    path  = os.path.abspath(path if path else '.')
+    roots = sorted({os.getcwd(), path if os.path.isdir(path) else os.path.dirname(path)})
+    roots = [root for root in roots if not any(root.startswith(os.path.join(other, '')) for other in roots)]
+
+    # Running every tests a first time, the files being run in this process so their modules stay imported.
+    snapshot = snapshot_files(roots)
+    run_tests(path, None, jobs, include, exclude, keyword, marker)
+    print(f"\033[90mWatching {', '.join(roots)} for changes...\033[00m")
+
+    try:
+        while True:
+            # Waiting for some files to change.
+            time.sleep(POLL_INTERVAL)
+            current = snapshot_files(roots)
+            if current == snapshot:
+                continue
+            changed  = {filename for (filename, mtime) in current.items() if snapshot.get(filename) != mtime}
+            snapshot = current
+
+            # Reloading the changed modules and their dependents.
+            modules  = get_project_modules(roots)
+            reloaded = get_dependents(modules, changed)
+            print(f"\n\033[90m{len(changed)} file{'s' if len(changed) > 1 else ''} changed, {len(reloaded)} module{'s' if len(reloaded) > 1 else ''} to reload.\033[00m")
+
+            # Re-running the test files that were reloaded or that are new, unless the reloading failed.
+            if reload_modules(modules, reloaded):
+                tests     = set(discover_test_files(path, include=include, exclude=exclude)) if os.path.isdir(path) else {path}
+                filenames = [filename for filename in sorted(tests) if filename in reloaded or filename in changed and filename not in modules]
+                if filenames:
+                    run_tests(path, filenames, jobs, include, exclude, keyword, marker)
+            print(f"\033[90mWatching {', '.join(roots)} for changes...\033[00m")
+
+    except KeyboardInterrupt:
+        print("\n\033[01mWatch mode stopped.\033[00m")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
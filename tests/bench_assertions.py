@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Benchmark of the pqt failing assertions.            
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, measuring the failing checks throughput.   |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+import typing
+import time
+import inspect
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "bench_assertions.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_BENCH_EXEC = 20000
+
+# =----------------------------------= #
+
+
+#=---------------------------=#
+# Benchmark functions section #
+#=---------------------------=#
+
+def stack_check(boolean: bool, error_msg: str = "") -> None:
+    """Failing check locating its caller with inspect.stack(), as the checks did before walking the frames (the baseline)."""
+    if not boolean:
+        stack = next(e for e in inspect.stack()[1:] if e.function not in ["ensure"])
+        raise TestFailedException(f"{stack.filename}:{stack.function[10:]}:{stack.lineno}: {error_msg}")
+
+def bench(name: str, func: typing.Callable[[], None], depth: int = 20) -> None:
+    """Print the throughput of a given failing check function, called <depth> frames deep like in a real test session."""
+    def nested(level: int) -> None:
+        if level:
+            return nested(level-1)
+        try:
+            func()
+        except (TestFailedException, TestInvalidException):
+            pass
+    start = time.perf_counter()
+    for _ in range(NBR_BENCH_EXEC):
+        nested(depth)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {NBR_BENCH_EXEC/elapsed:>12.0f} failing checks/s  ({1e6*elapsed/NBR_BENCH_EXEC:.2f}us per check)")
+
+# =---------------------------------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the benchmark if the file is directly executed.
+if __name__ == '__main__':
+    bench("baseline", lambda: stack_check(False, "failed"))
+    bench("check",    lambda: check(False, "failed"))
+    bench("ensure",   lambda: ensure(False, "failed"))
+    bench("check_eq", lambda: check_eq(1, 2, "failed"))
+    bench("ko",       lambda: ko("failed"))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Benchmark of the pqt passing iterations.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, measuring the passing iterations overhead. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.test       import run_iteration
+from pyquicktools.pyquicktest.rewrite    import rewrite_test
+import typing
+import time
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "bench_iterations.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_BENCH_EXEC = 1000000
+
+# =----------------------------------= #
+
+
+#=---------------------------=#
+# Benchmark functions section #
+#=---------------------------=#
+
+@test
+def trivial_ensure():
+    "Trivial test validated by ensure."
+    ensure(True)
+
+@test
+def trivial_ok():
+    "Trivial test validated by ok."
+    ok()
+
+def bench(name: str, func: typing.Callable[[], None], test_func: typing.Callable[[], None]) -> None:
+    """Print the overhead of a given passing test function iterations."""
+    start = time.perf_counter()
+    for _ in range(NBR_BENCH_EXEC):
+        run_iteration(func, test_func)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {NBR_BENCH_EXEC/elapsed:>12.0f} iterations/s  ({1e9*elapsed/NBR_BENCH_EXEC:.0f}ns per iteration)")
+
+# =---------------------------------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the benchmark if the file is directly executed.
+if __name__ == '__main__':
+    for test_func in (trivial_ensure, trivial_ok):
+        bench(f"{test_func.__name__} (raise)",  test_func,                                test_func)
+        bench(f"{test_func.__name__} (return)", rewrite_test(test_func, caller_file=__file__, use_cache=False), test_func)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt asynchronous tests.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the concurrent asynchronous tests. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.report     import load_report
+import typing
+import os
+import sys
+import tempfile
+import textwrap
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_asynchronous.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Source code of a test file whose asynchronous tests record their spans and how many iterations of the same test were running with them.
+ASYNC_SOURCE   = """
+    from pyquicktools.pyquicktest.assertions import *
+    from pyquicktools.pyquicktest.decorators import *
+    import os
+    import time
+    import asyncio
+
+    RUNNING = {}
+
+    async def record_span(name, delay):
+        RUNNING[name] = running = RUNNING.get(name, 0) + 1
+        start = time.monotonic()
+        await asyncio.sleep(delay)
+        RUNNING[name] -= 1
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "spans.log"), 'a') as file:
+            file.write(f"{name} {start} {time.monotonic()} {running}\\n")
+
+    @test
+    async def test_a():
+        await record_span("test_a", 0.3)
+        ok()
+
+    @test
+    async def test_b():
+        await record_span("test_b", 0.3)
+        ok()
+
+    @test
+    @execnbr(8, concurrency=4)
+    async def test_iterations():
+        await record_span("test_iterations", 0.1)
+        ok()
+
+    @test
+    @pqt_timeout(0.2)
+    async def test_timeout():
+        await asyncio.sleep(60)
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def run_session(root: str, *args: str) -> typing.Tuple[str, typing.Dict[str, typing.Dict[str, typing.Any]], typing.Dict[str, typing.List[typing.Tuple[float, float, int]]]]:
+    """Run a test session of the ASYNC_SOURCE test file in a given root directory with the given CLI arguments, in its own process,
+       and return its output, its reported tests results indexed by name, and the (start, end, running) spans of every test iterations."""
+    with open(os.path.join(root, "test_async.py"), 'w') as file:
+        file.write(textwrap.dedent(ASYNC_SOURCE))
+    for filename in ("spans.log", "report.jsonl"):
+        if os.path.exists(os.path.join(root, filename)):
+            os.remove(os.path.join(root, filename))
+    process = subprocess.run(
+        [sys.executable, "-m", "pyquicktools.cli", "test", "--no-server", "-p", "test_async.py", "--jsonl", "report.jsonl", *args],
+        cwd=root, capture_output=True, text=True, timeout=120
+    )
+    spans   = {}
+    with open(os.path.join(root, "spans.log")) as file:
+        for (name, start, end, running) in (line.split() for line in file):
+            spans.setdefault(name, []).append((float(start), float(end), int(running)))
+    return (process.stdout, {result["name"]: result for result in load_report(os.path.join(root, "report.jsonl"))[2]}, spans)
+
+def overlap(first: typing.Tuple[float, float, int], second: typing.Tuple[float, float, int]) -> bool:
+    """Check if two spans overlap."""
+    return first[0] < second[1] and second[0] < first[1]
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Asynchronous tests", "Session concurrency")
+def test_async_concurrency_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the asynchronous tests of a session run at once with a concurrency, one after the other without,
+       and that a timed out asynchronous test is cancelled and reported as failed."""
+    with tempfile.TemporaryDirectory() as root:
+        (output, results, spans) = run_session(root, "-k", "not test_iterations", "--concurrency", "4")
+        statuses = {name: result["status"] for (name, result) in results.items()}
+        expected = {"test_a": "passed", "test_b": "passed", "test_timeout": "failed"}
+        check(statuses == expected,                                  f"The reported tests are <{statuses}> instead of <{expected}>: <{output}>.")
+        check("Timeout after 0.2 seconds" in output,                 f"The timeout of the test <test_timeout> isn't printed: <{output}>.")
+        check(overlap(spans["test_a"][0], spans["test_b"][0]),       f"The tests didn't run at once with a concurrency: <{spans}>.")
+        (output, results, spans) = run_session(root, "-k", "test_a or test_b")
+        ensure(not overlap(spans["test_a"][0], spans["test_b"][0]),  f"The tests ran at once without concurrency: <{spans}>.")
+
+@group("Asynchronous tests", "Iterations concurrency")
+def test_async_concurrency_2() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that at most <concurrency> iterations of an asynchronous test run at once, all of them being counted."""
+    with tempfile.TemporaryDirectory() as root:
+        (output, results, spans) = run_session(root, "-k", "test_iterations")
+    result  = results.get("test_iterations", {})
+    running = max(e[2] for e in spans["test_iterations"])
+    check((result.get("iterations"), result.get("passed")) == (8, 8),  f"The test ran <{result}> instead of 8 passed iterations: <{output}>.")
+    ensure(running == 4,                                               f"The test ran {running} iterations at once instead of 4.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt test files discovery and loading.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the test files discovery/loading.  |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.collect    import discover_test_files, collect_file
+from pyquicktools.pyquicktest.utils      import import_file, get_callable_ctx_from_file
+from pyquicktools.pyquicktest.rewrite    import rewrite_test
+import typing
+import os
+import sys
+import tempfile
+import textwrap
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_collect.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Source code of a test file whose test checks that its module constant is the name of its directory.
+TEST_SOURCE    = """
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+
+DIRECTORY = "{directory}"
+
+@test
+def test_in_{directory}():
+    ensure(DIRECTORY == "{directory}", f"The test of the directory {directory} sees the constant of the directory <{{DIRECTORY}}>.")
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def make_tree(root: str, files: typing.Dict[str, str]) -> typing.List[str]:
+    """Write the given files, indexed by their path relative to a given root directory, and return their absolute paths."""
+    for (relpath, source) in files.items():
+        os.makedirs(os.path.dirname(os.path.join(root, relpath)), exist_ok=True)
+        with open(os.path.join(root, relpath), 'w') as file:
+            file.write(textwrap.dedent(source))
+    return [os.path.join(root, relpath) for relpath in files]
+
+def make_same_name_tree(root: str, directories: typing.Iterable[str]) -> typing.List[str]:
+    """Write a test file of the same name "test_same.py" in every given subdirectory of a root directory (see TEST_SOURCE)."""
+    return make_tree(root, {os.path.join(directory, "test_same.py"): TEST_SOURCE.format(directory=os.path.basename(directory)) for directory in directories})
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Test files", "Discovery")
+def test_discover_test_files_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the test files are recursively discovered in a sorted order, skipping the hidden, excluded and test-less files."""
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, {
+            "b/test_b.py"              : "@test\ndef test_b(): pass\n",
+            "a/c/test_c.py"            : "@test\ndef test_c(): pass\n",
+            "a/test_a.pyw"             : "@test\ndef test_a(): pass\n",
+            "a/helpers.py"             : "def helper(): pass\n",
+            ".hidden/test_hidden.py"   : "@test\ndef test_hidden(): pass\n",
+            "__pycache__/test_cache.py": "@test\ndef test_cache(): pass\n",
+            "skipped/test_skipped.py"  : "@test\ndef test_skipped(): pass\n",
+        })
+        files = [os.path.relpath(e, root) for e in discover_test_files(root, exclude=["skipped"], use_index=False)]
+    ensure(files == ["a/c/test_c.py", "a/test_a.pyw", "b/test_b.py"], f"The discovered test files are <{files}>.")
+
+@group("Test files", "Discovery")
+def test_collect_file_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the test decorators arguments are statically collected, the module constants being resolved."""
+    with tempfile.TemporaryDirectory() as root:
+        (filename,) = make_tree(root, {"test_static.py": """
+            COUNT = 10
+
+            @group("G", "H")
+            @execnbr(COUNT, parallel=4)
+            @add_flag("slow")
+            async def test_static():
+                '''Doc.'''
+        """})
+        (test,) = collect_file(filename)
+    expected = {"name": "test_static", "doc": "Doc.", "group": ["G", "H"], "execnbr": 10, "parallel": 4, "async": True, "markers": ["slow"]}
+    ensure(all(test[key] == value for (key, value) in expected.items()), f"The collected test is <{test}> instead of <{expected}>.")
+
+@group("Test files", "Loading")
+def test_import_file_same_name_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the test files sharing their name in different directories are loaded as different modules, once each."""
+    with tempfile.TemporaryDirectory() as root:
+        (file_a, file_b) = make_same_name_tree(root, ("a", "b"))
+        (ctx_a, ctx_b)   = (get_callable_ctx_from_file(file_a), get_callable_ctx_from_file(file_b))
+        check("test_in_a" in ctx_a and "test_in_b" not in ctx_a,  f"The context of the file <{file_a}> is <{sorted(ctx_a)}>.")
+        check("test_in_b" in ctx_b and "test_in_a" not in ctx_b,  f"The context of the file <{file_b}> is <{sorted(ctx_b)}>.")
+        ensure(import_file(file_a) is import_file(file_a),        "The same test file was loaded twice.")
+
+@group("Test files", "Loading")
+def test_rewrite_same_name_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the rewritten tests see the global names of their own file, and not of another file sharing its name."""
+    with tempfile.TemporaryDirectory() as root:
+        (file_a, file_b) = make_same_name_tree(root, ("a", "b"))
+        import_file(file_a)
+        (result, error)  = (None, None)
+        try:
+            result = rewrite_test(import_file(file_b).test_in_b, caller_file=file_b, use_cache=False)()
+        except (TestFailedException, TestInvalidException) as e:
+            error = e
+    ensure(error is None and result is TEST_PASSED, f"The rewritten test returned <{result!r}> and raised <{error!r}>.")
+
+@group("Test files", "Loading")
+def test_directory_same_name_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that a directory session runs the tests of every nested test files sharing their name."""
+    with tempfile.TemporaryDirectory() as root:
+        make_same_name_tree(root, ("a", "b", os.path.join("b", "c")))
+        code    = f"from pyquicktools.pyquicktest.test import test_directory; import sys; sys.exit(len(test_directory(path={root!r})))"
+        process = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    check(process.returncode == 0,                                       f"The directory session failed with the output <{process.stdout}>.")
+    for name in ("test_in_a", "test_in_b", "test_in_c"):
+        check(name in process.stdout,                                    f"The test <{name}> didn't run: <{process.stdout}>.")
+    ok()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt worker processes running the tests.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the sessions run by worker pools.  |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.report     import load_report
+import typing
+import os
+import sys
+import tempfile
+import textwrap
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_parallel.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC    = 100
+
+# Source code of a test file whose tests record the process running them, the last one failing.
+POOL_SOURCE       = """
+    from pyquicktools.pyquicktest.assertions import *
+    from pyquicktools.pyquicktest.decorators import *
+    import os
+
+    def record_pid():
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "pids.log"), 'a') as file:
+            file.write(f"{os.getpid()}\\n")
+
+    @group("G")
+    def test_1():
+        record_pid()
+        ok()
+
+    @group("G")
+    def test_2():
+        record_pid()
+        ok()
+
+    @test
+    def test_3():
+        record_pid()
+        ok()
+
+    @test
+    def test_4():
+        record_pid()
+        ensure(False, "test_4 failed")
+"""
+
+# Source code of a test file whose iterations are fanned out across worker processes, failing at random and recording their failures.
+ITERATIONS_SOURCE = """
+    from pyquicktools.pyquicktest.assertions import *
+    from pyquicktools.pyquicktest.decorators import *
+    import os
+    import random
+
+    def record_failure(name):
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.log"), 'a') as file:
+            file.write("x")
+
+    @test
+    @execnbr(200, parallel=4)
+    def test_all():
+        if random.random() < 0.3:
+            record_failure("test_all")
+            ensure(False, "iteration failed")
+        ok()
+
+    @test
+    @execnbr(200, parallel=4, stop_on_first_failure=True)
+    def test_first():
+        ensure(random.random() >= 0.1, "iteration failed")
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def run_session(root: str, source: str, *args: str) -> typing.Tuple[int, str, typing.List[typing.Dict[str, typing.Any]]]:
+    """Run a test session of a test file of a given source code in a given root directory with the given CLI arguments, in its own process,
+       and return the process id, its output and the reported tests results."""
+    with open(os.path.join(root, "test_session.py"), 'w') as file:
+        file.write(textwrap.dedent(source))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "pyquicktools.cli", "test", "--no-server", "-p", "test_session.py", "--jsonl", "report.jsonl", *args],
+        cwd=root, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    output = process.communicate(timeout=120)[0]
+    return (process.pid, output, load_report(os.path.join(root, "report.jsonl"))[2])
+
+def read_pids(root: str) -> typing.List[int]:
+    """Read the ids of the processes which ran the tests of a session in a given root directory (see POOL_SOURCE)."""
+    with open(os.path.join(root, "pids.log")) as file:
+        return [int(e) for e in file.read().split()]
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Worker processes", "Tests pool")
+def test_pool_session_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the tests of a session with several jobs run in the worker processes, every result and failure being reported."""
+    with tempfile.TemporaryDirectory() as root:
+        (pid, output, results) = run_session(root, POOL_SOURCE, "-j", "2")
+        pids = read_pids(root)
+    statuses = {result["name"]: result["status"] for result in results}
+    expected = {"test_1": "passed", "test_2": "passed", "test_3": "passed", "test_4": "failed"}
+    check(statuses == expected,                         f"The reported tests are <{statuses}> instead of <{expected}>: <{output}>.")
+    check(len(pids) == 4 and pid not in pids,           f"The tests ran in the processes <{pids}>, the session process being {pid}.")
+    ensure("test_4 failed" in output,                   f"The failure of the test <test_4> isn't printed: <{output}>.")
+
+@group("Worker processes", "Iterations")
+def test_parallel_iterations_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the failed iterations fanned out across worker processes are all counted, and that a session stopping
+       on the first failure counts the first one only."""
+    with tempfile.TemporaryDirectory() as root:
+        (_, output, results) = run_session(root, ITERATIONS_SOURCE)
+        with open(os.path.join(root, "test_all.log")) as file:
+            failures = len(file.read())
+    (all_, first) = ({result["name"]: result for result in results}.get(name, {}) for name in ("test_all", "test_first"))
+    check(all_.get("iterations") == 200,                                         f"The test <test_all> ran {all_.get('iterations')} iterations instead of 200: <{output}>.")
+    check((all_.get("failed"), all_.get("passed")) == (failures, 200-failures),  f"The test <test_all> counts <{all_}> instead of {failures} failures.")
+    check(first.get("failed") == 1,                                              f"The test <test_first> counts {first.get('failed')} failures instead of 1: <{output}>.")
+    ensure(first.get("iterations") == first.get("passed", 0) + 1 < 200,          f"The test <test_first> ran {first.get('iterations')} iterations, {first.get('passed')} passing.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
@@ -37,6 +37,7 @@ from pyquicktools.pyquicktest.decorators import *
 from pyquicktools.pyquicktest.gen        import *
 from pyquicktools.pyquicktest.test       import *
 from pyquicktools.pyquicktest.utils      import *
+from pyquicktools.pyquicktest.selection  import TestSelection
 import typing
 
 
@@ -197,6 +198,19 @@ def test_get_all_functions_2() -> typing.Union[TestPassedException, TestFailedEx
     map1(lambda func: setattr(func, "attr", gen_random_value()), list(ctx.values()))
     ensure(get_all_functions("attr", ctx=ctx) == list(ctx.values()), f"The iterable of functions returned doesn't match the given context for the added attributes.")
 
+@group("Test sessions", "Groups")
+def test_test_group_unknown_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that running an unknown group raises a KeyError, but not running a known group whose tests are all left out by the selection."""
+    ctx = {"test_a": group("G", "H")(lambda: None)}
+    for path in (("Missing",), ("G", "Missing"), ("G", "H", "I")):
+        error = None
+        try:
+            test_group(*path, ctx=ctx, filename="tests_groups.py")
+        except KeyError as e:
+            error = e
+        check(error is not None and "::".join(path) in str(error),  f"Running the unknown group <{path}> raised <{error!r}>.")
+    ensure(test_group("G", ctx=ctx, filename="tests_groups.py", selection=TestSelection(only=[])) == [], "Running a group whose tests are all deselected ran some tests.")
+
 # =---------------------------------------------------------------------------------------------------------------------------------------------------------------= #
 
 
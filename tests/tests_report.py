@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt test results reporters.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the JSON Lines and JUnit reports.  |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.report     import JSONLinesReporter, JUnitXMLReporter, load_report
+from pyquicktools.pyquicktest.utils      import read_file
+import typing
+import os
+import tempfile
+import xml.etree.ElementTree
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_report.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def gen_result(file: str, group: typing.List[str], name: str, message: typing.Optional[str] = None) -> typing.Dict[str, typing.Any]:
+    """Generate the result of a test of a given file, group and name, failed with a given message if any, as recorded by the test sessions."""
+    return {
+        "id": "::".join([file, *group, name]), "file": file, "group": group, "name": name, "status": "failed" if message else "passed",
+        "duration_ns": gen_int(max=10**9), "execnbr": 10, "iterations": 10, "passed": 9 if message else 10, "failed": 1 if message else 0,
+        "message": message, "latency": None
+    }
+
+def write_report(path: str, reporter_class: typing.Type, results: typing.List[typing.Dict[str, typing.Any]], duration: int = 0) -> str:
+    """Write a report of a test session of the given results to a given path with a given reporter class, and return its content."""
+    reporter = reporter_class(path)
+    reporter.session_start({"working": os.path.dirname(path), "length": len(results)})
+    for result in results:
+        reporter.test_result(result)
+    reporter.session_end({"duration_ns": duration, "length": len(results), "failed": [e["id"] for e in results if e["message"]], "interrupted": False})
+    reporter.close()
+    return read_file(path)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Reporters", "JUnit XML")
+def test_junit_xml_suites_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the files and groups of the tests are nested test suites, closed and reopened as the results come."""
+    results = [gen_result("a.py", ["G", "H"], "test_1"), gen_result("a.py", ["G"], "test_2"), gen_result("b.py", [], "test_3"), gen_result("a.py", ["G"], "test_4")]
+    with tempfile.TemporaryDirectory() as directory:
+        root = xml.etree.ElementTree.fromstring(write_report(os.path.join(directory, "report.xml"), JUnitXMLReporter, results))
+    suites = [(suite.get("name"), [e.get("name") for e in suite.iter("testcase")]) for suite in root]
+    ensure(suites == [("a.py", ["test_1", "test_2"]), ("b.py", ["test_3"]), ("a.py", ["test_4"])], f"The test suites are <{suites}>.")
+
+@group("Reporters", "JUnit XML")
+def test_junit_xml_message_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the failure messages are written without their ANSI color sequences nor the other characters forbidden in XML documents."""
+    message = "\033[91mfile.py:test:1: \033[01;33mfailed\033[00m\x00 \x08here\nwhere x = 1"
+    with tempfile.TemporaryDirectory() as directory:
+        root = xml.etree.ElementTree.fromstring(write_report(os.path.join(directory, "report.xml"), JUnitXMLReporter, [gen_result("a.py", [], "test_1", message)]))
+    failure = next(root.iter("failure"))
+    check(failure.get("message") == "file.py:test:1: failed here",  f"The failure message attribute is <{failure.get('message')!r}>.")
+    ensure(failure.text == "file.py:test:1: failed here\nwhere x = 1", f"The failure message is <{failure.text!r}>.")
+
+@group("Reporters", "JSON Lines")
+@execnbr(NBR_TESTS_EXEC)
+def test_json_lines_load_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that a JSON Lines report loads back as its tests results and session duration."""
+    results  = [gen_result(f"{gen_ascii_string(length=5)}.py", gen_list(length=gen_int(max=3), gen_element=gen_ascii_string), f"test_{i}", gen_ascii_string() if gen_bool() else None) for i in range(gen_int(max=10))]
+    duration = gen_int(max=10**12)
+    with tempfile.TemporaryDirectory() as directory:
+        write_report(os.path.join(directory, "report.jsonl"), JSONLinesReporter, results, duration)
+        loaded = load_report(os.path.join(directory, "report.jsonl"))
+    check(loaded[0] == duration,      f"The loaded duration is {loaded[0]} instead of {duration}.")
+    check(loaded[1] == False,         "The loaded session is interrupted.")
+    ensure(loaded[2] == results,      f"The loaded results <{loaded[2]}> aren't the reported ones <{results}>.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
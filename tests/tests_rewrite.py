@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt check/ensure rewriting.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the check/ensure calls rewriting.  |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.rewrite    import CheckRewriter, format_where, NOT_EVALUATED, get_rewrite_key, get_rewrite_path, save_rewritten_code
+import pyquicktools.pyquicktest.assertions
+import typing
+import os
+import ast
+import tempfile
+import textwrap
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_rewrite.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def record(log: typing.List[typing.Any], value: typing.Any) -> typing.Any:
+    """Append a value to a given log and return it, to observe which sub-expressions are evaluated and in which order."""
+    log.append(value)
+    return value
+
+def rewrite_source(source: str) -> typing.Tuple[ast.AST, typing.Callable[[typing.List[typing.Any]], typing.Any]]:
+    """Rewrite the source code of a function taking a log (see record) and return its rewritten syntax tree and function."""
+    tree      = ast.fix_missing_locations(CheckRewriter().visit(ast.parse(textwrap.dedent(source))))
+    namespace = {**vars(pyquicktools.pyquicktest.assertions), "format_where": format_where, "NOT_EVALUATED": NOT_EVALUATED, "record": record}
+    exec(compile(tree, "<rewritten>", "exec"), namespace)
+    return (tree, namespace[tree.body[0].name])
+
+def run_rewritten(source: str) -> typing.Tuple[typing.Any, typing.Optional[BaseException], typing.List[typing.Any]]:
+    """Rewrite and call a function taking a log, returning its result, the validation exception it raised if any and its log."""
+    (log, result, error) = ([], None, None)
+    try:
+        result = rewrite_source(source)[1](log)
+    except (TestPassedException, TestFailedException, TestInvalidException) as e:
+        error = e
+    return (result, error, log)
+
+def make_test(root: str, name: str, source: str) -> typing.Callable[[object], object]:
+    """Define a test function <name> of a given source code, as if defined by a file of a given directory."""
+    namespace = {}
+    exec(compile(textwrap.dedent(source), os.path.join(root, "tests_cached.py"), "exec"), namespace)
+    namespace[name].__source__ = namespace[name].__rewritten_source__ = textwrap.dedent(source)
+    return namespace[name]
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Check rewriting", "Hoisting")
+def test_rewrite_hoisting_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the condition sub-calls are hoisted into assignment expressions, evaluated once and in order, and explained on failure."""
+    source = """
+    def body(log):
+        check(record(log, 1) + record(log, 2) == record(log, 4), "sum")
+    """
+    (tree, _)            = rewrite_source(source)
+    (result, error, log) = run_rewritten(source)
+    check(any(isinstance(e, ast.NamedExpr) for e in ast.walk(tree)),  f"The sub-calls weren't hoisted: <{ast.unparse(tree)}>.")
+    check(log == [1, 2, 4],                                           f"The sub-calls were evaluated as <{log}>.")
+    check(isinstance(error, TestFailedException),                     f"The failed check raised <{error!r}>.")
+    for line in ("sum\nwhere", "record(log, 1) = 1", "record(log, 2) = 2", "record(log, 4) = 4"):
+        check(line in str(error),                                     f"The failure message <{error}> doesn't contain <{line}>.")
+    ok()
+
+@group("Check rewriting", "Hoisting")
+@execnbr(NBR_TESTS_EXEC)
+def test_rewrite_hoisting_2() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the nested sub-calls are hoisted in their evaluation order, with random values."""
+    (x, y)               = (gen_int(max=10), gen_int(max=10))
+    (result, error, log) = run_rewritten(f"""
+    def body(log):
+        check(record(log, record(log, {x}) + {y}) == {x+y}, "nested")
+    """)
+    check(error is None,        f"The passing check raised <{error!r}>.")
+    ensure(log == [x, x+y],     f"The sub-calls were evaluated as <{log}> instead of <{[x, x+y]}>.")
+
+@group("Check rewriting", "Hoisting")
+def test_rewrite_hoisting_3() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the calls bound inside lambdas and comprehensions stay in their scope."""
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        check(all(record(log, e) for e in [1, 2]) and (lambda: record(log, 3))(), "scoped")
+    """)
+    check(error is None,        f"The passing check raised <{error!r}>.")
+    ensure(log == [1, 2, 3],    f"The sub-calls were evaluated as <{log}>.")
+
+@group("Check rewriting", "Short-circuits")
+def test_rewrite_short_circuit_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that a failing "and" condition doesn't evaluate its right operand, which is explained as not evaluated."""
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        check(record(log, 0) and record(log, 1), "and")
+    """)
+    check(log == [0],                                                      f"The sub-calls were evaluated as <{log}>.")
+    check(isinstance(error, TestFailedException),                          f"The failed check raised <{error!r}>.")
+    ensure(f"record(log, 1) = {NOT_EVALUATED}" in str(error),              f"The failure message <{error}> doesn't explain the skipped operand.")
+
+@group("Check rewriting", "Short-circuits")
+def test_rewrite_short_circuit_2() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that an "or" condition only evaluates its right operand if its left one is falsy."""
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        check(record(log, 1) or record(log, 2), "or")
+    """)
+    check(error is None and log == [1],                                    f"The passing check raised <{error!r}> after evaluating <{log}>.")
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        check(record(log, 0) or record(log, ""), "or")
+    """)
+    check(log == [0, ""],                                                  f"The sub-calls were evaluated as <{log}>.")
+    ensure(isinstance(error, TestFailedException),                         f"The failed check raised <{error!r}>.")
+
+@group("Check rewriting", "Short-circuits")
+def test_rewrite_lazy_message_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the formatted failure messages are only formatted when the check fails."""
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        check(record(log, 1), f"{record(log, 'formatted')}")
+    """)
+    check(error is None and log == [1],                                    f"The passing check raised <{error!r}> after evaluating <{log}>.")
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        check(record(log, 0), f"{record(log, 'formatted')}")
+    """)
+    check(log == [0, "formatted"],                                         f"The sub-calls were evaluated as <{log}>.")
+    ensure("formatted" in str(error),                                      f"The failure message <{error}> wasn't formatted.")
+
+@group("Check rewriting", "Returns")
+def test_rewrite_returns_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the ok and ensure calls of the test body return the TEST_PASSED sentinel instead of raising, skipping the following statements."""
+    for validation in ("ok()", "ensure(record(log, 1))", "ensure_eq(1, 1)", "ensure(True, f'{record(log, 2)}')"):
+        (result, error, log) = run_rewritten(f"""
+        def body(log):
+            {validation}
+            record(log, "after")
+        """)
+        check(error is None,                                               f"The validation <{validation}> raised <{error!r}>.")
+        check(result is TEST_PASSED,                                       f"The validation <{validation}> returned <{result!r}>.")
+        check("after" not in log,                                          f"The statements following the validation <{validation}> were executed.")
+    ok()
+
+@group("Check rewriting", "Returns")
+def test_rewrite_returns_2() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the ensure functions are rewritten into their check function, and still fail."""
+    source = """
+    def body(log):
+        ensure_eq(record(log, 1), 2)
+    """
+    (tree, _)            = rewrite_source(source)
+    (result, error, log) = run_rewritten(source)
+    names                = {e.id for e in ast.walk(tree) if isinstance(e, ast.Name)}
+    check("check_eq" in names and "ensure_eq" not in names,                f"The ensure_eq call wasn't rewritten: <{ast.unparse(tree)}>.")
+    ensure(error is not None and result is None,                           f"The failed ensure_eq returned <{result!r}> and raised <{error!r}>.")
+
+@group("Check rewriting", "Returns")
+def test_rewrite_returns_3() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the validations of nested functions and of try bodies catching the TestPassedException still raise it."""
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        def inner():
+            ok()
+        inner()
+    """)
+    check(isinstance(error, TestPassedException),                          f"The nested ok call raised <{error!r}>.")
+    for catcher in ("TestPassedException", "Exception", "(ValueError, BaseException)", ""):
+        (result, error, log) = run_rewritten(f"""
+        def body(log):
+            try:
+                ensure(True)
+            except {catcher}:
+                record(log, "caught")
+        """)
+        check(log == ["caught"],                                           f"The handler <except {catcher}> didn't catch the TestPassedException.")
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        try:
+            ok()
+        except ValueError:
+            record(log, "caught")
+        record(log, "after")
+    """)
+    ensure(result is TEST_PASSED and not log,                              f"The ok call of a try body not catching it returned <{result!r}> after evaluating <{log}>.")
+
+@group("Check rewriting", "Returns")
+def test_rewrite_returns_4() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the validations of with bodies still raise the TestPassedException, which their context managers might suppress."""
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        import contextlib
+        with contextlib.suppress(TestPassedException):
+            ensure(record(log, True))
+        record(log, "after")
+    """)
+    check(error is None and log == [True, "after"],                        f"The suppressed ensure call raised <{error!r}> after evaluating <{log}>.")
+    (result, error, log) = run_rewritten("""
+    def body(log):
+        import contextlib
+        with contextlib.nullcontext():
+            ok()
+    """)
+    ensure(isinstance(error, TestPassedException),                         f"The ok call of a with body returned <{result!r}> and raised <{error!r}>.")
+
+@group("Check rewriting", "Cache")
+def test_rewrite_cache_prune_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that saving the rewritten code of a test removes the entries of its previous source codes, and only them."""
+    with tempfile.TemporaryDirectory() as root:
+        (old, new, other) = (make_test(root, "test_a", "def test_a(): ok()"), make_test(root, "test_a", "def test_a(): ensure(True)"), make_test(root, "test_b", "def test_b(): ok()"))
+        paths             = [get_rewrite_path(test, get_rewrite_key(test)) for test in (old, other, new)]
+        for path in paths:
+            save_rewritten_code(path, compile("pass", "<cached>", "exec"))
+        kept = [os.path.exists(path) for path in paths]
+    ensure(kept == [False, True, True], f"The entries of the old test_a, test_b and the new test_a kept are <{kept}>.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
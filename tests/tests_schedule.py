@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt test suite sharding.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the shards assignment of tests.    |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.schedule   import Shard, DurationEstimator, balance_shards, parse_shard
+from pyquicktools.pyquicktest.collect    import collect_file
+from pyquicktools.pyquicktest.selection  import TestSelection, get_func_id
+from pyquicktools.pyquicktest.utils      import import_file
+import typing
+import os
+import sys
+import random
+import tempfile
+import textwrap
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_schedule.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Shards of a few test ids, as computed by every machine whatever its platform and python hash seed.
+KNOWN_SHARDS   = {("tests_a.py::test_1", 4): 4, ("tests_a.py::group::test_2", 4): 2, ("dir/tests_b.py::test_3", 8): 2}
+
+# Source code of a test file whose group path is only known at runtime.
+DYNAMIC_SOURCE = """
+    from pyquicktools.pyquicktest.decorators import *
+
+    NAME = "dynamic"
+
+    @group(NAME.upper())
+    def test_dynamic():
+        pass
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def gen_static_tests(length: int) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Generate statically collected tests of distinct ids, with random groups and numbers of iterations."""
+    return [
+        {"file": f"tests_{gen_int(max=3)}.py", "group": [gen_ascii_string(length=4)] if gen_bool() else None, "name": f"test_{i}", "execnbr": gen_int(min=1, max=1000), "static": True}
+        for i in range(length)
+    ]
+
+def gen_history(tests: typing.List[typing.Dict[str, typing.Any]]) -> typing.Dict[str, typing.Tuple[str, int, int]]:
+    """Generate the stored last results of a random part of the given tests."""
+    return {
+        get_test_id(test["file"], test["group"], test["name"]): ("passed", gen_int(min=1, max=10**9), test["execnbr"])
+        for test in tests if gen_bool()
+    }
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Sharding", "Hashed shards")
+@execnbr(NBR_TESTS_EXEC)
+def test_shard_partition_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that every test id belongs to exactly one of the shards."""
+    count = gen_int(min=1, max=16)
+    for id_ in gen_list(length=50, gen_element=lambda: f"tests_{gen_ascii_string(length=5)}.py::{gen_ascii_string()}"):
+        owners = [index for index in range(1, count+1) if id_ in Shard(index, count)]
+        check(owners == [Shard(1, count).get_shard(id_)], f"The test id <{id_}> belongs to the shards <{owners}> out of {count}.")
+    ok()
+
+@group("Sharding", "Hashed shards")
+def test_shard_stable_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the shards of some test ids are the known ones, whatever the python hash seed of the process computing them."""
+    for ((id_, count), index) in KNOWN_SHARDS.items():
+        check(Shard(1, count).get_shard(id_) == index, f"The test id <{id_}> belongs to the shard {Shard(1, count).get_shard(id_)}/{count} instead of {index}/{count}.")
+    code    = f"from pyquicktools.pyquicktest.schedule import Shard; print([Shard(1, count).get_shard(id_) for (id_, count) in {list(KNOWN_SHARDS)}])"
+    outputs = [
+        subprocess.run([sys.executable, "-c", code], env={**os.environ, "PYTHONHASHSEED": str(seed)}, capture_output=True, text=True).stdout.strip()
+        for seed in (0, 1, 12345)
+    ]
+    ensure(outputs == 3*[str(list(KNOWN_SHARDS.values()))], f"The shards computed by processes of different hash seeds are <{outputs}>.")
+
+@group("Sharding", "Hashed shards")
+def test_parse_shard_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test the parsing of the valid and invalid shard specifications."""
+    check(parse_shard("3/8") == (3, 8), f"The shard <3/8> is parsed as <{parse_shard('3/8')}>.")
+    for spec in ("0/4", "5/4", "1", "a/b", "1/2/3", ""):
+        error = None
+        try:
+            parse_shard(spec)
+        except ValueError as e:
+            error = e
+        check(error is not None, f"The invalid shard <{spec}> didn't raise a ValueError.")
+    ok()
+
+@group("Sharding", "Balanced shards")
+@execnbr(NBR_TESTS_EXEC)
+def test_balance_shards_partition_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that every test is assigned to exactly one existing shard, and that the assigned shards partition the tests."""
+    (tests, count) = (gen_static_tests(gen_int(max=60)), gen_int(min=1, max=8))
+    assigned       = balance_shards(tests, count, DurationEstimator(gen_history(tests)))
+    ids            = [get_test_id(test["file"], test["group"], test["name"]) for test in tests]
+    check(sorted(assigned) == sorted(ids),                 f"The assigned tests <{sorted(assigned)}> aren't the given ones <{sorted(ids)}>.")
+    check(all(1 <= e <= count for e in assigned.values()),  f"Some tests are assigned to shards out of [1, {count}]: <{assigned}>.")
+    for id_ in ids:
+        owners = [index for index in range(1, count+1) if id_ in Shard(index, count, assigned)]
+        check(owners == [assigned[id_]],                    f"The test id <{id_}> belongs to the shards <{owners}> instead of <{assigned[id_]}>.")
+    ok()
+
+@group("Sharding", "Balanced shards")
+@execnbr(NBR_TESTS_EXEC)
+def test_balance_shards_stable_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the assignment doesn't depend on the order of the collected tests, and is the same from run to run."""
+    (tests, count) = (gen_static_tests(gen_int(max=60)), gen_int(min=1, max=8))
+    history        = gen_history(tests)
+    assigned       = balance_shards(tests, count, DurationEstimator(history))
+    shuffled       = random.sample(tests, len(tests))
+    check(balance_shards(shuffled, count, DurationEstimator(history)) == assigned, "The assignment changed with the order of the tests.")
+    ensure(balance_shards(tests, count, DurationEstimator(history)) == assigned,   "The assignment changed from run to run.")
+
+@group("Sharding", "Balanced shards")
+@execnbr(NBR_TESTS_EXEC)
+def test_balance_shards_balanced_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the estimated loads of the shards differ by at most the longest estimated test duration."""
+    (tests, count) = (gen_static_tests(gen_int(min=1, max=60)), gen_int(min=1, max=8))
+    estimator      = DurationEstimator(gen_history(tests))
+    estimates      = {
+        get_test_id(test["file"], test["group"], test["name"]): estimator.durations.get(get_test_id(test["file"], test["group"], test["name"])) or estimator.estimate_iterations(test["execnbr"])
+        for test in tests
+    }
+    loads          = [0]*count
+    for (id_, index) in balance_shards(tests, count, estimator).items():
+        loads[index-1] += estimates[id_]
+    ensure(max(loads) - min(loads) <= max(estimates.values()), f"The shards loads <{loads}> differ by more than the longest test <{max(estimates.values())}>.")
+
+@group("Sharding", "Dynamic groups")
+def test_shard_dynamic_group_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that a test file whose group path isn't a literal is kept by every shard, its test being assigned by its runtime id."""
+    with tempfile.TemporaryDirectory() as root:
+        filename = os.path.join(root, "test_dynamic.py")
+        with open(filename, 'w') as file:
+            file.write(textwrap.dedent(DYNAMIC_SOURCE))
+        ((test,), func) = (collect_file(filename), import_file(filename).test_dynamic)
+        check(test["static"] == False,                              f"The test of group <{test['group']}> is collected as static.")
+        for count in range(1, 9):
+            shards = [Shard(index, count, balance_shards([{**test, "file": filename}], count, DurationEstimator({}))) for index in range(1, count+1)]
+            check(all(shard.has_file(filename) for shard in shards), f"The test file isn't kept by every of the {count} shards.")
+            owners = [shard.index for shard in shards if TestSelection(shard=shard).select_tests([func], filename)]
+            check(owners == [shards[0].get_shard(get_func_id(func, filename))], f"The test <{get_func_id(func, filename)}> runs in the shards <{owners}> out of {count}.")
+    ok()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
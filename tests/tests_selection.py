@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt selection expressions.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the selection expressions parsing. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.selection  import TestSelection, compile_expression, select_expressions
+from pyquicktools.pyquicktest.utils      import import_file
+import typing
+import os
+import tempfile
+import textwrap
+import itertools
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_selection.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Identifiers of the tested expressions, matched if they belong to the set of names given to the compiled predicate.
+IDENTIFIERS    = ("a", "b", "c", "d")
+
+# Expressions which must be rejected.
+INVALID        = ("", "a and", "or a", "not", "(a", "a)", "()", "a b", "a and or b", "(a or b))", "not (a and)")
+
+# Source code of a test file whose group path and markers of its first test are only known at runtime.
+DYNAMIC_SOURCE = """
+    from pyquicktools.pyquicktest.decorators import *
+
+    NAME = "dynamic"
+
+    @group(NAME.upper())
+    @add_flag(NAME + "_marker")
+    def test_dynamic():
+        pass
+
+    @group("Static")
+    def test_static():
+        pass
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def match_name(identifier: str, names: typing.Set[str]) -> bool:
+    """Match an identifier if it belongs to a given set of names."""
+    return identifier in names
+
+def gen_expression(depth: int = 3) -> str:
+    """Generate a random selection expression over IDENTIFIERS, which is also a valid python expression of the same meaning."""
+    if not depth or gen_int(max=3) == 0:
+        return IDENTIFIERS[gen_int(max=len(IDENTIFIERS)-1)]
+    kind = gen_int(max=3)
+    if kind == 0:
+        return f"not {gen_expression(depth-1)}"
+    if kind == 1:
+        return f"({gen_expression(depth-1)})"
+    return f"{gen_expression(depth-1)} {'and' if kind == 2 else 'or'} {gen_expression(depth-1)}"
+
+def get_assignments() -> typing.List[typing.Set[str]]:
+    """Get every sets of matched IDENTIFIERS."""
+    return [set(e) for length in range(len(IDENTIFIERS)+1) for e in itertools.combinations(IDENTIFIERS, length)]
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Selection expressions", "Precedence")
+def test_compile_expression_precedence_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that "and" binds tighter than "or", and "not" tighter than both."""
+    expressions = {
+        "a or b and c"     : lambda x: "a" in x or ("b" in x and "c" in x),
+        "a and b or c"     : lambda x: ("a" in x and "b" in x) or "c" in x,
+        "not a and b"      : lambda x: "a" not in x and "b" in x,
+        "not a or b"       : lambda x: "a" not in x or "b" in x,
+        "not not a"        : lambda x: "a" in x,
+        "a or b and not c" : lambda x: "a" in x or ("b" in x and "c" not in x),
+    }
+    for (expression, expected) in expressions.items():
+        predicate = compile_expression(expression, match_name)
+        for names in get_assignments():
+            check(predicate(names) == expected(names), f"The expression <{expression}> evaluated to <{predicate(names)}> for the matched names <{sorted(names)}>.")
+    ok()
+
+@group("Selection expressions", "Precedence")
+def test_compile_expression_parentheses_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the parentheses override the operators precedence, however nested."""
+    expressions = {
+        "(a or b) and c"             : lambda x: ("a" in x or "b" in x) and "c" in x,
+        "not (a or b)"               : lambda x: not ("a" in x or "b" in x),
+        "((a))"                      : lambda x: "a" in x,
+        "a and (b or (c and not d))" : lambda x: "a" in x and ("b" in x or ("c" in x and "d" not in x)),
+    }
+    for (expression, expected) in expressions.items():
+        predicate = compile_expression(expression, match_name)
+        for names in get_assignments():
+            check(predicate(names) == expected(names), f"The expression <{expression}> evaluated to <{predicate(names)}> for the matched names <{sorted(names)}>.")
+    ok()
+
+@group("Selection expressions", "Precedence")
+@execnbr(NBR_TESTS_EXEC)
+def test_compile_expression_random_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test random expressions against the python evaluation of the same expressions, which share the operators precedence."""
+    expression = gen_expression()
+    predicate  = compile_expression(expression, match_name)
+    for names in get_assignments():
+        expected = eval(expression, {identifier: identifier in names for identifier in IDENTIFIERS})
+        check(predicate(names) == expected, f"The expression <{expression}> evaluated to <{predicate(names)}> instead of <{expected}> for the matched names <{sorted(names)}>.")
+    ok()
+
+@group("Selection expressions", "Identifiers")
+def test_compile_expression_identifiers_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that every identifier is matched by the given function with the predicate argument, the whitespaces being ignored."""
+    calls     = []
+    predicate = compile_expression("  slow\tand(db_1 or not network.io ) ", lambda identifier, x: calls.append((identifier, x)) or identifier == "slow")
+    check(predicate("arg") == True,                          "The expression wasn't matched.")
+    ensure(calls == [("slow", "arg"), ("db_1", "arg"), ("network.io", "arg")], f"The identifiers were matched as <{calls}>.")
+
+@group("Selection expressions", "Errors")
+def test_compile_expression_invalid_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the invalid expressions raise a ValueError naming the expression."""
+    for expression in INVALID:
+        error = None
+        try:
+            compile_expression(expression, match_name)
+        except ValueError as e:
+            error = e
+        check(error is not None,                f"The invalid expression <{expression}> didn't raise a ValueError.")
+        check(f"<{expression}>" in str(error),  f"The error <{error}> doesn't name the invalid expression <{expression}>.")
+    ok()
+
+@group("Selection expressions", "Dynamic tests")
+def test_select_expressions_dynamic_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the keyword and marker expressions select the tests whose group path and markers aren't literals by their runtime values."""
+    with tempfile.TemporaryDirectory() as root:
+        filename = os.path.join(root, "test_dynamic.py")
+        with open(filename, 'w') as file:
+            file.write(textwrap.dedent(DYNAMIC_SOURCE))
+        funcs = [import_file(filename).test_dynamic, import_file(filename).test_static]
+        for (keyword, marker, expected) in (("DYNAMIC", None, ["test_dynamic"]), ("static", None, ["test_static"]), (None, "dynamic_marker", ["test_dynamic"])):
+            selection = TestSelection().match(keyword, marker, select_expressions(root, keyword=keyword, marker=marker))
+            check(selection.select_files([filename]) == [filename],  f"The test file isn't selected by <{keyword}> and <{marker}>.")
+            selected  = [func.__name__ for func in selection.select_tests(funcs, filename)]
+            check(selected == expected,                              f"The tests <{selected}> are selected by <{keyword}> and <{marker}> instead of <{expected}>.")
+    ok()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt test server.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the runs served by a test server.  |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.report     import load_report
+from pyquicktools.pyquicktest.server     import get_socket_path
+import typing
+import os
+import sys
+import time
+import signal
+import tempfile
+import textwrap
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_server.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Source code of a test file whose test records the parent of the process running it, and prints a NUL byte.
+SERVED_SOURCE  = """
+    from pyquicktools.pyquicktest.assertions import *
+    from pyquicktools.pyquicktest.decorators import *
+    import os
+
+    @test
+    def test_served():
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "ppid.log"), 'w') as file:
+            file.write(str(os.getppid()))
+        print("before\\0after")
+        ok()
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def wait_for(condition: typing.Callable[[], bool], duration: float = 30) -> bool:
+    """Wait for a given condition to be met for at most <duration> seconds, and return whether it is."""
+    deadline = time.monotonic() + duration
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+def run_client(root: str, *args: str) -> subprocess.CompletedProcess:
+    """Run the CLI with the given arguments in a given root directory, in its own process, i.e. as a client of its test server if any."""
+    return subprocess.run([sys.executable, "-m", "pyquicktools.cli", "test", *args], cwd=root, capture_output=True, timeout=120)
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Test server", "Served runs")
+def test_server_run_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the runs of a directory with a test server are executed by its forks, their whole output and exit code being relayed,
+       and that the server removes its socket once stopped."""
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(root, "test_served.py"), 'w') as file:
+            file.write(textwrap.dedent(SERVED_SOURCE))
+        server = subprocess.Popen([sys.executable, "-m", "pyquicktools.cli", "test", "--server"], cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            check(wait_for(lambda: os.path.exists(get_socket_path(root))),   "The test server never listened to its socket.")
+            served  = run_client(root, "-p", "test_served.py", "--jsonl", "report.jsonl")
+            invalid = run_client(root, "--shard", "0/4")
+            with open(os.path.join(root, "ppid.log")) as file:
+                ppid = int(file.read())
+            results = load_report(os.path.join(root, "report.jsonl"))[2]
+        finally:
+            server.send_signal(signal.SIGINT)
+            server.wait(timeout=30)
+        check(ppid == server.pid,                                            f"The test ran in a child of the process {ppid} instead of the server {server.pid}.")
+        check(served.returncode == 0 and b"before\0after" in served.stdout,  f"The served run exited with {served.returncode} and printed <{served.stdout!r}>.")
+        check([e["status"] for e in results] == ["passed"],                  f"The served run reported <{results}>.")
+        check(invalid.returncode == 2,                                       f"The invalid served run exited with {invalid.returncode} instead of 2.")
+        ensure(not os.path.exists(get_socket_path(root)),                    "The stopped test server left its socket behind.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
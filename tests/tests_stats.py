@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt latency histograms.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the iterations latency histograms. |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.stats      import LatencyHistogram, SUB_BUCKETS, PERCENTILES
+import typing
+import math
+import random
+import itertools
+import statistics
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_stats.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Maximum relative error of the approximated percentiles, i.e. the durations kept exact by the buckets.
+MAX_ERROR      = 1/SUB_BUCKETS
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def make_histogram(durations: typing.List[int], first: int = 0) -> LatencyHistogram:
+    """Make the histogram of the given iterations durations, marking their end timestamps as the iterations loops do."""
+    histogram = LatencyHistogram(first)
+    histogram.pending.extend(itertools.accumulate([gen_int(max=10**12)] + durations))
+    return histogram.flush()
+
+def get_percentile(durations: typing.List[int], q: float) -> int:
+    """Get the exact <q> percentile, in [0, 1], of the given durations, with the nearest-rank method used by the histograms."""
+    return sorted(durations)[max(1, math.ceil(q*len(durations)))-1]
+
+def gen_durations() -> typing.List[int]:
+    """Generate random durations spanning several orders of magnitude, with many repeated ones as for quick iterations."""
+    return [gen_int(min=1, max=10**gen_int(min=1, max=9)) for _ in range(gen_int(min=1, max=500))]
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Latency histograms", "Summary")
+@execnbr(NBR_TESTS_EXEC)
+def test_histogram_exact_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the number of iterations, the extrema, the mean, the standard deviation and the slowest iteration are exact."""
+    durations = gen_durations()
+    histogram = make_histogram(durations)
+    summary   = histogram.summary()
+    check(histogram.count == len(durations),                              f"The histogram counts {histogram.count} iterations instead of {len(durations)}.")
+    check(summary["min_ns"] == min(durations),                            f"The minimum is {summary['min_ns']} instead of {min(durations)}.")
+    check(summary["max_ns"] == max(durations),                            f"The maximum is {summary['max_ns']} instead of {max(durations)}.")
+    check(summary["mean_ns"] == sum(durations)//len(durations),           f"The mean is {summary['mean_ns']} instead of {sum(durations)//len(durations)}.")
+    check(abs(summary["stddev_ns"] - statistics.pstdev(durations)) <= 1,  f"The standard deviation is {summary['stddev_ns']} instead of {statistics.pstdev(durations)}.")
+    ensure(summary["slowest_iteration"] == durations.index(max(durations)), f"The slowest iteration is {summary['slowest_iteration']} instead of {durations.index(max(durations))}.")
+
+@group("Latency histograms", "Percentiles")
+def test_histogram_percentiles_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test the percentiles of a uniform distribution of the durations from 1 to 10000 nanoseconds."""
+    histogram = make_histogram(random.sample(range(1, 10001), 10000))
+    for (q, expected) in ((0.01, 100), (0.25, 2500), (0.5, 5000), (0.95, 9500), (0.99, 9900), (1.0, 10000)):
+        check(abs(histogram.percentile(q) - expected) <= MAX_ERROR*expected, f"The {q} percentile is {histogram.percentile(q)} instead of about {expected}.")
+    ok()
+
+@group("Latency histograms", "Percentiles")
+def test_histogram_percentiles_2() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the percentiles of the small durations, having their own buckets, are exact."""
+    durations = [duration for duration in range(2*SUB_BUCKETS) for _ in range(duration+1)]
+    histogram = make_histogram(durations)
+    for q in (0.1, 0.5, 0.9, 0.99):
+        check(histogram.percentile(q) == get_percentile(durations, q), f"The {q} percentile is {histogram.percentile(q)} instead of {get_percentile(durations, q)}.")
+    ok()
+
+@group("Latency histograms", "Percentiles")
+@execnbr(NBR_TESTS_EXEC)
+def test_histogram_percentiles_3() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the percentiles of random durations are within the relative error of the buckets."""
+    durations = gen_durations()
+    histogram = make_histogram(durations)
+    for q in [*PERCENTILES.values(), gen_int(max=100)/100]:
+        (approximated, exact) = (histogram.percentile(q), get_percentile(durations, q))
+        check(abs(approximated - exact) <= MAX_ERROR*exact, f"The {q} percentile is {approximated} instead of about {exact}.")
+    ok()
+
+@group("Latency histograms", "Merge")
+@execnbr(NBR_TESTS_EXEC)
+def test_histogram_merge_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that merging the histograms of consecutive iterations chunks gives the histogram of all the iterations."""
+    durations = gen_durations()
+    split     = gen_int(max=len(durations))
+    merged    = make_histogram(durations[:split]).merge(make_histogram(durations[split:], first=split))
+    whole     = make_histogram(durations)
+    for attribute in ("buckets", "count", "total", "squares", "min", "max", "slowest"):
+        check(getattr(merged, attribute) == getattr(whole, attribute), f"The merged histogram {attribute} is <{getattr(merged, attribute)}> instead of <{getattr(whole, attribute)}>.")
+    ensure(merged.summary() == whole.summary(), f"The merged summary <{merged.summary()}> isn't the summary <{whole.summary()}>.")
+
+@group("Latency histograms", "Merge")
+@execnbr(NBR_TESTS_EXEC)
+def test_histogram_add_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that adding the durations one by one in any order, as for the concurrent iterations, gives the histogram of the marked iterations,
+       the slowest iteration being any of the slowest ones."""
+    durations = gen_durations()
+    added     = LatencyHistogram()
+    for (i, duration) in random.sample(list(enumerate(durations)), len(durations)):
+        added.add(duration, i)
+    (summary, expected) = (added.summary(), make_histogram(durations).summary())
+    check(durations[summary.pop("slowest_iteration")] == max(durations),  "The slowest iteration isn't one of the slowest ones.")
+    expected.pop("slowest_iteration")
+    ensure(summary == expected,                                           f"The summary <{summary}> isn't the summary <{expected}>.")
+
+@group("Latency histograms", "Timing")
+def test_histogram_start_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that restarting the timing, i.e. after printing a failure, keeps the previous iteration duration and excludes the elapsed time."""
+    histogram = LatencyHistogram()
+    histogram.pending.extend([0, 10])
+    histogram.start()
+    histogram.pending.append(histogram.pending[-1] + 20)
+    summary   = histogram.summary()
+    check(histogram.count == 2,                                   f"The histogram counts {histogram.count} iterations instead of 2.")
+    ensure((summary["min_ns"], summary["max_ns"]) == (10, 20),    f"The iterations durations are in [{summary['min_ns']}, {summary['max_ns']}] instead of [10, 20].")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
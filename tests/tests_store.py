@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt tests results store.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the results store and --lf runs.   |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.report     import load_report
+from pyquicktools.pyquicktest.store      import ResultStore, STORE_FILE, STORE_BATCH, load_results, load_footprints, get_failed_ids
+from pyquicktools.pyquicktest.utils      import get_cache_dir
+import typing
+import os
+import sys
+import tempfile
+import textwrap
+import contextlib
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_store.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Source code of a test file with a passing and a failing test.
+SESSION_SOURCE = """
+    from pyquicktools.pyquicktest.assertions import *
+    from pyquicktools.pyquicktest.decorators import *
+
+    @test
+    def test_passing():
+        ok()
+
+    @test
+    def test_failing():
+        ensure(False, "test_failing failed")
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def gen_result(name: str) -> typing.Dict[str, typing.Any]:
+    """Generate the random result of a test of a given name, as recorded by the test sessions, with a random footprint."""
+    (iterations, passed) = (gen_int(min=1, max=100), gen_bool())
+    return {
+        "id": f"tests_store.py::{name}", "file": "tests_store.py", "status": "passed" if passed else "failed", "duration_ns": gen_int(max=10**12),
+        "iterations": iterations, "passed": iterations if passed else gen_int(max=iterations-1), "footprint": {f"src_{gen_int(max=5)}.py" for _ in range(gen_int(max=3))}
+    }
+
+def run_session(root: str, *args: str) -> typing.List[str]:
+    """Run a test session of the SESSION_SOURCE test file in a given root directory with the given CLI arguments, in its own process,
+       and return the names of the reported tests."""
+    with open(os.path.join(root, "test_session.py"), 'w') as file:
+        file.write(textwrap.dedent(SESSION_SOURCE))
+    subprocess.run(
+        [sys.executable, "-m", "pyquicktools.cli", "test", "--no-server", "-p", "test_session.py", "--jsonl", "report.jsonl", *args],
+        cwd=root, capture_output=True, text=True, timeout=120
+    )
+    return [result["name"] for result in load_report(os.path.join(root, "report.jsonl"))[2]]
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Results store", "Storage")
+@execnbr(NBR_TESTS_EXEC)
+def test_result_store_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the stored results and footprints, written by batches, load back as the last ones of every test."""
+    with tempfile.TemporaryDirectory() as root:
+        results = [gen_result(f"test_{gen_int(max=STORE_BATCH)}") for _ in range(gen_int(max=3*STORE_BATCH))]
+        with contextlib.closing(ResultStore(root)) as store:
+            for result in results:
+                store.test_result(result)
+        last = {result["id"]: result for result in results}
+        (loaded, footprints) = (load_results(root), load_footprints(root))
+        check(loaded == {id_: (e["status"], e["duration_ns"], e["iterations"]) for (id_, e) in last.items()},  f"The loaded results are <{loaded}>.")
+        check(footprints == {id_: e["footprint"] for (id_, e) in last.items() if e["footprint"]},              f"The loaded footprints are <{footprints}>.")
+        ensure(get_failed_ids(root) == {id_ for (id_, e) in last.items() if e["status"] == "failed"},         f"The failed tests are <{get_failed_ids(root)}>.")
+
+@group("Results store", "Storage")
+def test_result_store_unusable_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that an unusable results store is ignored, without failing the writing nor the loading of the results."""
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(get_cache_dir(root), STORE_FILE), 'w') as file:
+            file.write("This isn't a SQLite database.")
+        with contextlib.closing(ResultStore(root)) as store:
+            store.test_result(gen_result("test_1"))
+        check(store.connection is None,          "The unusable results store wasn't disabled.")
+        ensure(load_results(root) == {},         f"The unusable results store loaded the results <{load_results(root)}>.")
+
+@group("Results store", "Last failed")
+def test_last_failed_session_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that a --last-failed session only runs the tests that failed during the previous session, and a --failed-first one runs them first."""
+    with tempfile.TemporaryDirectory() as root:
+        (first, last_failed, failed_first) = (run_session(root), run_session(root, "--lf"), run_session(root, "--ff"))
+    check(sorted(first) == ["test_failing", "test_passing"],                "The first session didn't run every tests.")
+    check(last_failed == ["test_failing"],                                  f"The --last-failed session ran <{last_failed}>.")
+    ensure(failed_first == ["test_failing", "test_passing"],                f"The --failed-first session ran <{failed_first}>.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt test timeouts.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the process and thread timeouts.   |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+from pyquicktools.pyquicktest.report     import load_report
+from pyquicktools.pyquicktest.supervise  import SupervisedWorker, TimeoutThreadPool
+import typing
+import os
+import sys
+import time
+import tempfile
+import textwrap
+import threading
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_supervise.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Source code of a test file whose first tests never return, one in each timeout mode.
+TIMEOUT_SOURCE = """
+    from pyquicktools.pyquicktest.assertions import *
+    from pyquicktools.pyquicktest.decorators import *
+    import time
+
+    @test
+    @pqt_timeout(0.5)
+    def test_1_process():
+        time.sleep(60)
+
+    @test
+    @pqt_timeout(0.5, mode="thread")
+    def test_2_thread():
+        time.sleep(60)
+
+    @test
+    def test_3_after():
+        ok()
+"""
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def wait_for(condition: typing.Callable[[], bool], duration: float = 10) -> bool:
+    """Wait for a given condition to be met for at most <duration> seconds, and return whether it is."""
+    deadline = time.monotonic() + duration
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Timeouts", "Sessions")
+def test_timeout_session_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the timed out tests of both modes are reported as failed, and that the session goes on with the next tests."""
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(root, "test_timeout.py"), 'w') as file:
+            file.write(textwrap.dedent(TIMEOUT_SOURCE))
+        start   = time.monotonic()
+        process = subprocess.run(
+            [sys.executable, "-m", "pyquicktools.cli", "test", "--no-server", "-p", "test_timeout.py", "--jsonl", "report.jsonl"],
+            cwd=root, capture_output=True, text=True, timeout=120
+        )
+        elapsed = time.monotonic() - start
+        results = load_report(os.path.join(root, "report.jsonl"))[2]
+    statuses = {result["name"]: result["status"] for result in results}
+    expected = {"test_1_process": "failed", "test_2_thread": "failed", "test_3_after": "passed"}
+    check(statuses == expected,                                     f"The reported tests are <{statuses}> instead of <{expected}>: <{process.stdout}>.")
+    check(process.stdout.count("Timeout after 0.5 seconds") == 2,   f"The timeouts aren't printed: <{process.stdout}>.")
+    ensure(elapsed < 30,                                            f"The session took {elapsed:.1f}s, waiting for the timed out tests.")
+
+@group("Timeouts", "Process mode")
+def test_supervised_worker_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that a supervised worker is killed once a call times out, and replaced by a new worker process for the next call."""
+    with tempfile.TemporaryDirectory() as root:
+        stuck = os.path.join(root, "stuck")
+        open(stuck, 'w').close()
+        with SupervisedWorker(lambda: time.sleep(60) if os.path.exists(stuck) else TEST_PASSED) as worker:
+            error = None
+            try:
+                worker.call(0.2)
+            except TestTimeoutException as e:
+                error = e
+            check(error is not None,                         "The stuck call didn't raise a TestTimeoutException.")
+            check(worker.process is None,                    "The worker process of the stuck call is still running.")
+            os.remove(stuck)
+            check(worker.call(10) is TEST_PASSED,            "The call after the timeout didn't return the TEST_PASSED sentinel.")
+            ensure(worker.process.is_alive(),                "The worker process isn't kept alive for the next calls.")
+
+@group("Timeouts", "Thread mode")
+def test_timeout_threads_stuck_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the stuck calls are abandoned to their threads, which the pool replaces so the next calls run right away,
+       and that the abandoned threads rejoin the pool only while it isn't full once their calls return."""
+    (pool, release) = (TimeoutThreadPool(size=2), threading.Event())
+    for i in range(3):
+        error = None
+        try:
+            pool.call(release.wait, 0.05, f"stuck_{i}")
+        except TestTimeoutException as e:
+            error = e
+        check(error is not None,                                            f"The stuck call {i} didn't raise a TestTimeoutException.")
+    check(sorted(pool.get_abandoned()) == ["stuck_0", "stuck_1", "stuck_2"], f"The abandoned calls are <{pool.get_abandoned()}>.")
+    check(pool.call(lambda: 42, 5) == 42,                                   "The call after the stuck ones didn't return its result.")
+    release.set()
+    check(wait_for(lambda: not pool.get_abandoned()),                       f"The abandoned calls <{pool.get_abandoned()}> never returned.")
+    ensure(wait_for(lambda: pool.threads <= pool.size),                     f"The pool keeps {pool.threads} threads instead of at most {pool.size}.")
+
+@group("Timeouts", "Direct calls")
+def test_timeout_direct_call_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the timeout of a test is enforced when it is called directly, outside of the test runner."""
+    (release, error) = (threading.Event(), None)
+    try:
+        pqt_timeout(0.1, mode="thread")(release.wait)()
+    except TestTimeoutException as e:
+        error = e
+    release.set()
+    check(error is not None,                                         "The stuck direct call didn't raise a TestTimeoutException.")
+    ensure(pqt_timeout(5)(lambda x: 2*x)(21) == 42,                  "The direct call within its timeout didn't return its result.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 *-*
+
+
+""" ~*~ Docstring ~*~
+    Testing file for the pqt watch mode.
+                    ~*~ Docstring ~*~
+
+    ~*~ CHANGELOG ~*~
+     ____________________________________________________________________________________
+    | VERSION |    DATE    |                           CONTENT                           |
+    |====================================================================================|
+    |  0.0.1  | 2026/10/18 | Initial release, testing the re-runs of the watch mode.     |
+     ‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾‾
+                                                                         ~*~ CHANGELOG ~*~ """
+
+
+#=--------------=#
+# Import section #
+#=--------------=#
+
+from   __future__ import annotations
+from pyquicktools.pyquicktest.assertions import *
+from pyquicktools.pyquicktest.decorators import *
+from pyquicktools.pyquicktest.gen        import *
+from pyquicktools.pyquicktest.test       import *
+import typing
+import os
+import sys
+import time
+import signal
+import tempfile
+import textwrap
+import subprocess
+
+# =------------------------------= #
+
+
+#=------------------=#
+# Authorship section #
+#=------------------=#
+
+__filename__     = "tests_watch.py"
+
+# =--------------------------------------------------------= #
+
+
+#=------------------------------------=#
+# Constants & Global variables section #
+#=------------------------------------=#
+
+NBR_TESTS_EXEC = 100
+
+# Source code of the test files and module of a watched directory, every test recording its runs.
+WATCHED_FILES  = {
+    "helper.py": """
+        VALUE = 1
+    """,
+    "record.py": """
+        import os
+
+        def record(line):
+            with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "runs.log"), 'a') as file:
+                file.write(f"{line}\\n")
+    """,
+    "test_a.py": """
+        from pyquicktools.pyquicktest.assertions import *
+        from pyquicktools.pyquicktest.decorators import *
+        import helper
+        from record import record
+
+        @test
+        def test_a():
+            record(f"test_a {helper.VALUE}")
+            ok()
+    """,
+    "test_b.py": """
+        from pyquicktools.pyquicktest.assertions import *
+        from pyquicktools.pyquicktest.decorators import *
+        from record import record
+
+        @test
+        def test_b():
+            record("test_b")
+            ok()
+
+        @test
+        def test_skipped():
+            record("test_skipped")
+            ok()
+    """
+}
+
+# =----------------------------------= #
+
+
+#=-------------------------=#
+# Helpers functions section #
+#=-------------------------=#
+
+def write_file(root: str, relpath: str, source: str) -> None:
+    """Write a file of a given source code at a given path relative to a root directory, with a modification time always newer than the previous one."""
+    path = os.path.join(root, relpath)
+    with open(path, 'w') as file:
+        file.write(textwrap.dedent(source))
+    os.utime(path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+
+def read_runs(root: str) -> typing.List[str]:
+    """Read the recorded runs of the tests of a watched root directory (see WATCHED_FILES)."""
+    if not os.path.exists(os.path.join(root, "runs.log")):
+        return []
+    with open(os.path.join(root, "runs.log")) as file:
+        return file.read().splitlines()
+
+def count_watching(root: str) -> int:
+    """Count the times the watch mode of a given root directory waited for changes, i.e. its completed runs, from its output."""
+    with open(os.path.join(root, "watch.log"), 'rb') as file:
+        return file.read().count(b"for changes...")
+
+def wait_for(condition: typing.Callable[[], bool], duration: float = 30) -> bool:
+    """Wait for a given condition to be met for at most <duration> seconds, and return whether it is."""
+    deadline = time.monotonic() + duration
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return condition()
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+#=-----------------------=#
+# Tests functions section #
+#=-----------------------=#
+
+@group("Watch mode", "Re-runs")
+def test_watch_reruns_1() -> typing.Union[TestPassedException, TestFailedException]:
+    """Test that the watch mode only re-runs the test files importing a changed module and the new test files, with the new module values
+       and the keyword selection."""
+    with tempfile.TemporaryDirectory() as root:
+        for (relpath, source) in WATCHED_FILES.items():
+            write_file(root, relpath, source)
+        output  = open(os.path.join(root, "watch.log"), 'wb')
+        process = subprocess.Popen(
+            [sys.executable, "-m", "pyquicktools.cli", "test", "--no-server", "--watch", "-k", "not skipped"],
+            cwd=root, stdout=output, stderr=subprocess.STDOUT
+        )
+        try:
+            check(wait_for(lambda: sorted(read_runs(root)) == ["test_a 1", "test_b"]),  f"The first run recorded <{read_runs(root)}>.")
+            write_file(root, "helper.py", "VALUE = 2\n")
+            check(wait_for(lambda: "test_a 2" in read_runs(root)),                      f"The change of the module didn't re-run its test file: <{read_runs(root)}>.")
+            write_file(root, "test_c.py", WATCHED_FILES["test_b.py"].replace("test_b", "test_c"))
+            check(wait_for(lambda: "test_c" in read_runs(root)),                        f"The new test file didn't run: <{read_runs(root)}>.")
+            check(wait_for(lambda: count_watching(root) == 3),                          "The watch mode didn't wait for changes after its runs.")
+        finally:
+            process.send_signal(signal.SIGINT)
+            process.wait(timeout=30)
+            output.close()
+        runs = read_runs(root)
+    ensure(runs == ["test_a 1", "test_b", "test_a 2", "test_c"] or runs == ["test_b", "test_a 1", "test_a 2", "test_c"], f"The watch mode recorded the runs <{runs}>.")
+
+# =-----------------------------------------------------------------------------------------------------------------= #
+
+
+# Running the tests if the file is directly executed.
+if __name__ == '__main__':
+    test_file()